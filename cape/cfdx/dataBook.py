@@ -163,6 +163,8 @@ class DataBook(dict):
             List of force/moment components
         *DB.Targets*: :class:`dict`
             Dictionary of :class:`DBTarget` target data books
+        *DB.source*: {``"none"``} | ``"data"`` | ``"trajectory"``
+            How *DB.x* and the component data books were matched
     :Versions:
         * 2014-12-20 ``@ddalle``: Started
         * 2015-01-10 ``@ddalle``: Version 1.0
@@ -225,6 +227,8 @@ class DataBook(dict):
         # Save the options.
         self.opts = opts
         self.targ = targ
+        # Run matrix source; rows of *x* and components not yet matched
+        self.source = 'none'
         # Go to root if necessary
         if os.path.isabs(self.Dir):
             os.chdir("/")
@@ -2255,10 +2259,32 @@ class DataBook(dict):
         # Set the number of cases.
         self.x.nCase = DBc.n
 
+    # Reset the databook copy of the trajectory
+    def ResetRunMatrix(self):
+        r"""Reset the data book copy of the run matrix to the full one
+
+        This undoes :func:`UpdateRunMatrix` without rereading any
+        component data book files.
+
+        :Call:
+            >>> DB.ResetRunMatrix()
+        :Inputs:
+            *DB*: :class:`cape.cfdx.dataBook.DataBook`
+                Instance of the Cape data book class
+        :Versions:
+            * 2026-10-16 ``@agent``: Version 1.0
+        """
+        # Copy the run matrix from the control instance
+        self.x = self.cntl.x.Copy()
+
     # Restrict the data book object to points in the trajectory.
     def MatchRunMatrix(self):
         r"""Restrict the data book object to points in the trajectory
 
+        If all data book rows of every component match the run matrix
+        in order, the component data books are left untouched and
+        *DB.trimmed* is ``False``.
+
         :Call:
             >>> DB.MatchRunMatrix()
         :Inputs:
@@ -2266,6 +2292,7 @@ class DataBook(dict):
                 Instance of the Cape data book class
         :Versions:
             * 2015-05-28 ``@ddalle``: Version 1.0
+            * 2026-10-16 ``@agent``: Version 1.1; skip no-op restrictions
         """
         # Get the first component.
         DBc = self.GetRefComponent()
@@ -2285,6 +2312,15 @@ class DataBook(dict):
         for k in self.x.cols:
             # Restrict to trajectory points that were found.
             self.x[k] = self.x[k][I]
+        # Check if all data book rows were matched in order
+        self.trimmed = (J != list(range(DBc.n)))
+        # Other components may have different rows
+        if not self.trimmed:
+            self.trimmed = any(
+                self[comp].n != DBc.n for comp in self.Components)
+        # Nothing to do to data book components in that case
+        if not self.trimmed:
+            return
         # Loop through the databook components.
         for comp in self.Components:
             # Loop through fields.
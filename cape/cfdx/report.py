@@ -67,6 +67,12 @@ import shutil
 # Third-party modules
 import numpy as np
 
+# Faster JSON parser/serializer, if available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Specific imports from third-party modules
 from numpy import sqrt, sin, cos, tan, exp
 
@@ -79,6 +85,56 @@ from .bin import pvpython
 from cape.filecntl.tecplot import ExportLayout, Tecscript
 import cape.plt as plt
 
+
+# Parse JSON text
+def _loads_json(txt):
+    r"""Parse JSON contents, using :mod:`orjson` if available
+
+    :Call:
+        >>> rc = _loads_json(txt)
+    :Inputs:
+        *txt*: :class:`bytes` | :class:`str`
+            Contents of a JSON file
+    :Outputs:
+        *rc*: :class:`dict`
+            Parsed contents
+    """
+    # Check for C parser
+    if orjson is None:
+        return json.loads(txt)
+    else:
+        return orjson.loads(txt)
+
+
+# Serialize JSON text
+def _dumps_json(rc):
+    r"""Serialize to JSON, using :mod:`orjson` if available
+
+    The standard :mod:`json` module writes the same one-space indent as
+    before.  :mod:`orjson` only supports a two-space indent, so its
+    output differs in whitespace but has the same contents.
+
+    :Call:
+        >>> txt = _dumps_json(rc)
+    :Inputs:
+        *rc*: :class:`dict`
+            Dictionary to serialize
+    :Outputs:
+        *txt*: :class:`bytes`
+            UTF-8 encoded JSON text
+    """
+    # Check for C serializer
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                rc, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Fall back to standard library (e.g. non-str keys)
+            pass
+    # Standard library serializer
+    return json.dumps(rc, indent=1).encode("utf-8")
+
+
 # Class to interface with report generation and updating.
 class Report(object):
     """Interface for automated report generation
@@ -138,6 +194,19 @@ class Report(object):
         # Initialize a dictionary of handles to case LaTeX files
         self.sweeps = {}
         self.cases = {}
+        # Cached check for case figures
+        self._has_case_figs = None
+        # Archive option (constant during report generation)
+        self._report_archive = bool(cntl.opts.get_ReportArchive())
+        # Folders already entered (and unarchived) during this session
+        self._dir_cache = set()
+        # Folder change functions based on (up, archive)
+        self._cd_table = {
+            (False, False): self._cd_in,
+            (False, True): self._cd_in,
+            (True, False): self._cd_up,
+            (True, True): self._cd_up_archive,
+        }
         # Read the file if applicable
         self.OpenMain()
         # Return
@@ -182,7 +251,8 @@ class Report(object):
     def cd(self, fdir):
         """Interface to :func:`os.chdir`, respecting "Archive" option
 
-        This function can only change one directory at a time.
+        Paths with several levels, e.g. ``"../.."`` or ``"grp/case"``,
+        are processed one folder at a time.
 
         :Call:
             >>> R.cd(fdir)
@@ -193,21 +263,87 @@ class Report(object):
                 Name of directory to change to
         :Versions:
             * 2015-03-08 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Multiple levels at once
         """
-        # Get archive option.
-        q = self.cntl.opts.get_ReportArchive()
-        # Check direction.
-        if fdir.startswith('..'):
-            # Check archive option.
-            if q:
-                # Tar and clean up if necessary.
-                tar.chdir_up()
-            else:
-                # Go up a folder.
-                os.chdir('..')
+        # Archive option
+        q = self._report_archive
+        # Check for single level (most common)
+        if '/' not in fdir and os.sep not in fdir:
+            # Look up function based on direction and archive option
+            self._cd_table[fdir.startswith('..'), q](fdir)
+            return
+        # Start from root for absolute paths
+        if os.path.isabs(fdir):
+            os.chdir(os.sep)
+        # Loop through levels
+        for fpart in fdir.replace(os.sep, '/').split('/'):
+            # Skip trivial levels
+            if fpart in ('', '.'):
+                continue
+            # Change one level
+            self._cd_table[fpart == '..', q](fpart)
+
+    # Go into a folder, unarchiving if necessary
+    def _cd_in(self, fdir):
+        """Go into a folder, unarchiving it if not already done
+
+        :Call:
+            >>> R._cd_in(fdir)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fdir*: :class:`str`
+                Name of directory to change to
+        :Versions:
+            * 2026-10-16 ``@agent``: Version 1.0; split from :func:`cd`
+        """
+        # Absolute path to target
+        fabs = os.path.abspath(fdir)
+        # Check if already unarchived during this session
+        if fabs in self._dir_cache:
+            # Already up-to-date
+            os.chdir(fdir)
         else:
             # Untar if necessary
             tar.chdir_in(fdir)
+            # Save it
+            self._dir_cache.add(fabs)
+
+    # Go up a folder
+    def _cd_up(self, fdir='..'):
+        """Go up one folder without archiving
+
+        :Call:
+            >>> R._cd_up(fdir='..')
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fdir*: {``".."``} | :class:`str`
+                Name of directory to change to (not used)
+        :Versions:
+            * 2026-10-16 ``@agent``: Version 1.0; split from :func:`cd`
+        """
+        # Go up a folder.
+        os.chdir('..')
+
+    # Go up a folder, archiving the current one
+    def _cd_up_archive(self, fdir='..'):
+        """Go up one folder, archiving and deleting the current one
+
+        :Call:
+            >>> R._cd_up_archive(fdir='..')
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fdir*: {``".."``} | :class:`str`
+                Name of directory to change to (not used)
+        :Versions:
+            * 2026-10-16 ``@agent``: Version 1.0; split from :func:`cd`
+        """
+        # Folder is about to be archived and deleted
+        self._dir_cache.discard(os.getcwd())
+        # Tar and clean up if necessary.
+        tar.chdir_up()
   # >
 
   # ===========
@@ -606,12 +742,20 @@ class Report(object):
         :Versions:
             * 2015-06-03 ``@ddalle``: First version
         """
-        # Get the three sets of lists.
-        cfigs = self.cntl.opts.get_ReportFigList(self.rep)
-        efigs = self.cntl.opts.get_ReportErrorFigList(self.rep)
-        zfigs = self.cntl.opts.get_ReportZeroFigList(self.rep)
-        # Check if any of them have nozero length.
-        return (len(cfigs)>0) or (len(efigs)>0) or (len(zfigs)>0)
+        # Check for previous result
+        if self._has_case_figs is not None:
+            return self._has_case_figs
+        # Options interface
+        opts = self.cntl.opts
+        # Check the three sets of lists, stopping at first nonempty one
+        q = (
+            bool(opts.get_ReportFigList(self.rep)) or
+            bool(opts.get_ReportErrorFigList(self.rep)) or
+            bool(opts.get_ReportZeroFigList(self.rep)))
+        # Save it
+        self._has_case_figs = q
+        # Output
+        return q
 
     # Function to update sweeps
     def UpdateSweeps(self, I=None, cons=[], **kw):
@@ -1498,7 +1642,7 @@ class Report(object):
         # Check for use of constraints instead of direct list.
         I = self.cntl.x.GetIndices(cons=cons, I=I)
         # Check for folder archiving
-        if self.cntl.opts.get_ReportArchive():
+        if self._report_archive:
             # Loop through folders.
             for frun in self.cntl.x.GetFullFolderNames(I):
                 # Check for the folder (has trouble if a case is repeated)
@@ -1527,23 +1671,22 @@ class Report(object):
             * 2015-05-29 ``@ddalle``: First version
         """
         # Check for folder archiving
-        if not self.cntl.opts.get_ReportArchive(): return
+        if not self._report_archive: return
         # Get sweep list
         fswps = self.opts.get('Sweeps', [])
         # Check type.
         if type(fswps).__name__ not in ['list', 'ndarray']: fswps = [fswps]
         # Loop through the sweeps.
         for fswp in fswps:
-            # Check if only restricting to point currently in the trajectory.
-            if self.cntl.opts.get_SweepOpt(fswp, 'RunMatrixOnly'):
-                # Read the data book with the trajectory as the source.
-                self.ReadDataBook("trajectory")
-            else:
-                # Read the data book with the data book as the source.
-                self.ReadDataBook("data")
+            # Sweep folder
+            fdir = 'sweep-%s' % fswp
+            # Nothing to clean if sweep was never created
+            if not os.path.isdir(fdir):
+                continue
             # Go to the sweep folder.
-            os.chdir('sweep-%s' % fswp)
-            # Get the sweeps themselves (i.e. lists of indices)
+            os.chdir(fdir)
+            # Get the sweeps themselves (also reads data book w/ the
+            # appropriate source)
             J = self.GetSweepIndices(fswp, I, cons)
             # Loop through the subsweeps.
             for j in J:
@@ -2488,46 +2631,48 @@ class Report(object):
                         # Use a copy to avoid changing cntl.opts
                         topts = dict(topts)
                         # Component to use for current MRP
-                        compID = self.cntl.opts.get_DataBookCompID(comp)
+                        compID = opts.get_DataBookCompID(comp)
                         if isinstance(compID, list):
                             compID = compID[0]
                         # Reset points for default *FromMRP*
-                        self.cntl.opts.reset_Points()
+                        opts.reset_Points()
                         # Use MRP prior to transfformations as default *FromMRP*
-                        x0 = self.cntl.opts.get_RefPoint(comp)
+                        x0 = opts.get_RefPoint(comp)
                         # Ensure points are calculated
                         self.cntl.PreparePoints(i)
                         # Use post-transformation MRP as default *ToMRP*
-                        x1 = self.cntl.opts.get_RefPoint(comp)
+                        x1 = opts.get_RefPoint(comp)
                         # Get current Lref
-                        Lref = self.cntl.opts.get_RefLength(comp)
+                        Lref = opts.get_RefLength(comp)
                         # Set those as defaults in transformation
                         x0 = topts.setdefault("FromMRP", x0)
                         x1 = topts.setdefault("ToMRP", x1)
                         topts.setdefault("RefLength", Lref)
                         # Expand if *x0* is a string
-                        topts["FromMRP"] = self.cntl.opts.expand_Point(x0)
-                        topts["ToMRP"] = self.cntl.opts.expand_Point(x1)
+                        topts["FromMRP"] = opts.expand_Point(x0)
+                        topts["ToMRP"] = opts.expand_Point(x1)
                     # Apply the transformation
                     FM.TransformFM(topts, self.cntl.x, i)
                 # Get the statistics.
                 S[comp] = FM.GetStats(nStats=nStats, nMax=nMax, nLast=nCur)
         # Go back to original folder.
         os.chdir(fpwd)
+        # Statistics for each component in column order
+        S_rows = [S.get(comp) for comp in comps]
         # Get the vertical alignment.
-        hv = self.cntl.opts.get_SubfigOpt(sfig, 'Position')
+        hv = opts.get_SubfigOpt(sfig, 'Position')
         # Get subfigure width
-        wsfig = self.cntl.opts.get_SubfigOpt(sfig, 'Width')
+        wsfig = opts.get_SubfigOpt(sfig, 'Width')
         # First line.
         lines = ['\\begin{subfigure}[%s]{%.2f\\textwidth}\n' % (hv, wsfig)]
         # Check for a header.
-        fhdr = self.cntl.opts.get_SubfigOpt(sfig, 'Header')
+        fhdr = opts.get_SubfigOpt(sfig, 'Header')
         # Add the iteration number to header
         line = '\\textbf{\\textit{%s}} (Iteration %i' % (fhdr, nCur)
         # Add number of iterations used for statistics
         if len(S)>0:
             # Add stats count.
-            line += (', {\\small\\texttt{nStats=%i}}' % S[comps[0]]['nStats'])
+            line += (', {\\small\\texttt{nStats=%i}}' % S_rows[0]['nStats'])
         # Close parentheses
         line += ')\\par\n'
         # Write the header.
@@ -2538,12 +2683,12 @@ class Report(object):
         # Write headers.
         lines.append('\\hline \\hline\n')
         lines.append('\\textbf{\\textsf{Coefficient}}\n')
-        for comp in comps:
-            lines.append(' & {\\small\\texttt{%s}} \n'
-                % comp.replace('_', '\_'))
+        lines.append(''.join([
+            ' & {\\small\\texttt{%s}} \n' % comp.replace('_', '\_')
+            for comp in comps]))
         lines.append('\\\\\n')
         # Loop through coefficients
-        for c in self.cntl.opts.get_SubfigOpt(sfig, "Coefficients"):
+        for c in opts.get_SubfigOpt(sfig, "Coefficients"):
             # Convert coefficient title to symbol
             if c in ['CA', 'CY', 'CN']:
                 # Just add underscore
@@ -2560,52 +2705,52 @@ class Report(object):
             # Print horizontal line
             lines.append('\\hline\n')
             # Loop through statistical varieties.
-            for fs in self.cntl.opts.get_SubfigOpt(sfig, c):
+            for fs in opts.get_SubfigOpt(sfig, c):
                 # Write the description
                 if fs == 'mu':
                     # Mean
                     lines.append('\\textit{%s} mean, $\\mu(%s)$\n' % (c, fc))
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'MuFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'MuFormat')
                 elif fs == 'std':
                     # Standard deviation
                     lines.append(
                         '\\textit{%s} standard deviation, $\\sigma(%s)$\n'
                         % (c, fc))
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'SigmaFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'SigmaFormat')
                 elif fs == 'err':
                     # Uncertainty
                     lines.append('\\textit{%s} iterative uncertainty, ' % c
                         + '$\\varepsilon(%s)$\n' % fc)
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'EpsFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'EpsFormat')
                 elif fs == 'min':
                     # Min value
                     lines.append(
                         '\\textit{%s} minimum, $\\min(%s)$\n' % (c, fc))
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'MuFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'MuFormat')
                 elif fs == 'max':
                     # Min value
                     lines.append(
                         '\\textit{%s} maximum, $\\max(%s)$\n' % (c, fc))
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'MuFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'MuFormat')
                 elif fs == "t":
                     # Target value
                     lines.append(
                         '\\textit{%s} target, $t(%s)$\n' % (c, fc))
                     # Format
-                    ff = self.cntl.opts.get_SubfigOpt(sfig, 'MuFormat')
+                    ff = opts.get_SubfigOpt(sfig, 'MuFormat')
                 # Downselect format flag specific to *c* if appropriate
                 if type(ff).__name__ == 'dict':
                     # Check for coefficient
                     if c in ff: ff = ff[c]
-                # Initialize line
-                line = ''
+                # Initialize cells of this row
+                cells = []
                 # Loop through components.
-                for comp in comps:
+                for comp, Sc in zip(comps, S_rows):
                     # Downselect format flag to *comp* if appropriate
                     if type(ff).__name__ == 'dict':
                         # Select component
@@ -2614,30 +2759,29 @@ class Report(object):
                         # Use non-dictionary value
                         ffc = ff
                     # Check for iterations.
-                    if nCur <= 0 or comp not in S:
+                    if nCur <= 0 or Sc is None:
                         # No iterations
-                        word = '& $-$ '
+                        word = '$-$'
                     elif fs == 'mu':
                         # Process value.
-                        word = (('& $%s$ ' % ffc) % S[comp][c])
-                    elif (fs in ['min', 'max']) or (S[comp]['nStats'] > 1):
+                        word = (('$%s$' % ffc) % Sc[c])
+                    elif (fs in ['min', 'max']) or (Sc['nStats'] > 1):
+                        # Get min/max or statistical value
+                        v = Sc.get(c + '_' + fs)
                         # Present?
-                        if (c+'_'+fs) in S[comp]:
+                        if v is not None:
                             # Process min/max or statistical value
-                            word = (('& $%s$ ' % ffc) % S[comp][c+'_'+fs])
+                            word = (('$%s$' % ffc) % v)
                         else:
                             # Missing
-                            word = '& $-$ '
+                            word = '$-$'
                     else:
                         # No statistics
-                        word = '& $-$ '
+                        word = '$-$'
                     # Process exponential notation
-                    word = self.WriteScientific(word)
-                    # Add this value to the line
-                    line += word
-                # Finish the line and append it.
-                line += '\\\\\n'
-                lines.append(line)
+                    cells.append(self.WriteScientific(word))
+                # Join the cells into one line and append it.
+                lines.append('& ' + ' & '.join(cells) + ' \\\\\n')
         # Finish table and subfigure
         lines.append('\\hline \\hline\n')
         lines.append('\\end{tabular}\n')
@@ -4291,15 +4435,13 @@ class Report(object):
         fcpt = opts.get_SubfigOpt(sfig, "Caption")
         # First lines.
         lines = self.SubfigInit(sfig)
-        # Check for image update
-        if not q:
-            # File name to check for
-            fpdf = '%s.pdf' % sfig
-            # Check for the file
-            if os.path.isfile(fpdf):
-                # Include the graphics.
-                lines.append('\\includegraphics[width=\\textwidth]{%s/%s}\n'
-                    % (frun, fpdf))
+        # File name to check for
+        fpdf = '%s.pdf' % sfig
+        # Reuse existing image if up-to-date (else regenerate it)
+        if not q and os.path.isfile(fpdf):
+            # Include the graphics.
+            lines.append('\\includegraphics[width=\\textwidth]{%s/%s}\n'
+                % (frun, fpdf))
             # Set the caption.
             lines.append('\\caption*{\\scriptsize %s}\n' % fcpt)
             # Close the subfigure.
@@ -4367,18 +4509,13 @@ class Report(object):
                 dpi = opts.get_SubfigOpt(sfig, "DPI")
                 # Figure name
                 fimg = '%s.%s' % (sfig, fmt)
-                fpdf = '%s.pdf' % sfig
+                # Only raster formats need a resolution
+                fmt = fmt.lower()
+                kw_save = {} if fmt in ('pdf', 'svg') else {"dpi": dpi}
                 # Save the figure.
-                if fmt.lower() in ['pdf']:
-                    # Save as vector-based image.
-                    h['fig'].savefig(fimg)
-                elif fmt.lower() in ['svg']:
-                    # Save as PDF and SVG
-                    h['fig'].savefig(fimg)
-                    h['fig'].savefig(fpdf)
-                else:
-                    # Save with resolution.
-                    h['fig'].savefig(fimg, dpi=dpi)
+                h['fig'].savefig(fimg, **kw_save)
+                # Save PDF version, too, if needed
+                if fmt != 'pdf':
                     h['fig'].savefig(fpdf)
                 # Close the figure.
                 h['fig'].clf()
@@ -5219,45 +5356,52 @@ class Report(object):
                 Data book trajectory source
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Use source reported by data book
         """
         # Check if there's a data book at all.
-        try:
-            # Reference the data book
-            self.cntl.DataBook
-            # Set source to "data"
-            try:
-                # Check data book source
-                self.cntl.DataBook.source
-            except Exception:
-                # Set source to none.
-                self.cntl.DataBook.source = 'none'
-        except Exception:
+        if not hasattr(self.cntl, "DataBook"):
             # Read the data book.
             self.cntl.ReadDataBook()
-            # Set the source to "inconsistent".
-            self.cntl.DataBook.source = 'none'
+        # Handle to data book
+        DB = self.cntl.DataBook
+        # Ensure a source is marked
+        if not hasattr(DB, "source"):
+            DB.source = 'none'
         # Check the existing source.
-        if fsrc == self.cntl.DataBook.source:
+        if fsrc == DB.source:
             # Everything is good.
             return
-        elif self.cntl.DataBook.source != 'none':
-            # Delete the data book.
+        elif DB.source == "data":
+            # Only the run matrix copy was changed; reset it in place
+            DB.ResetRunMatrix()
+            # Set the source to "inconsistent".
+            DB.source = 'none'
+        elif not getattr(DB, "trimmed", True):
+            # Matching didn't remove any rows; nothing to reset
+            DB.source = 'none'
+        elif DB.source != 'none':
+            # Rows were removed from data book; delete it
             del self.cntl.DataBook
             # Reread
             self.cntl.ReadDataBook()
-            # Set the source to "inconsistent".
-            self.cntl.DataBook.source = 'none'
+            DB = self.cntl.DataBook
+            # Ensure a source is marked
+            if not hasattr(DB, "source"):
+                DB.source = 'none'
+            # Check if freshly read data book is already consistent
+            if fsrc == DB.source:
+                return
         # Check the requested source.
         if fsrc == "trajectory":
             # Match the data book to the trajectory
-            self.cntl.DataBook.MatchRunMatrix()
+            DB.MatchRunMatrix()
             # Save the data book source.
-            self.cntl.DataBook.source = "trajectory"
+            DB.source = "trajectory"
         else:
             # Match the trajectory to the data book.
-            self.cntl.DataBook.UpdateRunMatrix()
+            DB.UpdateRunMatrix()
             # Save the data book source.
-            self.cntl.DataBook.source = "data"
+            DB.source = "data"
 
     # Read a TriqFM data book
     def ReadTriqFM(self, comp, fsrc="data", targ=None):
@@ -5499,24 +5643,23 @@ class Report(object):
         :Versions:
             * 2016-10-25 ``@ddalle``: First version
         """
-        # Check for the file
-        if not os.path.isfile('report.json'):
+        # Open the file, if any
+        try:
+            with open('report.json', 'rb') as f:
+                txt = f.read()
+        except IOError:
             # Default output
             return {
                 "Status": {},
                 "Subfigures": {}
             }
-        # Open the file
-        f = open('report.json')
         # Read the settings.
         try:
-            # Read from file
-            rc = json.load(f)
+            # Parse file contents
+            rc = _loads_json(txt)
         except Exception:
             # No settings read
             rc = {}
-        # Close the file.
-        f.close()
         # Ensure the existence of main sections
         rc.setdefault("Status", {})
         rc.setdefault("Subfigures", {})
@@ -5537,12 +5680,9 @@ class Report(object):
         :Versions:
             * 2016-10-25 ``@ddalle``: First version
         """
-        # Open the file
-        f = open('report.json', 'w')
-        # Write the contents.
-        json.dump(rc, f, indent=1)
-        # Close the file.
-        f.close()
+        # Open the file and write the contents
+        with open('report.json', 'wb') as f:
+            f.write(_dumps_json(rc))
   # >
 
   # =============
@@ -5584,18 +5724,20 @@ class Report(object):
             # Read the data book with the data book as the source
             fsrc = "data"
             self.ReadDataBook(fsrc)
+        # Data book handle
+        DB = self.cntl.DataBook
         # Get component
         if comp is None:
             # Extract from global data book
-            x = self.cntl.DataBook.x
+            x = DB.x
         elif opts.get_DataBookType(comp) in ["TriqFM"]:
             # Read the TriqFM data book
             self.ReadTriqFM(comp, fsrc)
             # Use that DataBook
-            x = self.cntl.DataBook.TriqFM[comp].x
+            x = DB.TriqFM[comp].x
         else:
             # Component given, but still use global *x*
-            x = self.cntl.DataBook.x
+            x = DB.x
         # Do not restrict indexes if using *data*
         if fsrc == "data":
             I = np.arange(x.nCase)
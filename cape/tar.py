@@ -12,7 +12,8 @@ The primary functions and their actions are:
     * :func:`chdir_up`: Leave a folder, archive it, and delete the folder
         * Starting from folder called ``thisdir/``
         * ``cd ..``
-        * ``tar -uf thisdir.tar thisdir``
+        * ``tar -uf thisdir.tar thisdir``, or ``tar -cf`` if
+          :func:`chdir_in` extracted ``thisdir.tar``
         * ``rm -r thisdir/``
         
     * :func:`chdir_in`: Go into a folder that may be archived
@@ -29,6 +30,10 @@ import tarfile
 import subprocess as sp
 
 
+# Archives extracted by :func:`chdir_in` (absolute paths)
+_EXTRACTED = set()
+
+
 # Simple function to untar a folder
 def untar(ftar):
     """Untar an archive
@@ -93,6 +98,30 @@ def tar(ftar, *a):
     tar.close()
 
 
+# Move a file, overwriting any existing target
+def _replace(fsrc, fdst):
+    """Rename a file, replacing *fdst* if it exists
+
+    :Call:
+        >>> _replace(fsrc, fdst)
+    :Inputs:
+        *fsrc*: :class:`str`
+            Name of file to move
+        *fdst*: :class:`str`
+            Name of target file
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for atomic replace (Python 3.3+)
+    if hasattr(os, "replace"):
+        os.replace(fsrc, fdst)
+        return
+    # Remove target first on Windows and Python 2
+    if os.path.isfile(fdst):
+        os.remove(fdst)
+    os.rename(fsrc, fdst)
+
+
 # Function to leave a folder and archive it.
 def chdir_up():
     """Leave a folder, archive it, and delete the folder
@@ -101,6 +130,7 @@ def chdir_up():
         >>> tar.chdir_up()
     :Versions:
         * 2015-03-07 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Rewrite archive if extracted
     """
     # Get the current folder
     fpwd = os.path.split(os.getcwd())[-1]
@@ -108,8 +138,23 @@ def chdir_up():
     os.chdir('..')
     # Name of the file
     ftar = fpwd + '.tar'
-    # Update or create the archive
-    ierr = tar(ftar, fpwd)
+    # Check if this folder was extracted from *ftar* by chdir_in()
+    fabs = os.path.abspath(ftar)
+    if fabs not in _EXTRACTED:
+        # Folder may not have all files of archive; update it
+        tar(ftar, fpwd)
+    else:
+        # Folder has all contents of the archive, so write a fresh one
+        # instead of appending another copy of every file
+        _EXTRACTED.discard(fabs)
+        ftmp = ftar + '.tmp'
+        # Remove any partial archive from an earlier attempt
+        if os.path.isfile(ftmp):
+            os.remove(ftmp)
+        # Create the archive
+        tar(ftmp, fpwd)
+        # Replace the old archive
+        _replace(ftmp, ftar)
     # Delete the folder
     shutil.rmtree(fpwd)
 
@@ -125,6 +170,7 @@ def chdir_in(fdir):
             Name of folder
     :Versions:
         * 2015-03-07 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Remember extracted archives
     """
     # Name of the archive.
     ftar = fdir + '.tar'
@@ -136,9 +182,11 @@ def chdir_in(fdir):
             if os.path.getmtime(fdir) < os.path.getmtime(ftar):
                 # Folder needs updating
                 untar(ftar)
+                _EXTRACTED.add(os.path.abspath(ftar))
         else:
             # No folder
             untar(ftar)
+            _EXTRACTED.add(os.path.abspath(ftar))
     # Go into the folder
     os.chdir(fdir)
 
@@ -418,6 +418,9 @@ class KwargHandler(dict):
     # Global options mapped to subcategory options
     _kw_submap = {}
 
+    # Preprocessed *_kw_submap* entries, built once per class and option
+    _kw_submap_split = {}
+
    # --- Conflicting Options ---
     # Aliases to merge for subcategory options
     _kw_subalias = {}
@@ -447,9 +450,12 @@ class KwargHandler(dict):
 
         :Versions:
             * 2019-12-19 ``@ddalle``: First version (plot_mpl.MPLOpts)
+            * 2026-10-16 ``@agent``: Add *_section_cache*
         """
         # Get class
         cls = self.__class__
+        # Processed sections, discarded whenever an option changes
+        self._section_cache = {}
         # Initialize an unfiltered dict
         if isinstance(_optsdict, dict):
             # Initialize with dictionary
@@ -512,6 +518,80 @@ class KwargHandler(dict):
   # Change Settings
   # ==================
   # <
+   # --- Cache Control ---
+    # Discard processed sections
+    def _reset_section_cache(self):
+        r"""Discard results saved by :func:`section_options`
+
+        A new :class:`dict` is created instead of clearing the old one
+        so that shallow copies of *opts* do not share saved sections.
+
+        This is called by every :class:`dict` method that changes
+        *opts*, but not when a nested :class:`dict` value is changed in
+        place.  Use :func:`set_option` or :func:`update` to change
+        such options instead of modifying them in place.
+
+        :Call:
+            >>> opts._reset_section_cache()
+        :Inputs:
+            *opts*: :class:`KwargHandler`
+                Options interface
+        :Versions:
+            * 2026-10-16 ``@agent``: First version
+        """
+        self.__dict__["_section_cache"] = {}
+
+    # Set item and discard processed sections
+    def __setitem__(self, k, v):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        dict.__setitem__(self, k, v)
+
+    # Delete item and discard processed sections
+    def __delitem__(self, k):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        dict.__delitem__(self, k)
+
+    # Remove item and discard processed sections
+    def pop(self, k, *a):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        return dict.pop(self, k, *a)
+
+    # Remove any item and discard processed sections
+    def popitem(self):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        return dict.popitem(self)
+
+    # Set default and discard processed sections
+    def setdefault(self, k, v=None):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        return dict.setdefault(self, k, v)
+
+    # Remove all items and discard processed sections
+    def clear(self):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method
+        dict.clear(self)
+
+    # Merge with ``|=`` and discard processed sections
+    def __ior__(self, other):
+        # Discard processed sections
+        self._reset_section_cache()
+        # Apply :class:`dict` method (not in Python 2 or before 3.9)
+        dict.update(self, other)
+        # Output
+        return self
+
    # --- Set ---
     # Set an option, with checks
     def set_option(self, opt, val):
@@ -699,9 +779,12 @@ class KwargHandler(dict):
                 Additional options added to *opts*, with checks
         :Versions:
             * 2020-01-24 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Discard processed sections
         """
         # Get class
         cls = self.__class__
+        # Options may be melded in place below
+        self._reset_section_cache()
         # Warning mode
         warnmode = kw.pop("_warnmode", self._warnmode)
         # Remove anything that's ``None``
@@ -870,6 +953,7 @@ class KwargHandler(dict):
                 additional processing from *opts._kw_submap*, and others
         :Versions:
             * 2020-01-17 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Use preprocessed *_kw_submap*
         """
         # Class
         cls = self.__class__
@@ -892,22 +976,12 @@ class KwargHandler(dict):
         if parents is None:
             # This option becomes the parent for later cals
             parents = set()
-        # Get dictionary of options to inherit from
-        kw_submap = cls._kw_submap.get(opt, {})
+        # Get simple and cascading options to inherit from
+        kw_direct, kw_dotted = cls._get_kw_submap_split(opt)
         # Loop through primary submap options
-        for (fromopt, subopt) in kw_submap.items():
-            # Check for "."
-            ndot = fromopt.count(".")
-            # Filter "."
-            if ndot == 0:
-                # Direct access simple option
-                subval = self.get_option(fromopt, parents=parents)
-            elif ndot == 1:
-                # Process later (to set priority)
-                continue
-            else:
-                # Not recursing on dicts of dicts or something
-                raise ValueError("Cannot process option '%s'" % fromopt)
+        for (fromopt, subopt) in kw_direct:
+            # Direct access simple option
+            subval = self.get_option(fromopt, parents=parents)
             # One more check for ``None``
             if subval is not None:
                 # Don't override
@@ -915,40 +989,31 @@ class KwargHandler(dict):
         # Store cascading option parents to avoid multiple access
         kw_cascade = {}
         # Loop through cascade options
-        for (fromopt, subopt) in kw_submap.items():
-            # Check for "."
-            ndot = fromopt.count(".")
-            # Filter "."
-            if ndot == 0:
-                # Previously accessed
+        for (fromopt, k0, k1, subopt) in kw_dotted:
+            # Check for recursion
+            if k0 in parents:
+                raise ValueError(
+                    ("Detected recursion while accessing '%s' " % opt) +
+                    ("with parents %s" % parents))
+            # Get dictionary of options
+            if k0 in kw_cascade:
+                # Previously calculated
+                subdict = kw_cascade[k0]
+            else:
+                # Get parent options for first time
+                subdict = self.get_option(k0, parents=parents | {opt})
+                # Save them
+                kw_cascade[k0] = subdict
+            # Check for ``None``
+            if subdict is None:
                 continue
-            if ndot == 1:
-                # Split
-                k0, k1 = fromopt.split(".")
-                # Check for recursion
-                if k0 in parents:
-                    raise ValueError(
-                        ("Detected recursion while accessing '%s' " % opt) +
-                        ("with parents %s" % parents))
-                # Get dictionary of options
-                if k0 in kw_cascade:
-                    # Previously calculated
-                    subdict = kw_cascade[k0]
-                else:
-                    # Get parent options for first time
-                    subdict = self.get_option(k0, parents=parents | {opt})
-                    # Save them
-                    kw_cascade[k0] = subdict
-                # Check for ``None``
-                if subdict is None:
-                    continue
-                # Check for a dictionary
-                if not isinstance(subdict, dict):
-                    raise TypeError(
-                        ("Cannot access '%s' because " % fromopt) +
-                        ("'%s' option is not a dict" % k0))
-                # Get the value
-                subval = subdict.get(k1)
+            # Check for a dictionary
+            if not isinstance(subdict, dict):
+                raise TypeError(
+                    ("Cannot access '%s' because " % fromopt) +
+                    ("'%s' option is not a dict" % k0))
+            # Get the value
+            subval = subdict.get(k1)
             # One more check for ``None``
             if subval is not None:
                 # Don't override
@@ -990,6 +1055,48 @@ class KwargHandler(dict):
                 Dictionary of options in *opts* relevant to *sec*
         :Versions:
             * 2020-01-16 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Reuse results until options change
+        """
+       # --- Cache ---
+        # Get processed sections
+        cache = self.__dict__.get("_section_cache")
+        # Create it if needed
+        if cache is None:
+            cache = {}
+            self.__dict__["_section_cache"] = cache
+        # Check for previous result
+        kw = cache.get(sec)
+        # Process section if needed
+        if kw is None:
+            # Calculate section and save a copy not shared with *opts*
+            kw = _copy_section(self._section_options(sec))
+            cache[sec] = kw
+       # --- Output ---
+        # Check for *mainopt*
+        if mainopt is None:
+            # Copy so callers can modify result
+            return _copy_section(kw)
+        else:
+            # Return primary key only (default to ``{}``)
+            return _copy_option(kw.get(mainopt, {}))
+
+    # Process section options without cache
+    def _section_options(self, sec):
+        r"""Process options for a section (without using saved results)
+
+        :Call:
+            >>> kw = opts._section_options(sec)
+        :Inputs:
+            *opts*: :class:`KwargHandler`
+                Options interface
+            *sec*: :class:`str`
+                Name of options section
+        :Outputs:
+            *kw*: :class:`dict`
+                Dictionary of options in *opts* relevant to *sec*
+        :Versions:
+            * 2020-01-16 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Split from :func:`section_options`
         """
        # --- Prep ---
         # Class
@@ -1016,14 +1123,7 @@ class KwargHandler(dict):
                 kw_sec[k] = copy.copy(v)
        # --- Output ---
         # Remove ``None``
-        kw = cls.denone(kw_sec)
-        # Check for *mainopt*
-        if mainopt is None:
-            # No selection
-            return kw
-        else:
-            # Return primary key only (default to ``{}``)
-            return kw.get(mainopt, {})
+        return cls.denone(kw_sec)
 
    # --- Option Lists by Option ---
     # Get list of option that affect a section
@@ -1078,6 +1178,65 @@ class KwargHandler(dict):
         # Output
         return optlist
         
+    # Split submap into simple and cascading options
+    @classmethod
+    def _get_kw_submap_split(cls, opt):
+        r"""Get preprocessed *_kw_submap* entries for one option
+
+        The ``"."`` checks and splits of each *_kw_submap* key are done
+        only the first time an option is accessed for each class.
+
+        :Call:
+            >>> kw_direct, kw_dotted = cls._get_kw_submap_split(opt)
+        :Inputs:
+            *cls*: :class:`type`
+                Options subclass of :class:`KwargHandler`
+            *opt*: :class:`str`
+                Name of option
+        :Outputs:
+            *kw_direct*: :class:`tuple`\ [:class:`tuple`]
+                Pairs of (*fromopt*, *subopt*) for simple options
+            *kw_dotted*: :class:`tuple`\ [:class:`tuple`]
+                Entries (*fromopt*, *k0*, *k1*, *subopt*) for options
+                like ``"k0.k1"`` from a parent :class:`dict` option
+        :Versions:
+            * 2026-10-16 ``@agent``: First version
+        """
+        # Get cache specific to this class (not inherited)
+        cache = cls.__dict__.get("_kw_submap_split")
+        # Create it if needed
+        if cache is None:
+            cache = {}
+            cls._kw_submap_split = cache
+        # Check for previous result
+        kw_split = cache.get(opt)
+        if kw_split is not None:
+            return kw_split
+        # Initialize lists
+        kw_direct = []
+        kw_dotted = []
+        # Loop through submap options
+        for (fromopt, subopt) in cls._kw_submap.get(opt, {}).items():
+            # Check for "."
+            ndot = fromopt.count(".")
+            # Filter "."
+            if ndot == 0:
+                # Direct access simple option
+                kw_direct.append((fromopt, subopt))
+            elif ndot == 1:
+                # Split
+                k0, k1 = fromopt.split(".")
+                # Cascading option
+                kw_dotted.append((fromopt, k0, k1, subopt))
+            else:
+                # Not recursing on dicts of dicts or something
+                raise ValueError("Cannot process option '%s'" % fromopt)
+        # Save
+        kw_split = (tuple(kw_direct), tuple(kw_dotted))
+        cache[opt] = kw_split
+        # Output
+        return kw_split
+
     # Get list of options that affect one option
     @classmethod
     def _get_optlist_option(cls, opt, parents=None):
@@ -1327,8 +1486,11 @@ class KwargHandler(dict):
                 Option to combine even if no value in *cls.__dict__*
         :Versions:
             * 2020-02-12 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Reset *_kw_submap_split*
         """
         cls.combine_optdict("_kw_submap", parentcls, f)
+        # Discard preprocessed entries
+        cls._kw_submap_split = {}
 
     # Combine suboption aliases
     @classmethod
@@ -1860,3 +2022,20 @@ def _combine_dict(v1, v2):
         else:
             # New value
             v1[k] = v
+
+
+# Copy processed section
+def _copy_section(kw):
+    # Copy top level and any :class:`dict` values
+    return {k: _copy_option(v) for (k, v) in kw.items()}
+
+
+# Copy processed option value
+def _copy_option(v):
+    # Copy dicts and lists, including nested ones
+    if isinstance(v, dict):
+        return {k: _copy_option(vk) for (k, vk) in v.items()}
+    elif isinstance(v, list):
+        return [_copy_option(vk) for vk in v]
+    else:
+        return v
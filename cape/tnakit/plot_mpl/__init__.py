@@ -20,13 +20,10 @@ import os
 import numpy as np
 
 # TNA toolkit modules
-import cape.tnakit.kwutils as kwutils
-import cape.tnakit.optitem as optitem
-import cape.tnakit.rstutils as rstutils
-import cape.tnakit.statutils as statutils
 import cape.tnakit.typeutils as typeutils
 
 # Local modules
+from . import kernels
 from . import mpl
 
 # Local direct imports
@@ -38,6 +35,9 @@ from .mpl import (
     close, get_figure, get_axes,
     figure, grid, imshow, spine, spines)
 
+# Minimum array size for using compiled statistics kernels
+_KERNEL_MIN_SIZE = 50000
+
 
 # Preprocess kwargs
 def _preprocess_kwargs(**kw):
@@ -84,6 +84,31 @@ def _preprocess_kwargs(**kw):
     return opts, h
 
 
+# Ensure C-contiguous arrays
+def _contiguous(v):
+    r"""Convert array to C-contiguous memory layout if necessary
+
+    Non-arrays and arrays that are already contiguous are returned
+    unchanged, so this does not create any copies in the usual case.
+
+    :Call:
+        >>> v = _contiguous(v)
+    :Inputs:
+        *v*: :class:`np.ndarray` | :class:`any`
+            Plot data
+    :Outputs:
+        *v*: :class:`np.ndarray` | :class:`any`
+            C-contiguous version of *v* if it is an array
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Only process arrays
+    if isinstance(v, np.ndarray):
+        return np.ascontiguousarray(v)
+    # Otherwise leave as is
+    return v
+
+
 # Contour plotter
 def contour(xv, yv, zv, *a, **kw):
     r"""Plot contours many options
@@ -122,13 +147,13 @@ def contour(xv, yv, zv, *a, **kw):
     _part_axes_grid(opts, h)
     _part_axes_spines(opts, h)
     _part_axes_format(opts, h)
-    _part_axes_adjust(opts, h)
+    kw_adj = _part_axes_adjust(opts, h)
    # --- Labeling ---
     # Colorbar
     _part_colorbar(opts, h)
    # --- Cleanup ---
     # Final margin adjustment
-    _part_axes_adjust(opts, h)
+    _part_axes_adjust(opts, h, kw_adj)
     # Output
     return h
 
@@ -155,14 +180,22 @@ def hist(v, *a, **kw):
     opts.setdefault_option("RightSpine", True)
     opts.setdefault_option("TopSpine", True)
    # --- Statistics ---
-    # Filter out non-numeric entries
-    v = v[np.logical_not(np.isnan(v))]
+    # Filter out non-numeric and infinite entries
+    v = np.asarray(v)
+    # Check for large arrays and compiled kernels
+    if kernels.numba and v.ndim == 1 and v.size >= _KERNEL_MIN_SIZE:
+        # Filter and calculate mean and StdDev in compiled loops
+        vf = np.empty(v.size)
+        n, vmu, vstd = kernels.finite_mean_std(v, vf)
+        v = vf[:n]
+    else:
+        v = v[np.isfinite(v)]
+        # Calculate the mean
+        vmu = v.mean()
+        # Calculate StdDev
+        vstd = v.std()
     # Save values
     opts.set_option("v", v)
-    # Calculate the mean
-    vmu = np.mean(v)
-    # Calculate StdDev
-    vstd = np.std(v)
     # Save stats
     opts.set_option("mu", vmu)
     opts.set_option("std", vstd)
@@ -200,7 +233,7 @@ def hist(v, *a, **kw):
     _part_axes_grid(opts, h)
     _part_axes_spines(opts, h)
     _part_axes_format(opts, h)
-    _part_axes_adjust(opts, h)
+    kw_adj = _part_axes_adjust(opts, h)
    # --- Labeling ---  
     _part_mean_label(opts, h)
     _part_sigma_label(opts, h)
@@ -209,7 +242,7 @@ def hist(v, *a, **kw):
     # Legend
     _part_legend(opts, h)
     # Readjust axes
-    _part_axes_adjust(opts, h)
+    _part_axes_adjust(opts, h, kw_adj)
     # Output
     return h
 
@@ -250,9 +283,9 @@ def plot(xv, yv, *a, **kw):
         # Too many args
         raise TypeError(
             "plot() takes at most 3 args (%i given)" % (len(a) + 2))
-    # Save values
-    opts.set_option("x", xv)
-    opts.set_option("y", yv)
+    # Save values (avoid copies of strided arrays in each plot call)
+    opts.set_option("x", _contiguous(xv))
+    opts.set_option("y", _contiguous(yv))
    # --- Control Options ---
     # Defaults to plot different parts
     opts.setdefault_option("ShowLine", True)
@@ -266,21 +299,21 @@ def plot(xv, yv, *a, **kw):
    # --- Primary Plot ---
     # Plot, then others
     _part_plot(opts, h)
-    _part_minmax(opts, h)
-    _part_error(opts, h)
-    _part_uq(opts, h)
+    _part_band(opts, h, "minmax")
+    _part_band(opts, h, "error")
+    _part_band(opts, h, "uq")
    # --- Axis formatting ---
     # Format grid, spines, extents, and window
     _part_axes_grid(opts, h)
     _part_axes_spines(opts, h)
     _part_axes_format(opts, h)
-    _part_axes_adjust(opts, h)
+    kw_adj = _part_axes_adjust(opts, h)
    # --- Labeling ---
     # Legend
     _part_legend(opts, h)
    # --- Cleanup ---
     # Final margin adjustment
-    _part_axes_adjust(opts, h)
+    _part_axes_adjust(opts, h, kw_adj)
     # Output
     return h
 
@@ -324,9 +357,9 @@ def semilogy(xv, yv, *a, **kw):
     if any(V < 0 for V in yv):
         raise TypeError(
             "semilogy() plot requires positive y-values only")
-    # Save values
-    opts.set_option("x", xv)
-    opts.set_option("y", yv)
+    # Save values (avoid copies of strided arrays in each plot call)
+    opts.set_option("x", _contiguous(xv))
+    opts.set_option("y", _contiguous(yv))
    # --- Control Options ---
     # Defaults to plot different parts
     opts.setdefault_option("ShowLine", True)
@@ -341,21 +374,21 @@ def semilogy(xv, yv, *a, **kw):
     # Plot, then others
     _part_plot(opts, h)
     _part_semilogy(opts, h)
-    _part_minmax(opts, h)
-    _part_error(opts, h)
-    _part_uq(opts, h)
+    _part_band(opts, h, "minmax")
+    _part_band(opts, h, "error")
+    _part_band(opts, h, "uq")
    # --- Axis formatting ---
     # Format grid, spines, extents, and window
     _part_axes_grid(opts, h)
     _part_axes_spines(opts, h)
     _part_axes_format(opts, h)
-    _part_axes_adjust(opts, h)
+    kw_adj = _part_axes_adjust(opts, h)
    # --- Labeling ---
     # Legend
     _part_legend(opts, h)
    # --- Cleanup ---
     # Final margin adjustment
-    _part_axes_adjust(opts, h)
+    _part_axes_adjust(opts, h, kw_adj)
     # Output
     return h
 
@@ -393,7 +426,7 @@ def scatter(xv, yv,  *a, **kw):
      # Format grid, spines, extents, and window
     _part_axes_grid(opts, h)
     _part_axes_spines(opts, h)
-    _part_axes_adjust(opts, h)
+    kw_adj = _part_axes_adjust(opts, h)
     _part_axes_format(opts, h)
     # --- Labeling ---
     # Colorbar
@@ -403,7 +436,7 @@ def scatter(xv, yv,  *a, **kw):
     _part_legend(opts, h)
     # --- Cleanup ---
      # Final margin adjustment
-    _part_axes_adjust(opts, h)
+    _part_axes_adjust(opts, h, kw_adj)
     # Output
     return h
 
@@ -441,8 +474,8 @@ def _part_plot(opts, h):
             a = tuple()
         # Plot call
         lines = mpl._plot(xv, yv, *a, **kw)
-        # Save lines
-        h.save("lines", lines)
+        # Save lines (new handles, so no need to check for duplicates)
+        h.lines.extend(lines)
 
 def _part_semilogy(opts, h):
     # Get axes
@@ -647,103 +680,111 @@ def _part_mean_label(opts, h):
     h.save('meanlabel', meanlabel)    
 
 
-# Partial function: minmax()
-def _part_minmax(opts, h):
-    # Plot it
-    if opts.get_option("ShowMinMax"):
-        # Process min/max options
-        opts_mmax = opts.minmax_options()
-        # Get type
-        minmax_type = opts_mmax.get("MinMaxPlotType", "ErrorBar")
-        # Options for the plot function
-        kw = opts_mmax.get("MinMaxOptions", {})
-        # Get values
-        xv = opts.get_option("x")
-        yv = opts.get_option("y")
-        # Min/max values
-        ymin = opts.get_option("ymin")
-        ymax = opts.get_option("ymax")
-        # Plot call
-        if minmax_type == "FillBetween":
-            # Do a :func:`fill_between` plot
-            hi = mpl._fill_between(xv, ymin, ymax, **kw)
-        elif minmax_type == "ErrorBar":
-            # Convert to error bar widths
-            yerr = minmax_to_errorbar(yv, ymin, ymax, **kw)
-            # Do a :func:`errorbar` plot
-            hi = mpl._errorbar(xv, yv, yerr, **kw)
-        # Save result
-        h.save("minmax", hi)
-
-
-# Partial function: error()
-def _part_error(opts, h):
-    # Plot it
-    if opts.get_option("ShowError"):
-        # Process "error" options
-        opts_error = opts.error_options()
-        # Get type
-        error_type = opts_error.get("ErrorPlotType", "FillBetween")
-        # Get options for plot function
-        kw = opts_error.get("ErrorOptions", {})
-        # Get values
-        xv = opts.get_option("x")
-        yv = opts.get_option("y")
-        # Error magnitudes
-        yerr = opts.get_option("yerr")
-        # Exit if None
-        if yerr is None:
-            return
-        # Plot call
-        if error_type == "FillBetween":
-            # Convert to min/max values
-            ymin, ymax = errorbar_to_minmax(yv, yerr)
-            # Do a :func:`fill_between` plot
-            hi = mpl._fill_between(xv, ymin, ymax, **kw)
-        elif t_err == "ErrorBar":
-            # Do a :func:`errorbar` plot
-            hi = mpl._errorbar(xv, yv, yerr, **kw)
-        # Save error handles
-        h.save("error", hi)
-    
+# Plot min/max range as filled region
+def _fill_minmax(xv, yv, ymin, ymax, **kw):
+    return mpl._fill_between(xv, ymin, ymax, **kw)
 
-# Partial function: uq()
-def _part_uq(opts, h):
-    # Plot it
-    if opts.get_option("ShowUncertainty"):
-        # Process uncertainty quantification options
-        opts_uq = opts.uq_options()
-        # Plot type
-        uq_type = opts.get("UncertaintyPlotType", "FillBetween")
-        # Get options for plot function
-        kw = opts_uq.get("UncertaintyOptions", {})
-        # Get values
-        xv = opts.get_option("x")
-        yv = opts.get_option("y")
-        # Uncertainty magnitudes
-        uy = opts.get_option("uy")
-        # Exit if None
-        if uy is None:
-            return
-        # Plot call
-        if uq_type == "FillBetween":
-            # Convert to min/max values
-            ymin, ymax = errorbar_to_minmax(yv, uy)
-            # Do a :func:`fill_between` plot
-            hi = mpl._fill_between(xv, ymin, ymax, **kw)
-        elif uq_type == "ErrorBar":
-            # Do a :func:`errorbar` plot
-            hi = mpl._errorbar(xv, yv, uy, **kw)
-        # Save UQ handles
-        h.save("uq", hi)
+
+# Plot min/max range as error bars
+def _errorbar_minmax(xv, yv, ymin, ymax, **kw):
+    # Convert to error bar widths
+    yerr = minmax_to_errorbar(yv, ymin, ymax)
+    # Do a :func:`errorbar` plot
+    return mpl._errorbar(xv, yv, yerr, **kw)
+
+
+# Plot error bar widths as filled region
+def _fill_errorbar(xv, yv, yerr, **kw):
+    # Convert to min/max values
+    ymin, ymax = errorbar_to_minmax(yv, yerr)
+    # Do a :func:`fill_between` plot
+    return mpl._fill_between(xv, ymin, ymax, **kw)
+
+
+# Plot error bar widths as error bars
+def _errorbar_errorbar(xv, yv, yerr, **kw):
+    return mpl._errorbar(xv, yv, yerr, **kw)
+
+
+# Plot functions for each *MinMaxPlotType*
+_MINMAX_PLOTTERS = {
+    "FillBetween": _fill_minmax,
+    "ErrorBar": _errorbar_minmax,
+}
+
+# Plot functions for each *ErrorPlotType* and *UncertaintyPlotType*
+_ERROR_PLOTTERS = {
+    "FillBetween": _fill_errorbar,
+    "ErrorBar": _errorbar_errorbar,
+}
+
+
+# Get plot function for a range plot type
+def _get_range_plotter(plotters, typ, opt):
+    # Look up plot function
+    fn = plotters.get(typ)
+    # Check for unrecognized type
+    if fn is None:
+        raise ValueError(
+            "Unrecognized %s '%s'; options are %s"
+            % (opt, typ, list(plotters)))
+    # Output
+    return fn
+
+
+# Settings for each range plot, *ShowMinMax*, *ShowError*, etc.
+#   (flag, data keys, options method, type key, default type,
+#    plot function options key, plot function table)
+_BAND_PARTS = {
+    "minmax": (
+        "ShowMinMax", ("ymin", "ymax"), "minmax_options",
+        "MinMaxPlotType", "ErrorBar", "MinMaxOptions", _MINMAX_PLOTTERS),
+    "error": (
+        "ShowError", ("yerr",), "error_options",
+        "ErrorPlotType", "FillBetween", "ErrorOptions", _ERROR_PLOTTERS),
+    "uq": (
+        "ShowUncertainty", ("uy",), "uq_options",
+        "UncertaintyPlotType", "FillBetween", "UncertaintyOptions",
+        _ERROR_PLOTTERS),
+}
+
+
+# Partial function: minmax(), error(), or uq()
+def _part_band(opts, h, kind):
+    # Unpack settings for this kind of range plot
+    flag, keys, fopts, ktyp, vtyp, kopts, plotters = _BAND_PARTS[kind]
+    # Check if it should be plotted
+    if not opts.get_option(flag):
+        return
+    # Range values: (*ymin*, *ymax*) or error magnitudes
+    vals = tuple(_contiguous(opts.get_option(k)) for k in keys)
+    # Exit if any are None (before processing options)
+    if any(v is None for v in vals):
+        return
+    # Process options for this range plot
+    opts_band = getattr(opts, fopts)()
+    # Get plot function for the plot type
+    fn = _get_range_plotter(plotters, opts_band.get(ktyp, vtyp), ktyp)
+    # Options for the plot function
+    kw = opts_band.get(kopts, {})
+    # Get values
+    xv = opts.get_option("x")
+    yv = opts.get_option("y")
+    # Plot call
+    hi = fn(xv, yv, *vals, **kw)
+    # Save handles
+    h.save(kind, hi)
 
 
 # Partial function: axes_adjust()
-def _part_axes_adjust(opts, h):
-    # Process axes_adjust() options
-    kw = opts.axadjust_options()
+def _part_axes_adjust(opts, h, kw=None):
+    # Process axes_adjust() options unless reusing them from earlier call
+    if kw is None:
+        kw = opts.axadjust_options()
     # Apply margin adjustments
     mpl._axes_adjust(h.fig, ax=h.ax, **kw)
+    # Return options for reuse in final adjustment
+    return kw
 
 
 # Partial function: grid()
@@ -794,6 +835,8 @@ def _part_colorbar(opts, h):
 
 # Partial function: coverage()
 def _part_coverage(opts, h):
+    # Statistics module (imports SciPy), only needed here
+    import cape.tnakit.statutils as statutils
     # Process coverage options
     covopts = opts.coverage_options()
     cov = covopts.get("Coverage")
@@ -808,10 +851,16 @@ def _part_coverage(opts, h):
     fstd = covopts.get('FilterSigma', 2.0*kcdf)
     # Remove values from histogram
     if fstd:
-        # Find indices of cases that are within outlier range
-        j = np.abs(v-vmu)/vstd <= fstd
-        # Filter values
-        v = v[j]
+        # Check for large arrays and compiled kernels
+        if kernels.numba and v.ndim == 1 and v.size >= _KERNEL_MIN_SIZE:
+            # Filter values in one compiled loop
+            vf = np.empty(v.size)
+            v = vf[:kernels.filter_dev(v, vmu, fstd*vstd, vf)]
+        else:
+            # Find indices of cases that are within outlier range
+            j = np.abs(v - vmu) <= fstd*vstd
+            # Filter values
+            v = v[j]
     # Calculate interval
     acov, bcov = statutils.get_cov_interval(v, cov, cdf=cdf)
     # Save values
@@ -844,7 +893,7 @@ def _part_delta(opts, h):
     # Save it
     opts.set_option('Delta', dc)
     # Plot lines
-    if type(dc).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(dc, (np.ndarray, list, tuple)):
         # Separate lower and upper limits
         cmin = vmu - dc[0]
         cmax = vmu + dc[1]
@@ -886,7 +935,7 @@ def _part_delta_label(opts, h):
     # Interval format
     flbl = "%.4f"
     # Insert value
-    if type(dc).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(dc, (np.ndarray, list, tuple)):
         lbl = (u'\u0394%s = (%s, %s)' % 
                (labelname, flbl, flbl)) % (dc[0], dc[1])
     else:
@@ -895,6 +944,21 @@ def _part_delta_label(opts, h):
     # Return
     h.save('histdeltalabel', deltalabel)    
 
+# Shift directions (x, y) for each *loc* of move_axes()
+_MOVE_AXES_DIRS = {
+    1: (0, 1),
+    "top": (0, 1),
+    "up": (0, 1),
+    2: (1, 0),
+    "right": (1, 0),
+    3: (0, -1),
+    "bottom": (0, -1),
+    "down": (0, -1),
+    4: (-1, 0),
+    "left": (-1, 0),
+}
+
+
 # Move axes all the way to one side
 def move_axes(ax, loc, margin=0.0):
     r"""Move an axes object's plot region to one side
@@ -920,9 +984,11 @@ def move_axes(ax, loc, margin=0.0):
             Margin to leave outside of axes and tick labels
     :Versions:
         * 2020-01-10 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Use *_MOVE_AXES_DIRS* lookup
     """
     # Import plot modules
-    mpl._import_pyplot()
+    if not mpl._PYPLOT_READY:
+        mpl._import_pyplot()
     # Check inputs
     if not isinstance(loc, (int, typeutils.strlike)):
         raise TypeError("Location must be int or str (got %s)" % type(loc))
@@ -932,7 +998,7 @@ def move_axes(ax, loc, margin=0.0):
         raise TypeError("Margin must be float (got %s)" % type(margin))
     # Get axes
     if ax is None:
-        ax = mpl.plt.gca()
+        ax = mpl._gca()
     # Get current position
     xmin, ymin, w, h = ax.get_position().bounds
     # Max positions
@@ -940,26 +1006,32 @@ def move_axes(ax, loc, margin=0.0):
     ymax = ymin + h
     # Get extents occupied by labels
     wa, ha, wb, hb = mpl.get_axes_label_margins(ax)
-    # Filter location
-    if loc in [1, "top", "up"]:
-        # Get shift directions to top edge
-        dx = 0.0
-        dy = 1.0 - hb - margin - ymax
-    elif loc in [2, "right"]:
+    # Get direction of shift
+    try:
+        sx, sy = _MOVE_AXES_DIRS[loc]
+    except KeyError:
+        # Unknown string
+        raise ValueError("Unknown location string '%s'" % loc)
+    # Horizontal shift
+    if sx > 0:
         # Get shift direction to right edge
         dx = 1.0 - wb - margin - xmax
-        dy = 0.0
-    elif loc in [3, "bottom", "down"]:
-        # Get shift direction to bottom
+    elif sx < 0:
+        # Get shift direction to left edge
+        dx = margin + wa - xmin
+    else:
+        # No horizontal shift
         dx = 0.0
+    # Vertical shift
+    if sy > 0:
+        # Get shift direction to top edge
+        dy = 1.0 - hb - margin - ymax
+    elif sy < 0:
+        # Get shift direction to bottom edge
         dy = margin + ha - ymin
-    elif loc in [4, "left"]:
-        # Get shift direction to bottom and right
-        dx = margin + wa - xmin
-        dy = 0.0 
     else:
-        # Unknown string
-        raise ValueError("Unknown location string '%s'" % loc)
+        # No vertical shift
+        dy = 0.0
     # Set new position
     ax.set_position([xmin + dx, ymin + dy, w, h])
 
@@ -981,7 +1053,8 @@ def nudge_axes(ax, dx=0.0, dy=0.0):
         * 2020-01-10 ``@ddalle``: First version
     """
     # Import plot modules
-    mpl._import_pyplot()
+    if not mpl._PYPLOT_READY:
+        mpl._import_pyplot()
     # Check inputs
     if not isinstance(dx, float):
         raise TypeError("dx must be float (got %s)" % type(dx))
@@ -989,7 +1062,7 @@ def nudge_axes(ax, dx=0.0, dy=0.0):
         raise TypeError("dy must be float (got %s)" % type(dy))
     # Get axes
     if ax is None:
-        ax = mpl.plt.gca()
+        ax = mpl._gca()
     # Get current position
     xmin, ymin, w, h = ax.get_position().bounds
     # Set new position
@@ -1020,7 +1093,7 @@ def _part_sigma(opts, h):
     if not ksig:
         return
     # Plot lines
-    if type(ksig).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(ksig, (np.ndarray, list, tuple)):
         # Separate lower and upper limits
         vmin = vmu - ksig[0]*vstd
         vmax = vmu + ksig[1]*vstd
@@ -1091,13 +1164,14 @@ def plot_delta(ax, vmu, **kw):
         * 2019-03-14 ``@jmeeroff``: First version
     """
     # Ensure pyplot loaded
-    mpl._import_pyplot()
+    if not mpl._PYPLOT_READY:
+        mpl._import_pyplot()
     # Check orientation
     orient = kw.pop('orientation', None)
     # Reference delta
     dc = kw.get('Delta', 0.0)
     # Check for single number or list
-    if type(dc).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(dc, (np.ndarray, list, tuple)):
         # Separate lower and upper limits
         cmin = vmu - dc[0]
         cmax = vmu + dc[1]
@@ -1140,27 +1214,41 @@ def minmax_to_errorbar(yv, ymin, ymax):
             Array of lower, upper error bar widths
     :Versions:
         * 2019-03-06 ``@ddalle/@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Write directly into output array
     """
-    # Widths of *ymax* above *yv*
-    yu = ymax - np.asarray(yv)
-    # Widths of *ymin* below *yv*
-    yl = np.asarray(yv) - ymin
-    # Separate error bars
-    yerr = np.array([yl, yu])
+    # Ensure arrays
+    yv = np.asarray(yv)
+    ymin = np.asarray(ymin)
+    ymax = np.asarray(ymax)
+    # Initialize output
+    shape = np.broadcast(yv, ymin, ymax).shape
+    yerr = np.empty((2,) + shape, dtype=np.result_type(yv, ymin, ymax))
+    # Check for compiled kernel and matching 1D arrays
+    qshape = (yv.ndim == 1) and (ymin.shape == ymax.shape == yv.shape)
+    if kernels.numba and qshape:
+        # Single pass through all three arrays
+        kernels.minmax_to_errorbar(yv, ymin, ymax, yerr)
+    else:
+        # Widths of *ymin* below *yv*
+        np.subtract(yv, ymin, out=yerr[0])
+        # Widths of *ymax* above *yv*
+        np.subtract(ymax, yv, out=yerr[1])
     # Output
     return yerr
 
 # Convert min/max to error bar widths
-def errorbar_to_minmax(yv, yerr):
+def errorbar_to_minmax(yv, yerr, out=None):
     r"""Convert min/max values to error bar below/above widths
 
     :Call:
-        >>> ymin, ymax = minmax_to_errorbar(yv, yerr)
+        >>> ymin, ymax = minmax_to_errorbar(yv, yerr, out=None)
     :Inputs:
         *yv*: :class:`np.ndarray` shape=(*N*,)
             Nominal dependent axis values
         *yerr*: :class:`float` | :class:`np.ndarray` shape=(2,*N*) | (*N*,)
             Array of lower, upper error bar widths
+        *out*: {``None``} | :class:`tuple`\ [:class:`np.ndarray`]
+            Optional existing *ymin*, *ymax* arrays to write into
     :Outputs:
         *ymin*: :class:`np.ndarray` shape=(*N*,)
             Minimum values of region plot
@@ -1168,6 +1256,7 @@ def errorbar_to_minmax(yv, yerr):
             Maximum values of region plot
     :Versions:
         * 2019-03-06 ``@ddalle/@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Use compiled kernel if available
     """
     # Ensure arrays
     yv = np.asarray(yv)
@@ -1176,17 +1265,17 @@ def errorbar_to_minmax(yv, yerr):
     N = yv.size
     # Check number of dimensions of *yerr*
     if yerr.ndim == 0:
-        # Scalar: simple arithmetic
-        ymax = yv + yerr
-        ymin = yv - yerr
+        # Scalar: same width below and above
+        yerrl = yerr
+        yerru = yerr
     elif yerr.ndim == 1:
         # Single array: check size
         if yerr.size != N:
             raise ValueError(
                 "Error bar width vector does not match size of main data")
-        # Simple arithmetic
-        ymax = yv + yerr
-        ymin = yv - yerr
+        # Same width below and above
+        yerrl = yerr
+        yerru = yerr
     elif yerr.ndim == 2:
         # 2D array: separate below/above widths
         if yerr.shape[0] != 2:
@@ -1196,17 +1285,63 @@ def errorbar_to_minmax(yv, yerr):
         elif yerr.shape[1] != N:
             raise ValueError(
                 "Error bar width vector does not match size of main data")
-        # Separate above/below deltas
-        ymax = yv + yerr[1]
-        ymin = yv - yerr[0]
+        # Views of below/above widths
+        yerrl = yerr[0]
+        yerru = yerr[1]
     else:
         # 3D or more array
         raise ValueError(
             "Cannot convert %i-D array to min/max values" % yerr.ndim)
+    # Initialize outputs
+    if out is None:
+        # New arrays
+        ymin = np.empty(yv.shape, dtype=np.result_type(yv, yerr))
+        ymax = np.empty(yv.shape, dtype=ymin.dtype)
+    else:
+        # Use buffers from caller
+        ymin, ymax = out
+    # Check for compiled kernel
+    if kernels.numba and yerr.ndim == 2 and yv.ndim == 1:
+        # Single pass through *yv* and *yerr*
+        kernels.errorbar_to_minmax(yv, yerr, ymin, ymax)
+    else:
+        # Apply widths directly into outputs
+        np.subtract(yv, yerrl, out=ymin)
+        np.add(yv, yerru, out=ymax)
     # Output
     return ymin, ymax
 
 
+# Add new items to a list
+def _extend_unique(v0, v):
+    r"""Append entries of *v* to *v0* unless already present
+
+    Entries are compared by identity, which is the same as equality for
+    :mod:`matplotlib` artists, so each check is a :class:`set` lookup
+    instead of a scan of *v0*.
+
+    :Call:
+        >>> _extend_unique(v0, v)
+    :Inputs:
+        *v0*: :class:`list`
+            List to extend in place
+        *v*: :class:`list`
+            New entries
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Identities of current entries
+    ids = set(id(vi) for vi in v0)
+    # Loop through *v* entries
+    for vi in v:
+        # Check if *vi* is already present
+        if id(vi) in ids:
+            continue
+        # Add it
+        ids.add(id(vi))
+        v0.append(vi)
+
+
 # Output class
 class MPLHandle(object):
     r"""Container for handles from :mod:`matplotlib.pyplot`
@@ -1214,6 +1349,20 @@ class MPLHandle(object):
     :Versions:
         * 2019-12-20 ``@ddalle``: First version
     """
+    # Fixed attributes; others (*contour*, *legend*, ...) use __dict__
+    __slots__ = (
+        "fig",
+        "ax",
+        "lines",
+        "__dict__",
+    )
+
+    # Attributes stored in slots
+    _fixed_attrs = ("fig", "ax", "lines")
+
+    # Attributes that are never combined into lists
+    _single_attrs = frozenset(("ax", "fig", "name"))
+
     # Initialization method
     def __init__(self, **kw):
         r"""Initialization method
@@ -1229,13 +1378,24 @@ class MPLHandle(object):
                 List of line handles
         :Versions:
             * 2019-12-20 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Ensure *h.lines* is a list
         """
         # Initialize simple handles
         self.fig = kw.get("fig")
         self.ax = kw.get("ax")
 
-        # Initialize handles
-        self.lines = kw.get("lines", [])
+        # Initialize handles (always a list)
+        lines = kw.get("lines")
+        # Check type
+        if lines is None:
+            # New list
+            self.lines = []
+        elif isinstance(lines, list):
+            # Use list as given
+            self.lines = lines
+        else:
+            # Single line handle
+            self.lines = [lines]
 
     # Combine two handles
     def add(self, h1):
@@ -1254,11 +1414,16 @@ class MPLHandle(object):
                 Second handle for collecting all objects
         :Versions:
             * 2019-12-26 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Merge slots, then other attributes
         """
         # Check inputs
         if not isinstance(h1, MPLHandle):
             raise TypeError("Second handle must be MPLHandle object")
-        # Loop through data attributes
+        # Loop through fixed attributes
+        for k in self._fixed_attrs:
+            # Save using dedicated method
+            self.save(k, getattr(h1, k, None))
+        # Loop through other data attributes
         for (k, v) in h1.__dict__.items():
             # Save using dedicated method
             self.save(k, v)
@@ -1308,45 +1473,42 @@ class MPLHandle(object):
                 Value to save/add for that attribute
         :Versions:
             * 2020-01-25 ``@ddalle``: First version
+            * 2026-10-16 ``@agent``: Merge lists by identity; support slots
         """
-        # Get current value
-        v0 = self.__dict__.get(attr)
+        # Get current value (from slot or instance dict, not class)
+        if attr in self._fixed_attrs:
+            v0 = getattr(self, attr, None)
+        else:
+            v0 = self.__dict__.get(attr)
         # Check for case with no current value
         if v0 is None:
             # Save as given
-            self.__dict__[attr] = v
+            setattr(self, attr, v)
             # No more actions
             return
         # Special attributes that should not be a list
-        if attr in {"ax", "fig", "name"}:
+        if attr in self._single_attrs:
             # Only one value allowed for these
-            self.__dict__[attr] = v
+            setattr(self, attr, v)
             return
         # Otherwise process list combinations
         if isinstance(v0, list):
             # Check type of new value
             if not isinstance(v, list):
-                # Check if *v* is already present
-                if v not in v0:
-                    v0.append(v)
+                # Add *v* unless already present (same rule as lists)
+                _extend_unique(v0, [v])
                 return
-            # Otherwise loop through *v* entries
-            for vi in v:
-                # Check if *vi* is already present
-                if vi not in v0:
-                    v0.append(vi)
+            # Otherwise add *v* entries that aren't already present
+            _extend_unique(v0, v)
         else:
             # Check type of new value
             if not isinstance(v, list):
                 # Check if *v* and *v0* are the same
                 if v is not v0:
-                    self.__dict__[attr] = [v0, v]
+                    setattr(self, attr, [v0, v])
                 return
             # Otherwise convert current value to list
             v0 = [v0]
-            self.__dict__[attr] = v0
-            # Loop through *v* entries
-            for vi in v:
-                # Check if *vi* is already present
-                if vi not in v0:
-                    v0.append(vi)
+            setattr(self, attr, v0)
+            # Add *v* entries that aren't already present
+            _extend_unique(v0, v)
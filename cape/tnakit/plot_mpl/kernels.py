@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+--------------------------------------------------------------------
+:mod:`cape.tnakit.plot_mpl.kernels`: Compiled Array Kernels
+--------------------------------------------------------------------
+
+This module contains simple loops over plot data, such as converting
+min/max values to error bar widths, that are compiled using
+:mod:`numba` if it is installed.  Each kernel writes into output arrays
+in a single pass instead of creating NumPy temporaries.
+
+If :mod:`numba` is not available, *numba* is ``None`` and callers
+should use the equivalent NumPy expressions instead of these
+functions.
+"""
+
+# Standard library modules
+import math
+
+# Required third-party modules
+import numpy as np
+
+# Optional third-party modules
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# Convert min/max to error bar widths
+def minmax_to_errorbar(yv, ymin, ymax, yerr):
+    r"""Convert min/max values to error bar widths in one pass
+
+    :Call:
+        >>> minmax_to_errorbar(yv, ymin, ymax, yerr)
+    :Inputs:
+        *yv*: :class:`np.ndarray` shape=(*N*,)
+            Nominal dependent axis values
+        *ymin*: :class:`np.ndarray` shape=(*N*,)
+            Minimum values of region plot
+        *ymax*: :class:`np.ndarray` shape=(*N*,)
+            Maximum values of region plot
+        *yerr*: :class:`np.ndarray` shape=(2, *N*)
+            Output array of lower, upper error bar widths
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Loop through points
+    for i in range(yv.size):
+        # Widths below and above *yv*
+        yerr[0, i] = yv[i] - ymin[i]
+        yerr[1, i] = ymax[i] - yv[i]
+
+
+# Convert error bar widths to min/max
+def errorbar_to_minmax(yv, yerr, ymin, ymax):
+    r"""Convert (2, *N*) error bar widths to min/max values in one pass
+
+    :Call:
+        >>> errorbar_to_minmax(yv, yerr, ymin, ymax)
+    :Inputs:
+        *yv*: :class:`np.ndarray` shape=(*N*,)
+            Nominal dependent axis values
+        *yerr*: :class:`np.ndarray` shape=(2, *N*)
+            Array of lower, upper error bar widths
+        *ymin*: :class:`np.ndarray` shape=(*N*,)
+            Output array of minimum values
+        *ymax*: :class:`np.ndarray` shape=(*N*,)
+            Output array of maximum values
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Loop through points
+    for i in range(yv.size):
+        # Apply lower and upper widths
+        ymin[i] = yv[i] - yerr[0, i]
+        ymax[i] = yv[i] + yerr[1, i]
+
+
+# Filter non-finite values and get mean and standard deviation
+def finite_mean_std(v, vout):
+    r"""Copy finite values and calculate their mean and std deviation
+
+    :Call:
+        >>> n, vmu, vstd = finite_mean_std(v, vout)
+    :Inputs:
+        *v*: :class:`np.ndarray` shape=(*N*,)
+            Array of values, possibly including ``nan`` or ``inf``
+        *vout*: :class:`np.ndarray` shape=(*N*,)
+            Output array; first *n* entries are finite values of *v*
+    :Outputs:
+        *n*: :class:`int`
+            Number of finite values
+        *vmu*: :class:`float`
+            Mean of finite values (``nan`` if *n* is ``0``)
+        *vstd*: :class:`float`
+            Standard deviation of finite values
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Initialize count and sum
+    n = 0
+    vsum = 0.0
+    # Loop through points
+    for i in range(v.size):
+        # Skip nan and inf
+        if not np.isfinite(v[i]):
+            continue
+        # Save value and add to sum
+        vout[n] = v[i]
+        vsum += v[i]
+        n += 1
+    # Check for no finite values
+    if n == 0:
+        return 0, np.nan, np.nan
+    # Mean
+    vmu = vsum / n
+    # Sum of squared deviations (second pass over filtered values)
+    vvar = 0.0
+    for i in range(n):
+        vvar += (vout[i] - vmu) * (vout[i] - vmu)
+    # Output
+    return n, vmu, math.sqrt(vvar / n)
+
+
+# Filter values more than some distance from the mean
+def filter_dev(v, vmu, dmax, vout):
+    r"""Copy values within *dmax* of *vmu* in one pass
+
+    :Call:
+        >>> n = filter_dev(v, vmu, dmax, vout)
+    :Inputs:
+        *v*: :class:`np.ndarray` shape=(*N*,)
+            Array of values
+        *vmu*: :class:`float`
+            Center value, usually the mean of *v*
+        *dmax*: :class:`float`
+            Maximum distance from *vmu* to keep
+        *vout*: :class:`np.ndarray` shape=(*N*,)
+            Output array; first *n* entries are kept values
+    :Outputs:
+        *n*: :class:`int`
+            Number of values kept
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Initialize count
+    n = 0
+    # Loop through points
+    for i in range(v.size):
+        # Check deviation
+        if abs(v[i] - vmu) <= dmax:
+            # Keep it
+            vout[n] = v[i]
+            n += 1
+    # Output
+    return n
+
+
+# Gaussian probability density function
+def gauss_pdf(xv, vmu, vstd, yv):
+    r"""Evaluate Gaussian PDF at each point in one fused loop
+
+    :Call:
+        >>> gauss_pdf(xv, vmu, vstd, yv)
+    :Inputs:
+        *xv*: :class:`np.ndarray` shape=(*N*,)
+            Points at which to evaluate PDF
+        *vmu*: :class:`float`
+            Mean of distribution
+        *vstd*: :class:`float`
+            Standard deviation of distribution
+        *yv*: :class:`np.ndarray` shape=(*N*,)
+            Output array of PDF values
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Normalization factor
+    c = 1.0 / (vstd * math.sqrt(2.0*math.pi))
+    # Loop through points
+    for i in range(xv.size):
+        # Normalized distance from mean
+        z = (xv[i] - vmu) / vstd
+        # PDF value
+        yv[i] = c * math.exp(-0.5*z*z)
+
+
+# Minimum and maximum in one pass
+def minmax(v):
+    r"""Get minimum and maximum of an array in one pass, ignoring NaNs
+
+    :Call:
+        >>> vmin, vmax = minmax(v)
+    :Inputs:
+        *v*: :class:`np.ndarray`\ [:class:`float`] shape=(*N*,)
+            Array of values
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum non-NaN value (``nan`` if none)
+        *vmax*: :class:`float`
+            Maximum non-NaN value (``nan`` if none)
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Initialize limits
+    vmin = np.nan
+    vmax = np.nan
+    # Flag for first non-NaN value
+    found = False
+    # Loop through points
+    for i in range(v.size):
+        # Current value
+        x = v[i]
+        # Skip NaNs
+        if x != x:
+            continue
+        # Check for first value
+        if not found:
+            vmin = x
+            vmax = x
+            found = True
+        elif x < vmin:
+            vmin = x
+        elif x > vmax:
+            vmax = x
+    # Output
+    return vmin, vmax
+
+
+# Compile kernels if possible
+if numba is not None:
+    minmax_to_errorbar = numba.njit(cache=True)(minmax_to_errorbar)
+    errorbar_to_minmax = numba.njit(cache=True)(errorbar_to_minmax)
+    finite_mean_std = numba.njit(cache=True)(finite_mean_std)
+    filter_dev = numba.njit(cache=True)(filter_dev)
+    gauss_pdf = numba.njit(cache=True)(gauss_pdf)
+    minmax = numba.njit(cache=True)(minmax)
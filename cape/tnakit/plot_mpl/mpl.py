@@ -16,15 +16,14 @@ It also includes syntax to import modules without raising
 
 # Standard library modules
 import os
+import sys
+import weakref
 
 # Required third-party modules
 import numpy as np
 
 # TNA toolkit modules
 import cape.tnakit.kwutils as kwutils
-import cape.tnakit.optitem as optitem
-import cape.tnakit.rstutils as rstutils
-import cape.tnakit.statutils as statutils
 import cape.tnakit.typeutils as typeutils
 
 # Local modules
@@ -43,6 +42,40 @@ mplfig = object()
 Axes = object()
 Figure = object()
 
+# Bound pyplot functions for current figure and axes
+_gca = None
+_gcf = None
+
+# Flags for completed imports
+_MPL_READY = False
+_PYPLOT_READY = False
+
+# Renderer and its size/dpi for each figure
+_RENDERER_CACHE = weakref.WeakKeyDictionary()
+# Renderer size/dpi with which each axes was last drawn
+_DRAWN_AXES = weakref.WeakKeyDictionary()
+
+# Processed options for repeated plot()/imshow() calls with same *kw*
+_OPTS_CACHE = {}
+# Maximum number of cached option sets
+_OPTS_CACHE_SIZE = 128
+# Option value types that can be used in *_OPTS_CACHE* keys
+_OPTS_CACHE_TYPES = (bool, int, float, typeutils.strlike, type(None))
+
+# Image arrays read by _imread(), keyed by file name and mod time
+_IMREAD_CACHE = {}
+# Maximum number of cached images
+_IMREAD_CACHE_SIZE = 32
+
+# Setter methods, like ``Figure.set_dpi``, by class and property name
+_SETTER_CACHE = {}
+
+# Options that can be used by axes_adjust*() without further checks
+_MARGIN_KEYS = {
+    sec: frozenset(MPLOpts._optlists[sec])
+    for sec in ("axadjust", "axadjust_col", "axadjust_row")
+}
+
 
 # Import :mod:`matplotlib`
 def _import_matplotlib():
@@ -58,6 +91,7 @@ def _import_matplotlib():
         >>> _import_matplotlib()
     :Versions:
         * 2019-08-22 ``@ddalle``: Documented first version
+        * 2026-10-16 ``@agent``: Use *_MPL_READY* flag
     """
     # Make global variables
     global mpl
@@ -65,8 +99,9 @@ def _import_matplotlib():
     global mplfig
     global Axes
     global Figure
+    global _MPL_READY
     # Exit if already imported
-    if isinstance(mpl, mod):
+    if _MPL_READY:
         return
     # Import module
     try:
@@ -82,6 +117,8 @@ def _import_matplotlib():
     if (os.name != "nt") and (os.environ.get("DISPLAY") is None):
         # Not on Windows and no display: no window to create fig
         mpl.use("Agg")
+    # Mark successful import
+    _MPL_READY = True
 
 
 # Import :mod:`matplotlib`
@@ -99,11 +136,15 @@ def _import_pyplot():
         * :func:`import_matplotlib`
     :Versions:
         * 2019-08-22 ``@ddalle``: Documented first version
+        * 2026-10-16 ``@agent``: Use *_PYPLOT_READY* flag
     """
     # Make global variables
     global plt
+    global _gca
+    global _gcf
+    global _PYPLOT_READY
     # Exit if already imported
-    if isinstance(plt, mod):
+    if _PYPLOT_READY:
         return
     # Otherwise, import matplotlib first
     _import_matplotlib()
@@ -112,11 +153,17 @@ def _import_pyplot():
         import matplotlib.pyplot as plt
     except ImportError:
         return
+    # Bind functions used to get current figure and axes
+    _gca = plt.gca
+    _gcf = plt.gcf
+    # Mark successful import
+    _PYPLOT_READY = True
 
 
 # Close a figure
 def close(fig=None):
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     plt.close(fig)
 
 
@@ -234,11 +281,10 @@ def plot(xv, yv, fmt=None, **kw):
     :Versions:
         * 2019-03-04 ``@ddalle``: First version
         * 2020-01-24 ``@ddalle``: Moved to :mod:`plot_mpl.mpl`
+        * 2026-10-16 ``@agent``: Use :func:`_cached_options`
     """
     # Process options
-    opts = MPLOpts(_section="plot", **kw)
-    # Get plot options
-    kw_p = opts.plot_options()
+    kw_p = _cached_options("plot", kw)
     # Call root function
     return _plot(xv, yv, fmt=fmt, **kw_p)
 
@@ -264,15 +310,97 @@ def semilogy(xv, yv, fmt=None, **kw):
             List of line instances
     :Versions:
         * 2021-01-05 ``@ddalle``: Version 1.0; fork from plot()
+        * 2026-10-16 ``@agent``: Version 1.1; cache options
     """
     # Process options
-    opts = MPLOpts(_section="plot", **kw)
-    # Get plot options
-    kw_p = opts.plot_options()
+    kw_p = _cached_options("plot", kw)
     # Call root function
     return _semilogy(xv, yv, fmt=fmt, **kw_p)
 
 
+# Process options for one section, reusing results for same *kw*
+def _cached_options(sec, kw):
+    r"""Get processed options for one section with caching
+
+    Results are cached only if all keys of *kw* are plain options for
+    section *sec* and all values are scalars of the correct type.  Any
+    other call, for example one that would print a warning about an
+    unrecognized keyword, is processed fresh every time.
+
+    :Call:
+        >>> kw_p = _cached_options(sec, kw)
+    :Inputs:
+        *sec*: ``"plot"`` | ``"imshow"`` | :class:`str`
+            Name of section, such that ``MPLOpts.<sec>_options()`` exists
+        *kw*: :class:`dict`
+            Raw keyword arguments
+    :Outputs:
+        *kw_p*: :class:`dict`
+            Copy of options from ``MPLOpts(**kw).<sec>_options()``
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check if *kw* can be used as a cache key
+    if _check_cache_opts(sec, kw):
+        # Include types so that ``True`` and ``1`` differ
+        key = (sec, frozenset((k, type(v), v) for k, v in kw.items()))
+    else:
+        key = None
+    # Check for cached options
+    kw_p = _OPTS_CACHE.get(key)
+    # Process options if needed
+    if kw_p is None:
+        # Process options
+        opts = MPLOpts(_section=sec, **kw)
+        # Get options for *sec*
+        kw_p = getattr(opts, "%s_options" % sec)()
+        # Save them
+        if key is not None:
+            # Limit size of cache
+            if len(_OPTS_CACHE) >= _OPTS_CACHE_SIZE:
+                _OPTS_CACHE.clear()
+            # Save
+            _OPTS_CACHE[key] = kw_p
+    # Output a copy so callers can't modify cached options
+    return kwutils._copy_section(kw_p)
+
+
+# Check if options can be processed using cached results
+def _check_cache_opts(sec, kw):
+    r"""Check if *kw* has only scalar, plain options for section *sec*
+
+    :Call:
+        >>> q = _check_cache_opts(sec, kw)
+    :Inputs:
+        *sec*: :class:`str`
+            Name of options section
+        *kw*: :class:`dict`
+            Raw keyword arguments
+    :Outputs:
+        *q*: ``True`` | ``False``
+            Whether processed options for *kw* can be cached
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Options for this section
+    optlist = MPLOpts._optlists.get(sec, ())
+    # Loop through options
+    for (k, v) in kw.items():
+        # Only cache scalars
+        if not isinstance(v, _OPTS_CACHE_TYPES):
+            return False
+        # Check for recognized option (no alias or unknown key)
+        if k not in optlist:
+            return False
+        # Get required type, if any
+        t = MPLOpts._opttypes.get(k)
+        # Check type unless ``None``
+        if v is not None and t is not None and not isinstance(v, t):
+            return False
+    # All options checked
+    return True
+
+
 # Contour function with options check
 def contour(xv, yv, zv, **kw):
     r"""Call the :func:`contour` function with cycling options
@@ -416,11 +544,10 @@ def imshow(png, **kw):
     :Versions:
         * 2020-01-09 ``@ddalle``: First version
         * 2020-01-27 ``@ddalle``: From :mod:`plot_mpl`
+        * 2026-10-16 ``@agent``: Use :func:`_cached_options`
     """
     # Process opts
-    opts = MPLOpts(_section="imshow", **kw)
-    # Get opts for imshow
-    kw = opts.imshow_options()
+    kw = _cached_options("imshow", kw)
     # Use basic function
     return _imshow(png, **kw)
 
@@ -491,9 +618,10 @@ def axes_adjust(fig=None, **kw):
     :Versions:
         * 2020-01-03 ``@ddalle``: First version
         * 2010-01-10 ``@ddalle``: Add support for ``"equal"`` aspect
+        * 2026-10-16 ``@agent``: Skip checks for plain margin keys
     """
     # Get options
-    opts = MPLOpts(_section="axadjust", **kw)
+    opts = _fast_margin_opts("axadjust", kw)
     # Call root function
     return _axes_adjust(fig, **opts)
 
@@ -511,11 +639,12 @@ def axes_adjust_col(fig, **kw):
     :Versions:
         * 2020-01-10 ``@ddalle``: First version
         * 2020-01-27 ``@ddalle``: Added options checks
+        * 2026-10-16 ``@agent``: Skip checks for plain margin keys
     """
     # Get options
-    opts = MPLOpts(_section="axadjust_col", **kw)
+    opts = _fast_margin_opts("axadjust_col", kw)
     # Call root function
-    return _axes_adjust_col(fig, **kw)
+    return _axes_adjust_col(fig, **opts)
 
 
 # Co-align a row of axes
@@ -531,11 +660,71 @@ def axes_adjust_row(fig, **kw):
     :Versions:
         * 2020-01-10 ``@ddalle``: First version
         * 2020-01-27 ``@ddalle``: Added options checks
+        * 2026-10-16 ``@agent``: Skip checks for plain margin keys
     """
     # Get options
-    opts = MPLOpts(_section="axadjust_row", **kw)
+    opts = _fast_margin_opts("axadjust_row", kw)
     # Call root function
-    return _axes_adjust_row(fig, **kw)
+    return _axes_adjust_row(fig, **opts)
+
+
+# Move several axes with at most one interactive redraw
+def _set_positions(fig, ax_list, positions):
+    r"""Set positions of several axes with one interactive redraw
+
+    :Call:
+        >>> _set_positions(fig, ax_list, positions)
+    :Inputs:
+        *fig*: :class:`Figure`
+            Figure handle
+        *ax_list*: :class:`list`\ [:class:`Axes`]
+            Axes to move
+        *positions*: :class:`list`\ [:class:`list`\ [:class:`float`]]
+            New ``[xmin, ymin, w, h]`` for each axes in *ax_list*
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Set each position
+    for (ax, pos) in zip(ax_list, positions):
+        ax.set_position(pos)
+    # Single redraw
+    if mpl.is_interactive():
+        fig.canvas.draw_idle()
+
+
+# Process options for axes_adjust*() functions
+def _fast_margin_opts(sec, kw):
+    r"""Process options for an *axes_adjust* section, quickly if possible
+
+    If all keys of *kw* are plain options for that section and no value
+    is ``None`` or of the wrong type, *kw* is returned directly instead
+    of constructing a :class:`MPLOpts`.
+
+    :Call:
+        >>> opts = _fast_margin_opts(sec, kw)
+    :Inputs:
+        *sec*: ``"axadjust"`` | ``"axadjust_col"`` | ``"axadjust_row"``
+            Name of options section
+        *kw*: :class:`dict`
+            Keyword arguments to process
+    :Outputs:
+        *opts*: :class:`dict` | :class:`MPLOpts`
+            Options for section *sec*
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for only recognized keys
+    if not _MARGIN_KEYS[sec].issuperset(kw):
+        return MPLOpts(_section=sec, **kw)
+    # Check values; ``None`` must be removed and types checked
+    for (k, v) in kw.items():
+        # Get required type, if any
+        t = MPLOpts._opttypes.get(k)
+        # Use full processing for ``None`` or unexpected type
+        if v is None or (t is not None and not isinstance(v, t)):
+            return MPLOpts(_section=sec, **kw)
+    # Plain options of correct types
+    return kw
 
 
 # Autoscale axes plot window height
@@ -730,11 +919,12 @@ def get_axes(ax=None):
         * 2021-12-16 ``@ddalle``: Version 1.0
     """
     # Make sure pyplot is present
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default figure
     if ax is None:
         # Get most recent figure or create
-        return plt.gca()
+        return _gca()
     elif isinstance(ax, (int, Figure)):
         # Got a figure instead
         fig = get_figure(fig)
@@ -764,11 +954,12 @@ def get_figure(fig=None):
         * 2020-04-02 ``@ddalle``: First version
     """
     # Make sure pyplot is present
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default figure
     if fig is None:
         # Get most recent figure or create
-        fig = plt.gcf()
+        fig = _gcf()
     elif isinstance(fig, int):
         # Get figure handle from number
         fig = plt.figure(fig)
@@ -794,9 +985,11 @@ def _axes(**kw):
     :Versions:
         * 2019-03-06 ``@ddalle``: First version
         * 2020-01-24 ``@ddalle``: Moved to :mod:`plot_mpl.mpl`
+        * 2026-10-16 ``@agent``: Use :func:`_get_setter`; skip unknown
     """
     # Import PyPlot
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get figure handle and other options
     ax = kw.get("ax", None)
     axopts = kw.get("AxesOptions", {})
@@ -807,7 +1000,7 @@ def _axes(**kw):
         # Check for specified figure
         if axnum is None:
             # Use most recent figure (can be new one)
-            ax = plt.gca()
+            ax = _gca()
         else:
             # Get specified figure
             ax = plt.subplot(axnum)
@@ -817,17 +1010,48 @@ def _axes(**kw):
         if not v:
             continue
         # Get setter function
-        fn = getattr(ax, "set_" + k, None)
+        fn = _get_setter(type(ax), k)
         # Check property
         if fn is None:
             sys.stderr.write("No axes property '%s'\n" % k)
             sys.stderr.flush()
+            continue
         # Apply setter
-        fn(v)
+        fn(ax, v)
     # Output
     return ax
 
 
+# Get setter method for a property
+def _get_setter(cls, k):
+    r"""Get ``set_<k>`` method of a class, remembering the result
+
+    :Call:
+        >>> fn = _get_setter(cls, k)
+    :Inputs:
+        *cls*: :class:`type`
+            Class such as :class:`Figure` or :class:`Axes`
+        *k*: :class:`str`
+            Name of property
+    :Outputs:
+        *fn*: ``None`` | :class:`function`
+            Unbound setter, called as ``fn(obj, v)``
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Cache key
+    key = (cls, k)
+    # Check for previous lookup, including misses
+    if key in _SETTER_CACHE:
+        return _SETTER_CACHE[key]
+    # Look up setter
+    fn = getattr(cls, "set_" + k, None)
+    # Save it
+    _SETTER_CACHE[key] = fn
+    # Output
+    return fn
+
+
 # Manage single subplot extents
 def _axes_adjust(fig=None, **kw):
     r"""Manage margins of one axes handle
@@ -856,13 +1080,15 @@ def _axes_adjust(fig=None, **kw):
         * 2020-01-03 ``@ddalle``: First version
         * 2020-01-10 ``@ddalle``: Add support for ``"equal"`` aspect
         * 2020-04-23 ``@ddalle``: Process neighboring axes
+        * 2026-10-16 ``@agent``: Check for multiple axes before margins
     """
     # Make sure pyplot is present
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default figure
     if fig is None:
         # Get most recent figure or create
-        fig = plt.gcf()
+        fig = _gcf()
     elif isinstance(fig, int):
         # Get figure handle from number
         fig = plt.figure(fig)
@@ -892,11 +1118,18 @@ def _axes_adjust(fig=None, **kw):
         # Check for index
         if subplot_i is None:
             # Get most recent axes
-            ax = plt.gca()
-            # Reset axes list
-            ax_list = fig.get_axes()
-            # Get index
-            subplot_i = ax_list.index(ax) + 1
+            ax = _gca()
+            # Check if it's an existing axes in *fig*
+            if ax in ax_list:
+                # Get index
+                subplot_i = ax_list.index(ax) + 1
+            elif ax.figure is fig:
+                # New axes created by gca()
+                ax_list.append(ax)
+                subplot_i = len(ax_list)
+            else:
+                # Current axes from different figure
+                raise ValueError("Current axes is not in figure 'fig'")
         elif not isinstance(subplot_i, int):
             # Must be an integer
             raise TypeError(
@@ -918,48 +1151,33 @@ def _axes_adjust(fig=None, **kw):
     else:
         # Get subplot index (1-based index)
         subplot_i = ax_list.index(ax) + 1
+    # Check for multiple axes
+    if len(ax_list) > 1:
+        # Note that there is ample code for subplots below.
+        # It doesn't seem to be relevant but might be removed.
+        return
     # Figure out subplot column and row index from counts (0-based)
-    subplot_j = (subplot_i - 1) // subplot_n
-    subplot_k = (subplot_i - 1) % subplot_n
+    subplot_j, subplot_k = divmod(subplot_i - 1, subplot_n)
     # Get sizes of all tick and axes labels
     label_wl, label_hb, label_wr, label_ht = get_axes_label_margins(ax)
     # Get information on neighboring axes
     ax_margins, neighbors = get_axes_neighbors(ax)
     # Unpack axes margins
-    axes_wl, axes_hb, axes_wr, axes_ht = ax_margins 
-    # Process width and height
+    axes_wl, axes_hb, axes_wr, axes_ht = ax_margins
+    # Process width and height (also row and column space available)
     ax_w = 1.0 - label_wr - label_wl - axes_wr - axes_wl
     ax_h = 1.0 - label_ht - label_hb - axes_ht - axes_hb
-    # Process row and column space available
-    ax_rowh = ax_h
-    ax_colw = ax_w
     # Default margins (no tight_layout yet)
-    adj_b = label_hb + subplot_j * ax_rowh
-    adj_l = label_wl + subplot_k * ax_colw
-    adj_r = adj_l + ax_colw
-    adj_t = adj_b + ax_rowh
-    # Get extra margins
-    margin_b = kw.get("MarginBottom", 0.02)
-    margin_l = kw.get("MarginLeft", 0.02)
-    margin_r = kw.get("MarginRight", 0.015)
-    margin_t = kw.get("MarginTop", 0.015)
-    # Apply to minimum margins
-    adj_b += margin_b
-    adj_l += margin_l
-    adj_r -= margin_r
-    adj_t -= margin_t
-    # Get user options
-    adj_b = kw.get("AdjustBottom", adj_b)
-    adj_l = kw.get("AdjustLeft", adj_l)
-    adj_r = kw.get("AdjustRight", adj_r)
-    adj_t = kw.get("AdjustTop", adj_t)
+    adj_b = label_hb + subplot_j*ax_h
+    adj_l = label_wl + subplot_k*ax_w
+    # Apply extra margins unless user specified edge directly
+    adj_t = kw.get("AdjustTop", adj_b + ax_h - kw.get("MarginTop", 0.015))
+    adj_r = kw.get(
+        "AdjustRight", adj_l + ax_w - kw.get("MarginRight", 0.015))
+    adj_b = kw.get("AdjustBottom", adj_b + kw.get("MarginBottom", 0.02))
+    adj_l = kw.get("AdjustLeft", adj_l + kw.get("MarginLeft", 0.02))
     # Get current position of axes
     x0, y0, w0, h0 = ax.get_position().bounds
-    # Check for multiple axes
-    if len(ax_list) > 1:
-        # Note that there is ample code for subplots below.
-        # It doesn't seem to be relevant but might be removed.
-        return
     # Keep same bottom edge if not specified
     if adj_b is None:
         adj_b = y0
@@ -1082,11 +1300,12 @@ def _axes_adjust_col(fig, **kw):
         * 2020-01-27 ``@ddalle``: Added options checks
     """
     # Make sure pyplot is present
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default figure
     if fig is None:
         # Get most recent figure or create
-        fig = plt.gcf()
+        fig = _gcf()
     elif isinstance(fig, int):
         # Get figure handle from number
         fig = plt.figure(fig)
@@ -1094,8 +1313,8 @@ def _axes_adjust_col(fig, **kw):
         # Not a figure or number
         raise TypeError(
             "'fig' arg expected 'int' or 'Figure' (got %s)" % type(fig))
-    # Process options
-    opts = MPLOpts(**kw)
+    # Options already processed by public function
+    opts = kw
     # Get axes from figure
     ax_all = fig.get_axes()
     # Get list of figures
@@ -1107,18 +1326,26 @@ def _axes_adjust_col(fig, **kw):
         # Get middle *y* coordinate for sorting
         y0 = [extent[1] + 0.5*extent[3] for extent in extents]
         # Sort by descending *y0*
-        subplot_list = list(np.argsort(y0) + 1)
+        subplot_list = np.argsort(y0) + 1
+    # Ensure a tuple of ints (user may give any iterable)
+    subplot_list = tuple(int(i) for i in subplot_list)
     # Get the list of axes
     ax_list = [ax_all[i-1] for i in subplot_list]
+    # Number of axes in col
+    nrows = len(ax_list)
+    # Initialize current extents and ``axis("equal")`` flags
+    extents = np.zeros((nrows, 4))
+    mask = np.zeros(nrows, dtype="bool")
+    # Get both in one pass through axes
+    for (j, ax) in enumerate(ax_list):
+        extents[j] = ax.get_position().bounds
+        mask[j] = ax.get_aspect() != "auto"
     # Get index of ax to use for vertical rubber
     subplot_rubber = kw.get("SubplotRubber")
     # Default flexible subplot
     if subplot_rubber is None:
-        # Get the ones with ``axis("equal")`` turned on
-        ax_auto = [
-            j for (j, ax) in enumerate(ax_list)
-            if ax.get_aspect() == "auto"
-        ]
+        # Get the ones without ``axis("equal")``
+        ax_auto = np.where(~mask)[0]
         # Check for any such figures
         if len(ax_auto) == 0:
             # Nothing to work with; oh boy!
@@ -1126,8 +1353,6 @@ def _axes_adjust_col(fig, **kw):
         else:
             # Use the last one that's not ``axis("equal")``
             subplot_rubber = ax_auto[-1]
-        # Get handle
-        ax_rubber = subplot_rubber
     elif isinstance(subplot_rubber, type(ax_list[0])):
         # Get handle
         ax_rubber = subplot_rubber
@@ -1149,18 +1374,12 @@ def _axes_adjust_col(fig, **kw):
             raise ValueError("Rubber subplot not in figure's subplot list")
         # Use axis directly
         subplot_rubber = ax_list.index(ax_rubber)
-    # Number of axes in col
-    nrows = len(ax_list)
     # Get the margins occupied by tick and axes labels
-    margins = [get_axes_label_margins(ax) for ax in ax_list]
+    margins = get_axes_label_margins_batch(ax_list)
     # Extract the sides
-    margins_l = [margin[0] for margin in margins]
-    margins_b = [margin[1] for margin in margins]
-    margins_r = [margin[2] for margin in margins]
-    margins_t = [margin[3] for margin in margins]
+    margins_l, margins_b, margins_r, margins_t = margins.T
     # Use the maximum margin for left and right
-    wa = max(margins_l)
-    wb = max(margins_r)
+    wa, _, wb, _ = margins.max(axis=0)
     # Get extra margins
     margin_b = opts.get("MarginBottom", 0.02)
     margin_l = opts.get("MarginLeft", 0.02)
@@ -1179,54 +1398,31 @@ def _axes_adjust_col(fig, **kw):
     adj_t = opts.get("AdjustTop", adj_t)
     # Shared axes width
     w_all = adj_r - adj_l
-    # Get current extents
-    extents = [ax.get_position().bounds for ax in ax_list]
-    # Deal with any axis("equal") subplots
-    for (j, ax) in enumerate(ax_list):
-        # Check for rubber axes
-        if ax is ax_rubber:
-            # Remember index
-            j_rubber = j
-        # Check for aspect ratio
-        if ax.get_aspect() == "auto":
-            # No adjustments necessary
-            continue
-        # Otherwise, get current position spec
-        xminj, yminj, wj, hj = extents[j]
-        # Expand (or shrink) current height
-        hj = hj * (w_all / wj)
-        # Recreate extents (can't change existing tuple)
-        extents[j] = (xminj, yminj, wj, hj)
+    # Expand (or shrink) height of any axis("equal") subplots
+    extents[mask, 3] *= w_all / extents[mask, 2]
     # Measure all the current figure heights
-    h_list = [pos[3] for pos in extents]
+    h_list = extents[:, 3]
     # Total vertical space occupied by fixed plots
-    h_fixed = sum(h_list) - h_list[j_rubber]
+    h_fixed = h_list.sum() - h_list[subplot_rubber]
     # Add in required vertical text space
     if nrows > 1:
-        h_fixed += sum(margins_b[1:]) + sum(margins_t[:-1])
+        h_fixed += margins_b[1:].sum() + margins_t[:-1].sum()
     # Add in vertical margins between subplots
     h_fixed += margin_v * (nrows-1)
     # Calculate vertical extent for the rubber plot
     h_rubber = adj_t - adj_b - h_fixed
-    # Initialize cumulative vertical coordinate
-    ymin = adj_b - margins_b[0]
-    # Loop through axes
-    for (j, ax) in enumerate(ax_list):
-        # Check if it's the rubber plot
-        if ax is ax_rubber:
-            # Use the previously calculated height
-            hj = h_rubber
-        else:
-            # Use the current extent
-            hj = extents[j][3]
-        # Add bottom text margin
-        ymin += margins_b[j]
-        # Set position
-        ax.set_position([adj_l, ymin, w_all, hj])
-        # Add top text margin and vspace
-        ymin += margins_t[j] + margin_v
-        # Add plot extent
-        ymin += hj
+    # Final heights, using calculated height for the rubber plot
+    h_list[subplot_rubber] = h_rubber
+    # Space from bottom of each plot to bottom of next one
+    dy = margins_t + margin_v + h_list
+    # Bottom edge of each plot
+    ymin = adj_b - margins_b[0] + np.cumsum(margins_b)
+    ymin[1:] += np.cumsum(dy[:-1])
+    # Set positions
+    _set_positions(
+        fig, ax_list, [
+            [adj_l, yj, w_all, hj] for (yj, hj) in zip(ymin, h_list)
+        ])
 
 
 # Co-align a row of axes
@@ -1245,11 +1441,12 @@ def _axes_adjust_row(fig, **kw):
         * 2020-01-27 ``@ddalle``: Added options checks
     """
     # Make sure pyplot is present
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default figure
     if fig is None:
         # Get most recent figure or create
-        fig = plt.gcf()
+        fig = _gcf()
     elif isinstance(fig, int):
         # Get figure handle from number
         fig = plt.figure(fig)
@@ -1257,41 +1454,45 @@ def _axes_adjust_row(fig, **kw):
         # Not a figure or number
         raise TypeError(
             "'fig' arg expected 'int' or 'Figure' (got %s)" % type(fig))
-    # Process options
-    opts = MPLOpts(**kw)
+    # Options already processed by public function
+    opts = kw
     # Get axes from figure
-    ax_list = fig.get_axes()
-    # Number of axes
-    nax = len(ax_list)
+    ax_all = fig.get_axes()
     # Get list of figures
     subplot_list = kw.get("SubplotList")
     # Default order
     if subplot_list is None:
         # Get current extents
-        extents = [ax_list[i].get_position().bounds for i in range(nax)]
-        # Get middle *y* coordinate for sorting
-        y0 = [extent[0] + 0.5*extent[2] for extent in extents]
+        extents = [ax.get_position().bounds for ax in ax_all]
+        # Get middle *x* coordinate for sorting
+        x0 = [extent[0] + 0.5*extent[2] for extent in extents]
         # Sort
-        subplot_list = list(np.argsort(y0) + 1)
-    # Get index of ax to use for vertical rubber
+        subplot_list = np.argsort(x0) + 1
+    # Ensure a tuple of ints (user may give any iterable)
+    subplot_list = tuple(int(i) for i in subplot_list)
+    # Get the list of axes
+    ax_list = [ax_all[i-1] for i in subplot_list]
+    # Number of axes in row
+    ncols = len(ax_list)
+    # Initialize current extents and ``axis("equal")`` flags
+    extents = np.zeros((ncols, 4))
+    mask = np.zeros(ncols, dtype="bool")
+    # Get both in one pass through axes
+    for (j, ax) in enumerate(ax_list):
+        extents[j] = ax.get_position().bounds
+        mask[j] = ax.get_aspect() != "auto"
+    # Get index (in *subplot_list*) of ax to use for horizontal rubber
     subplot_rubber = kw.get("SubplotRubber", -1)
-    # Adjust for 1-based index
+    # Adjust for 1-based index and convert to nonnegative index
     if subplot_rubber > 0:
         subplot_rubber -= 1
-    # Get handle
-    ax_rubber = ax_list[subplot_list[subplot_rubber]]
-    # Number of axes in row
-    ncols = len(subplot_list)
+    subplot_rubber %= ncols
     # Get the margins occupied by tick and axes labels
-    margins = [get_axes_label_margins(ax_list[i-1]) for i in subplot_list]
+    margins = get_axes_label_margins_batch(ax_list)
     # Extract the sides
-    margins_l = [margin[0] for margin in margins]
-    margins_b = [margin[1] for margin in margins]
-    margins_r = [margin[2] for margin in margins]
-    margins_t = [margin[3] for margin in margins]
-    # Use the maximum margin for left and right
-    ha = max(margins_b)
-    hb = max(margins_t)
+    margins_l, margins_b, margins_r, margins_t = margins.T
+    # Use the maximum margin for bottom and top
+    _, ha, _, hb = margins.max(axis=0)
     # Get extra margins
     margin_b = opts.get("MarginBottom", 0.02)
     margin_l = opts.get("MarginLeft", 0.02)
@@ -1309,59 +1510,32 @@ def _axes_adjust_row(fig, **kw):
     adj_r = opts.get("AdjustRight", adj_r)
     adj_t = opts.get("AdjustTop", adj_t)
     # Shared axes height
-    h_all = adj_r - adj_l
-    # Get current extents
-    extents = [ax_list[i-1].get_position().bounds for i in subplot_list]
-    # Deal with any axis("equal") subplots
-    for (j, i) in enumerate(subplot_list):
-        # Get axes
-        ax = ax_list[i-1]
-        # Check for rubber axes
-        if ax is ax_rubber:
-            # Remember index
-            j_rubber = j
-        # Check for aspect ratio
-        if ax.get_aspect() == "auto":
-            # No adjustments necessary
-            continue
-        # Otherwise, get current position spec
-        xminj, yminj, wj, hj = extents[j]
-        # Expand (or shrink) current height
-        wj = wj * (h_all / hj)
-        # Recreate extents (can't change existing tuple)
-        extents[j] = (xminj, yminj, wj, hj)
+    h_all = adj_t - adj_b
+    # Expand (or shrink) width of any axis("equal") subplots
+    extents[mask, 2] *= h_all / extents[mask, 3]
     # Measure all the current figure widths
-    w_list = [pos[2] for pos in extents]
-    # Total vertical space occupied by fixed plots
-    w_fixed = sum(w_list) - w_list[j_rubber]
+    w_list = extents[:, 2]
+    # Total horizontal space occupied by fixed plots
+    w_fixed = w_list.sum() - w_list[subplot_rubber]
     # Add in required vertical text space
     if ncols > 1:
-        w_fixed += sum(margins_l[1:]) + sum(margins_r[:-1])
+        w_fixed += margins_l[1:].sum() + margins_r[:-1].sum()
     # Add in vertical margins between subplots
     w_fixed += margin_h * (ncols-1)
     # Calculate vertical extent for the rubber plot
     w_rubber = adj_r - adj_l - w_fixed
-    # Initialize cumulative vertical coordinate
-    xmin = adj_l - margins_l[0]
-    # Loop through axes
-    for (j, i) in enumerate(subplot_list):
-        # Get axes
-        ax = ax_list[i-1]
-        # Check if it's the rubber plot
-        if ax is ax_rubber:
-            # Use the previously calculated height
-            wj = w_rubber
-        else:
-            # Use the current extent
-            wj = extents[j][2]
-        # Add bottom text margin
-        xmin += margins_l[j]
-        # Set position
-        ax.set_position([xmin, adj_b, wj, h_all])
-        # Add top text margin and vspace
-        xmin += margins_r[j] + margin_h
-        # Add plot extent
-        xmin += wj
+    # Final widths, using calculated width for the rubber plot
+    w_list[subplot_rubber] = w_rubber
+    # Space from left edge of each plot to left edge of next one
+    dx = margins_r + margin_h + w_list
+    # Left edge of each plot
+    xmin = adj_l - margins_l[0] + np.cumsum(margins_l)
+    xmin[1:] += np.cumsum(dx[:-1])
+    # Set positions
+    _set_positions(
+        fig, ax_list, [
+            [xj, adj_b, wj, h_all] for (xj, wj) in zip(xmin, w_list)
+        ])
 
 
 # Autoscale axes
@@ -1387,7 +1561,7 @@ def _axes_autoscale_height(ax=None, **kw):
     """
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.get_figure()
     # Aspect ratio of the figure
@@ -1432,7 +1606,7 @@ def _axes_autoscale_width(ax=None, **kw):
     """
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.get_figure()
     # Aspect ratio of the figure
@@ -1476,7 +1650,8 @@ def _axes_format(ax, **kw):
     """
    # --- Prep ---
     # Make sure pyplot loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
    # --- Labels ---
     # Get user-specified axis labels
     xlbl = kw.get("XLabel", None)
@@ -1581,10 +1756,11 @@ def _axlabel(ax, lbl, pos=None, **kw):
         * 2020-04-29 ``@ddalle``: First version
     """
     # Import module
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # Options for spacing as figure fraction [inches]
@@ -1828,6 +2004,41 @@ def _axlabel(ax, lbl, pos=None, **kw):
     return h
 
 
+# Convert scalar or array plot input
+def _as_broadcast(x, ref, name):
+    r"""Convert scalar or array input to an array matching *ref*
+
+    :Call:
+        >>> v = _as_broadcast(x, ref, name)
+    :Inputs:
+        *x*: ``None`` | :class:`float` | :class:`int` | :class:`list`
+            Scalar value or array of values
+        *ref*: :class:`np.ndarray` | :class:`list`
+            Values whose shape scalar *x* should take
+        *name*: :class:`str`
+            Name of input for error messages
+    :Outputs:
+        *v*: ``None`` | :class:`np.ndarray`
+            Read-only broadcast view if *x* is scalar, else array
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check type
+    if x is None:
+        # Pass through missing value
+        return None
+    elif isinstance(x, (float, int, np.floating, np.integer)):
+        # Broadcast scalar to array (view, no copy)
+        return np.broadcast_to(np.float64(x), np.shape(ref))
+    elif typeutils.isarray(x):
+        # Ensure array (not list, etc.)
+        return np.asarray(x)
+    # Bad type
+    raise TypeError(
+        "'%s' value must be either None, float, or array (got %s)"
+        % (name, x.__class__))
+
+
 # Error bar plot
 def _errorbar(xv, yv, yerr=None, xerr=None, **kw):
     r"""Call the :func:`errorbar` function
@@ -1858,36 +2069,13 @@ def _errorbar(xv, yv, yerr=None, xerr=None, **kw):
     """
    # --- Values ---
     # Convert possible scalar for *yerr*
-    if yerr is None:
-        # No vertical uncertainty (?)
-        uy = None
-    elif isinstance(yerr, float):
-        # Expand scalar to array
-        uy = yerr*np.ones_like(yv)
-    elif typeutils.isarray(yerr):
-        # Ensure array (not list, etc.)
-        uy = np.asarray(yerr)
-    else:
-        raise TypeError(
-            ("'yerr' value must be either float or array ") +
-            ("(got %s)" % yerr.__class__))
-    # Convert possible scalar for *ymax*
-    if xerr is None:
-        # No horizontal uncertainty
-        ux = None
-    elif isinstance(xerr, float):
-        # Expand scalar to array
-        ux = xerr*np.ones_like(xv)
-    elif typeutils.isarray(xerr):
-        # Ensure array (not list, etc.)
-        ux = np.asarray(xerr)
-    else:
-        raise TypeError(
-            ("'xerr' value must be either None, float, or array ") +
-            ("(got %s)" % yerr.__class__))
+    uy = _as_broadcast(yerr, yv, "yerr")
+    # Convert possible scalar for *xerr*
+    ux = _as_broadcast(xerr, xv, "xerr")
    # --- Main ---
     # Ensure fill_between() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("Index", kw.pop("i", 0))
     # Get rotation option
@@ -1917,9 +2105,11 @@ def _figure(**kw):
             Figure handle
     :Versions:
         * 2019-03-06 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Use :func:`_get_setter`; skip unknown
     """
     # Import PyPlot
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get figure handle and other options
     fig = kw.get("fig", None)
     figopts = kw.get("FigOptions", {})
@@ -1930,7 +2120,7 @@ def _figure(**kw):
         # Check for specified figure
         if fignum is None:
             # Use most recent figure (can be new one)
-            fig = plt.gcf()
+            fig = _gcf()
         else:
             # Get specified figure
             fig = plt.figure(fignum)
@@ -1940,13 +2130,14 @@ def _figure(**kw):
         if not v:
             continue
         # Get setter function
-        fn = getattr(fig, "set_" + k, None)
+        fn = _get_setter(type(fig), k)
         # Check property
         if fn is None:
             sys.stderr.write("No figure property '%s'\n" % k)
             sys.stderr.flush()
+            continue
         # Apply setter
-        fn(v)
+        fn(fig, v)
     # Output
     return fig
 
@@ -1973,11 +2164,12 @@ def _colorbar(ax=None, **kw):
         * 2020-05-06 ``@ddalle``: Forked :func:`_colorbar_rm`
     """
     # Make sure pyplot loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Gte axes
     if ax is None:
         # Assume current figure can be used
-        ax = plt.gca()
+        ax = _gca()
     # Get figure handle
     fig = ax.figure
     # Remove any existing colorbars
@@ -2001,11 +2193,12 @@ def _colorbar_rm(ax=None):
         * 2020-05-06 ``@ddalle``: First version
     """
     # Make sure pyplot loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Gte axes
     if ax is None:
         # Assume current figure can be used
-        ax = plt.gca()
+        ax = _gca()
     # Get figure handle
     fig = ax.figure
     # Loop through all axes to check for other color bars
@@ -2049,30 +2242,13 @@ def _fill_between(xv, ymin, ymax, **kw):
     """
    # --- Values ---
     # Convert possible scalar for *ymin*
-    if isinstance(ymin, float):
-        # Expand scalar to array
-        yl = ymin * np.ones_like(xv)
-    elif typeutils.isarray(ymin):
-        # Ensure array (not list, etc.)
-        yl = np.asarray(ymin)
-    else:
-        raise TypeError(
-            ("'ymin' value must be either float or array ") +
-            ("(got %s)" % ymin.__class__))
+    yl = _as_broadcast(ymin, xv, "ymin")
     # Convert possible scalar for *ymax*
-    if isinstance(ymax, float):
-        # Expand scalar to array
-        yu = ymax * np.ones_like(xv)
-    elif typeutils.isarray(ymax):
-        # Ensure array (not list, etc.)
-        yu = np.asarray(ymax)
-    else:
-        raise TypeError(
-            ("'ymax' value must be either float or array ") +
-            ("(got %s)" % ymax.__class__))
+    yu = _as_broadcast(ymax, xv, "ymax")
    # --- Main ---
     # Ensure fill_between() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("i", kw.pop("Index", 0))
     # Get rotation option
@@ -2109,7 +2285,8 @@ def _grid(ax, **kw):
         * 2020-01-27 ``@ddalle``: From :func:`plot_mpl.grid`
     """
     # Make sure pyplot loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get major grid option
     major_grid = kw.get("Grid", None)
     # Check value
@@ -2146,6 +2323,42 @@ def _grid(ax, **kw):
         ax.grid(False, which="minor")
 
 
+# Read an image file
+def _imread(fpng):
+    r"""Read an image file, reusing array if file is unchanged
+
+    :Call:
+        >>> png = _imread(fpng)
+    :Inputs:
+        *fpng*: :class:`str`
+            Name of image file
+    :Outputs:
+        *png*: :class:`np.ndarray`
+            Read-only image array from :func:`plt.imread`
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Cache key; file name and modification time
+    key = (os.path.abspath(fpng), os.path.getmtime(fpng))
+    # Check for previous read
+    png = _IMREAD_CACHE.get(key)
+    # Read if needed
+    if png is None:
+        # Make sure modules are loaded
+        if not _PYPLOT_READY:
+            _import_pyplot()
+        # Read it and protect it from modification
+        png = plt.imread(fpng)
+        png.setflags(write=False)
+        # Limit size of cache
+        if len(_IMREAD_CACHE) >= _IMREAD_CACHE_SIZE:
+            _IMREAD_CACHE.clear()
+        # Save it
+        _IMREAD_CACHE[key] = png
+    # Output
+    return png
+
+
 # Show an image
 def _imshow(png, **kw):
     r"""Display an image
@@ -2166,106 +2379,122 @@ def _imshow(png, **kw):
     :Versions:
         * 2020-01-09 ``@ddalle``: First version
         * 2020-01-27 ``@ddalle``: From :mod:`plot_mpl`
+        * 2026-10-16 ``@agent``: Fix *png.ndim* check; use *ImageExtent*
     """
     # Make sure modules are loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
+    # Check input type; exact types first, then subclasses
+    tpng = type(png)
+    if tpng is np.ndarray:
+        # Image array
+        qarray = True
+    elif tpng is str:
+        # File name
+        qarray = False
+    elif isinstance(png, np.ndarray):
+        # Subclass of array
+        qarray = True
+    elif typeutils.isstr(png):
+        # Other string type
+        qarray = False
+    else:
+        # Bad type
+        raise TypeError("Image array must be NumPy array")
     # Process input
-    if typeutils.isstr(png):
+    if qarray:
+        # Check dimension
+        if png.ndim not in (2, 3):
+            raise ValueError(
+                "Image array must be 2D or 3D (got %i dims)" % png.ndim)
+    else:
         # Check if file exists
         if not os.path.isfile(png):
             raise SystemError("No PNG file '%s'" % png)
         # Read it
-        png = plt.imread(png)
-    elif not isinstance(png, np.ndarray):
-        # Bad type
-        raise TypeError("Image array must be NumPy array")
-    elif png.nd not in [2, 3]:
-        # Bad dimension
-        raise ValueError("Image array must be 2D or 3D (got %i dims)" % png.nd)
-    # Process image size
-    png_rows = png.shape[0]
-    png_cols = png.shape[1]
-    # Aspect ratio
-    png_ar = float(png_rows) / float(png_cols)
-    # Process input coordinates
-    xmin = kw.get("ImageXMin")
-    xmax = kw.get("ImageXMax")
-    ymin = kw.get("ImageYMin")
-    ymax = kw.get("ImageYMax")
-    # Middle coordinates if filling in
-    xmid = kw.get("ImageXCenter")
-    ymid = kw.get("ImageYCenter")
-    # Check both axes if either side is specified
-    x_nospec = (xmin is None) and (xmax is None)
-    y_nospec = (ymin is None) and (ymax is None)
-    # Fill in defaults
-    if x_nospec and y_nospec:
-        # All defaults
-        extent = (0, png_cols, png_rows, 0)
-    elif y_nospec:
-        # Check which side(s) specified
-        if xmin is None:
-            # Read *xmin* from right edge
-            xmin = xmax - png_cols
-        elif xmax is None:
-            # Read *xmax* from left edge
-            xmax = xmin + png_cols
-        # Specify default *y* values
-        yhalf = 0.5 * (xmax - xmin) * png_ar
-        # Create *y* window
-        if ymid is None:
-            # Use ``0``
-            ymin = -yhalf
-            ymax = yhalf
-        else:
-            # Use center
-            ymin = ymid - yhalf
-            ymax = ymid + yhalf
-        # Extents
-        extent = (xmin, xmax, ymin, ymax)
-    elif x_nospec:
-        # Check which side(s) specified
-        if ymin is None:
-            # Read *xmin* from right edge
-            ymin = ymax - png_rows
-        elif xmax is None:
-            # Read *xmax* from left edge
-            ymax = ymin + png_rows
-        # Scale *x* width
-        xwidth = (ymax - ymin) / png_ar
-        # Check for a center
-        if xmid is None:
-            # Use ``0`` for left edge
-            xmin = 0.0
-            xmax = xwidth
+        png = _imread(png)
+    # Check for directly specified extents
+    extent = kw.get("ImageExtent")
+    # Infer extents from image size and other options if needed
+    if extent is None:
+        # Process image size
+        png_rows, png_cols = png.shape[:2]
+        # Aspect ratio
+        png_ar = float(png_rows) / float(png_cols)
+        # Process input coordinates
+        xmin = kw.get("ImageXMin")
+        xmax = kw.get("ImageXMax")
+        ymin = kw.get("ImageYMin")
+        ymax = kw.get("ImageYMax")
+        # Middle coordinates if filling in
+        xmid = kw.get("ImageXCenter")
+        ymid = kw.get("ImageYCenter")
+        # Check both axes if either side is specified
+        x_nospec = (xmin is None) and (xmax is None)
+        y_nospec = (ymin is None) and (ymax is None)
+        # Fill in defaults
+        if x_nospec and y_nospec:
+            # All defaults
+            extent = (0, png_cols, png_rows, 0)
+        elif y_nospec:
+            # Check which side(s) specified
+            if xmin is None:
+                # Read *xmin* from right edge
+                xmin = xmax - png_cols
+            elif xmax is None:
+                # Read *xmax* from left edge
+                xmax = xmin + png_cols
+            # Specify default *y* values
+            yhalf = 0.5 * (xmax - xmin) * png_ar
+            # Create *y* window
+            if ymid is None:
+                # Use ``0``
+                ymin = -yhalf
+                ymax = yhalf
+            else:
+                # Use center
+                ymin = ymid - yhalf
+                ymax = ymid + yhalf
+            # Extents
+            extent = (xmin, xmax, ymin, ymax)
+        elif x_nospec:
+            # Check which side(s) specified
+            if ymin is None:
+                # Read *xmin* from right edge
+                ymin = ymax - png_rows
+            elif xmax is None:
+                # Read *xmax* from left edge
+                ymax = ymin + png_rows
+            # Scale *x* width
+            xwidth = (ymax - ymin) / png_ar
+            # Check for a center
+            if xmid is None:
+                # Use ``0`` for left edge
+                xmin = 0.0
+                xmax = xwidth
+            else:
+                # Use specified center
+                xmin = xmid - 0.5*xwidth
+                xmax = xmid + 0.5*xwidth
+            # Extents
+            extent = (xmin, xmax, ymin, ymax)
         else:
-            # Use specified center
-            xmin = xmid - 0.5*xwidth
-            xmax = xmid + 0.5*xwidth
-        # Extents
-        extent = (xmin, xmax, ymin, ymax)
-    else:
-        # Check which side(s) of *x* is(are) specified
-        if xmin is None:
-            # Read *xmin* from right edge
-            xmin = xmax - png_cols
-        elif xmax is None:
-            # Read *xmax* from left edge
-            xmax = xmin + png_cols
-        # Check which side(s) of *y* is(are) specified
-        if ymin is None:
-            # Read *xmin* from right edge
-            ymin = ymax - png_rows
-        elif xmax is None:
-            # Read *xmax* from left edge
-            ymax = ymin + png_rows
-        # Extents
-        extent = (xmin, xmax, ymin, ymax)
-    # Check for directly specified width
-    kw_extent = kw.get("ImageExtent")
-    # Override ``None``
-    if kw_extent is not None:
-        extent = kw_extent
+            # Check which side(s) of *x* is(are) specified
+            if xmin is None:
+                # Read *xmin* from right edge
+                xmin = xmax - png_cols
+            elif xmax is None:
+                # Read *xmax* from left edge
+                xmax = xmin + png_cols
+            # Check which side(s) of *y* is(are) specified
+            if ymin is None:
+                # Read *xmin* from right edge
+                ymin = ymax - png_rows
+            elif xmax is None:
+                # Read *xmax* from left edge
+                ymax = ymin + png_rows
+            # Extents
+            extent = (xmin, xmax, ymin, ymax)
     # Show the image
     img = plt.imshow(png, extent=extent)
     # Output
@@ -2292,10 +2521,11 @@ def _legend(ax=None, **kw):
     """
    # --- Setup ---
     # Import modules if needed
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axis: most recent
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Assume no legend until a label is found, or override
     show_legend = False
     # Check for labels
@@ -2371,7 +2601,7 @@ def _legend(ax=None, **kw):
     # Get location
     loc = kw.get("loc")
     # Check for special cases
-    if loc in ["upper center", 9]:
+    if loc in ("upper center", 9):
         # Check bottom of legend box
         if ylmin < ymax:
             # Get axes limits
@@ -2380,7 +2610,7 @@ def _legend(ax=None, **kw):
             yu = yb + max(0.0, ymax-ylmin)
             # Set new limits
             ax.set_ylim(ya, yu)
-    elif loc in ["lower center", 8]:
+    elif loc in ("lower center", 8):
         # Check top of legend box
         if ylmax > ymin:
             # Get axes limits
@@ -2422,7 +2652,8 @@ def _plot(xv, yv, fmt=None, **kw):
         * 2020-01-24 ``@ddalle``: Moved to :mod:`plot_mpl.mpl`
     """
     # Ensure plot() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("Index", kw.pop("i", 0))
     # Get rotation option
@@ -2470,7 +2701,8 @@ def _semilogy(xv, yv, fmt=None, **kw):
         * 2021-01-05 ``@ddalle``: Version 1.0; fork from _plot()
     """
     # Ensure plot() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("Index", kw.pop("i", 0))
     # Get rotation option
@@ -2521,7 +2753,8 @@ def _contour(xv, yv, zv, **kw):
         * 2020-03-20 ``@jmeeroff``: Adapted from mpl._plot
     """
     # Ensure plot() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get Contour Type
     ctyp = kw.pop("ContourType", kw.pop("ctyp", "tricontourf"))
     # Get index
@@ -2596,7 +2829,8 @@ def _scatter(xv, yv, **kw):
         * 2020-02-14 ``@ddalle``: First version
     """
     # Ensure plot() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("Index", kw.pop("i", 0))
     # Get rotation option
@@ -2635,7 +2869,8 @@ def _hist(v, **kw):
         * 2020-04-21 ``@jmeeroff``: First version
     """
     # Ensure plot() is available
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get index
     i = kw.pop("Index", kw.pop("i", 0))
     # Get rotation option
@@ -2689,7 +2924,7 @@ def _spine(spine, opt, vmin, vmax):
         elif opt == "off":
             # Same as ``False``
             spine.set_visible(False)
-        elif opt in ["clip", "clipped", "truncate", "truncated"]:
+        elif opt in ("clip", "clipped", "truncate", "truncated"):
             # Set limits
             spine.set_bounds(vmin, vmax)
         else:
@@ -2717,7 +2952,8 @@ def _spines(ax, **kw):
     """
    # --- Setup ---
     # Make sure pyplot loaded
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Get spine handles
     spineL = ax.spines["left"]
     spineR = ax.spines["right"]
@@ -2887,12 +3123,16 @@ def auto_xlim(ax, pad=0.05):
     :Versions:
         * 2015-07-06 ``@ddalle``: First version
         * 2019-03-07 ``@ddalle``: Added ``"LineCollection"``
+        * 2026-10-16 ``@agent``: Skip *ax.patch* and hidden rectangles
     """
     # Initialize limits
     xmin = np.inf
     xmax = -np.inf
     # Loop through all children of the input axes.
-    for h in ax.get_children()[:-1]:
+    for h in ax.get_children():
+        # Skip axes background
+        if h is ax.patch:
+            continue
         # Get the type's name string
         t = type(h).__name__
         # Check the class.
@@ -2918,27 +3158,31 @@ def auto_xlim(ax, pad=0.05):
                         xmax = max(xmax, max(xdata))
                     else:
                         xmax = max(xdata)
-        elif t in ['PathCollection']:
+        elif t == 'PathCollection':
             # Get bounds
             bbox = h.get_datalim(ax.transData).extents
             # Update limits
             xmin = min(xmin, min(bbox[0], bbox[2]))
             xmax = max(xmax, max(bbox[0], bbox[2]))
-        elif t in ['PolyCollection', 'LineCollection']:
+        elif t in ('PolyCollection', 'LineCollection'):
             # Loop through paths
             for P in h.get_paths():
                 # Get the coordinates
                 xmin = min(xmin, np.min(P.vertices[:, 0]))
                 xmax = max(xmax, np.max(P.vertices[:, 0]))
-        elif t in ["Rectangle"]:
-            # Skip if invisible
-            if h.axes is None: continue
+        elif t == "Rectangle":
+            # Skip if detached or invisible
+            if h.axes is None or not h.get_visible():
+                continue
+            # Skip axes background
+            if h is ax.patch:
+                continue
             # Get bounding box
             bbox = h.get_bbox().extents
             # Combine limits
             xmin = min(xmin, bbox[0])
             xmax = max(xmax, bbox[2])
-        elif t in ["AxesImage"]:
+        elif t == "AxesImage":
             # Get bounds
             bbox = h.get_extent()
             # Update limits
@@ -2981,6 +3225,7 @@ def auto_ylim(ax, pad=0.05):
     :Versions:
         * 2015-07-06 ``@ddalle``: First version
         * 2019-03-07 ``@ddalle``: Added ``"LineCollection"``
+        * 2026-10-16 ``@agent``: Skip hidden rectangles and *ax.patch*
     """
     # Initialize limits
     ymin = np.inf
@@ -3004,28 +3249,31 @@ def auto_ylim(ax, pad=0.05):
             if len(ydata) > 0:
                 ymin = min(ymin, np.min(ydata))
                 ymax = max(ymax, np.max(ydata))
-        elif t in ['PathCollection']:
+        elif t == 'PathCollection':
             # Get bounds
             bbox = h.get_datalim(ax.transData).extents
             # Update limits
             ymin = min(ymin, min(bbox[1], bbox[3]))
             ymax = max(ymax, max(bbox[1], bbox[3]))
-        elif t in ['PolyCollection', 'LineCollection']:
+        elif t in ('PolyCollection', 'LineCollection'):
             # Loop through paths
             for P in h.get_paths():
                 # Get the coordinates
                 ymin = min(ymin, min(P.vertices[:, 1]))
                 ymax = max(ymax, max(P.vertices[:, 1]))
-        elif t in ["Rectangle"]:
-            # Skip if invisible
-            if h.axes is None:
+        elif t == "Rectangle":
+            # Skip if detached or invisible
+            if h.axes is None or not h.get_visible():
+                continue
+            # Skip axes background
+            if h is ax.patch:
                 continue
             # Get bounding box
             bbox = h.get_bbox().extents
             # Combine limits
             ymin = min(ymin, bbox[1])
             ymax = max(ymax, bbox[3])
-        elif t in ["AxesImage"]:
+        elif t == "AxesImage":
             # Get bounds
             bbox = h.get_extent()
             # Update limits
@@ -3048,6 +3296,87 @@ def auto_ylim(ax, pad=0.05):
     return yminv, ymaxv
 
 
+# Get renderer for a figure
+def _get_renderer(fig):
+    r"""Get renderer for a figure, reused until its size or dpi changes
+
+    :Call:
+        >>> renderer, key = _get_renderer(fig)
+    :Inputs:
+        *fig*: :class:`Figure`
+            Figure handle
+    :Outputs:
+        *renderer*: :class:`RendererBase`
+            Renderer from ``fig.canvas.get_renderer()``
+        *key*: :class:`tuple`
+            Figure dpi and size in inches when *renderer* was obtained
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Current dpi and size
+    key = (fig.get_dpi(), tuple(fig.get_size_inches()))
+    # Check for cached renderer
+    rc = _RENDERER_CACHE.get(fig)
+    # Reuse if figure unchanged
+    if rc is not None and rc[0] == key:
+        return rc[1], key
+    # Get new renderer
+    renderer = fig.canvas.get_renderer()
+    # Save it
+    _RENDERER_CACHE[fig] = (key, renderer)
+    # Output
+    return renderer, key
+
+
+# Draw axes if necessary to get text extents
+def _draw_axes(ax):
+    r"""Draw axes unless already drawn and unchanged since then
+
+    Drawing updates tick labels so that their extents can be
+    calculated.  It is skipped if *ax* is not stale and was last drawn
+    with a renderer of the current figure size and dpi.
+
+    :Call:
+        >>> renderer = _draw_axes(ax)
+    :Inputs:
+        *ax*: :class:`Axes`
+            Axes handle
+    :Outputs:
+        *renderer*: :class:`RendererBase`
+            Renderer to use for extents of *ax* and its labels
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Get renderer
+    renderer, key = _get_renderer(ax.figure)
+    # Check if previous draw is still valid
+    if (not ax.stale) and (_DRAWN_AXES.get(ax) == key):
+        return renderer
+    # Draw the axes
+    ax.draw(renderer)
+    # Save state
+    _DRAWN_AXES[ax] = key
+    # Output
+    return renderer
+
+
+# Draw all axes of a figure up front
+def prime_renderer(fig):
+    r"""Draw each axes in a figure so extent queries can skip drawing
+
+    :Call:
+        >>> prime_renderer(fig)
+    :Inputs:
+        *fig*: :class:`Figure`
+            Figure handle
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Loop through axes
+    for ax in fig.get_axes():
+        _draw_axes(ax)
+
+
 # Get extents of axes in figure fraction coordinates
 def get_axes_plot_extents(ax=None):
     r"""Get extents of axes plot in figure fraction coordinates
@@ -3070,18 +3399,19 @@ def get_axes_plot_extents(ax=None):
         * 2020-01-08 ``@ddalle``: First version
     """
     # Import modules
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # Draw the figure once to ensure the extents can be calculated
-    ax.draw(fig.canvas.get_renderer())
+    renderer = _draw_axes(ax)
     # Size of figure in pixels
     _, _, ifig, jfig = fig.get_window_extent().bounds
     # Get pixel count for axes extents
-    ia, ja, ib, jb = _get_axes_plot_extents(ax)
+    ia, ja, ib, jb = _get_axes_plot_extents(ax, renderer)
     # Convert to fractions
     xmin = ia / ifig
     ymin = ja / jfig
@@ -3113,18 +3443,19 @@ def get_axes_full_extents(ax=None):
         * 2020-01-08 ``@ddalle``: First version
     """
     # Import modules
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # Draw the figure once to ensure the extents can be calculated
-    ax.draw(fig.canvas.get_renderer())
+    renderer = _draw_axes(ax)
     # Size of figure in pixels
     _, _, ifig, jfig = fig.get_window_extent().bounds
     # Get pixel count for axes extents
-    ia, ja, ib, jb = _get_axes_full_extents(ax)
+    ia, ja, ib, jb = _get_axes_full_extents(ax, renderer)
     # Convert to fractions
     xmin = ia / ifig
     ymin = ja / jfig
@@ -3156,18 +3487,19 @@ def get_axes_label_margins(ax=None):
         * 2020-01-08 ``@ddalle``: First version
     """
     # Import modules
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # Draw the figure once to ensure the extents can be calculated
-    ax.draw(fig.canvas.get_renderer())
+    renderer = _draw_axes(ax)
     # Size of figure in pixels
     _, _, ifig, jfig = fig.get_window_extent().bounds
     # Get pixel count for axes extents
-    wa, ha, wb, hb = _get_axes_label_margins(ax)
+    wa, ha, wb, hb = _get_axes_label_margins(ax, renderer)
     # Convert to fractions
     margin_l = wa / ifig
     margin_b = ha / jfig
@@ -3177,6 +3509,48 @@ def get_axes_label_margins(ax=None):
     return margin_l, margin_b, margin_r, margin_t
 
 
+# Get label margins of several axes
+def get_axes_label_margins_batch(ax_list):
+    r"""Get margins occupied by labels for several axes in one figure
+
+    This is equivalent to calling :func:`get_axes_label_margins` for
+    each axes but looks up the renderer and figure size only once.
+
+    :Call:
+        >>> margins = get_axes_label_margins_batch(ax_list)
+    :Inputs:
+        *ax_list*: :class:`list`\ [:class:`Axes`]
+            List of axes handles, all from the same figure
+    :Outputs:
+        *margins*: :class:`np.ndarray` shape=(*n*, 4)
+            Figure fractions *wl*, *hb*, *wr*, *ht* for each axes
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Import modules
+    if not _PYPLOT_READY:
+        _import_pyplot()
+    # Initialize output
+    margins = np.zeros((len(ax_list), 4))
+    # Check for trivial case
+    if len(ax_list) == 0:
+        return margins
+    # Get figure
+    fig = ax_list[0].figure
+    # Draw each axes once to ensure the extents can be calculated
+    for ax in ax_list:
+        renderer = _draw_axes(ax)
+    # Size of figure in pixels
+    _, _, ifig, jfig = fig.get_window_extent().bounds
+    # Get pixel counts for each axes
+    for (j, ax) in enumerate(ax_list):
+        margins[j] = _get_axes_label_margins(ax, renderer)
+    # Convert to fractions
+    margins /= [ifig, jfig, ifig, jfig]
+    # Output
+    return margins
+
+
 # Get extents of other axes
 def get_axes_fig_margins(ax=None):
     r"""Get margins due to other axes in figure
@@ -3199,10 +3573,11 @@ def get_axes_fig_margins(ax=None):
         * 2020-04-23 ``@ddalle``: First version
     """
     # Import modules
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # List of current axes
@@ -3212,11 +3587,11 @@ def get_axes_fig_margins(ax=None):
         # No extra margins
         return 0.0, 0.0, 0.0, 0.0
     # Draw the figure once to ensure the extents can be calculated
-    ax.draw(fig.canvas.get_renderer())
+    renderer = _draw_axes(ax)
     # Size of figure in pixels
     _, _, ifig, jfig = fig.get_window_extent().bounds
     # Get pixel count for main axes
-    ia, ja, ib, jb = _get_axes_full_extents(ax)
+    ia, ja, ib, jb = _get_axes_full_extents(ax, renderer)
     # Initialize margins
     wa = 0.0
     ha = 0.0
@@ -3228,9 +3603,9 @@ def get_axes_fig_margins(ax=None):
         if ax1 is ax:
             continue
         # Draw the axes once to ensure the extents can be calculated
-        ax1.draw(fig.canvas.get_renderer())
+        renderer = _draw_axes(ax1)
         # Get extents of this figure
-        ia1, ja1, ib1, jb1 = _get_axes_full_extents(ax1)
+        ia1, ja1, ib1, jb1 = _get_axes_full_extents(ax1, renderer)
         # Expand margins if needed
         wa = max(wa, ia - ia1)
         ha = max(ha, ja - ja1)
@@ -3267,10 +3642,11 @@ def get_axes_neighbors(ax=None):
         * 2020-04-23 ``@ddalle``: First version
     """
     # Import modules
-    _import_pyplot()
+    if not _PYPLOT_READY:
+        _import_pyplot()
     # Default axes
     if ax is None:
-        ax = plt.gca()
+        ax = _gca()
     # Get figure
     fig = ax.figure
     # List of current axes
@@ -3280,12 +3656,14 @@ def get_axes_neighbors(ax=None):
         # No extra margins
         return (0.0, 0.0, 0.0, 0.0), [None]
     # Draw the figure once to ensure the extents can be calculated
-    ax.draw(fig.canvas.get_renderer())
+    renderer = _draw_axes(ax)
     # Size of figure in pixels
     _, _, ifig, jfig = fig.get_window_extent().bounds
     # Get pixel count for main axes (plot only)
-    plot_ia, plot_ja, plot_ib, plot_jb = _get_axes_plot_extents(ax)
-    full_ia, full_ja, full_ib, full_jb = _get_axes_full_extents(ax)
+    plot_extents = _get_axes_plot_extents(ax, renderer)
+    plot_ia, plot_ja, plot_ib, plot_jb = plot_extents
+    full_ia, full_ja, full_ib, full_jb = _get_axes_full_extents(
+        ax, renderer, plot_extents)
     # Bounds for up/down, left/right margins
     x1 = plot_ia + 0.1*(plot_ib - plot_ia)
     x2 = plot_ia + 0.9*(plot_ib - plot_ia)
@@ -3311,10 +3689,12 @@ def get_axes_neighbors(ax=None):
         # Initialize information for this neighbor
         neighbor = {}
         # Draw the axes once to ensure the extents can be calculated
-        axk.draw(fig.canvas.get_renderer())
+        renderer = _draw_axes(axk)
         # Get extents of this figure
-        ia1, ja1, ib1, jb1 = _get_axes_plot_extents(axk)
-        ia2, ja2, ib2, jb2 = _get_axes_full_extents(axk)
+        plot_extents = _get_axes_plot_extents(axk, renderer)
+        ia1, ja1, ib1, jb1 = plot_extents
+        ia2, ja2, ib2, jb2 = _get_axes_full_extents(
+            axk, renderer, plot_extents)
         # Expand margins if needed
         wa = max(wa, full_ia - ia2)
         ha = max(ha, full_ja - ja2)
@@ -3394,14 +3774,16 @@ def get_axes_neighbors(ax=None):
 
 
 # Get extents of axes in pixels
-def _get_axes_plot_extents(ax):
+def _get_axes_plot_extents(ax, renderer=None):
     r"""Get extents of axes plot in figure fraction coordinates
 
     :Call:
-        >>> ia, ja, ib, jb = _get_axes_plot_extents(ax)
+        >>> ia, ja, ib, jb = _get_axes_plot_extents(ax, renderer=None)
     :Inputs:
         *ax*: :class:`Axes`
             Axes handle
+        *renderer*: {``None``} | :class:`RendererBase`
+            Renderer to use for text extents (default from figure)
     :Outputs:
         *ia*: :class:`float`
             Pixel count of plot region left edge, 0 is figure left
@@ -3413,9 +3795,10 @@ def _get_axes_plot_extents(ax):
             Pixel count of plot region top edge
     :Versions:
         * 2020-01-08 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Add *renderer*
     """
     # Get pixel count for axes extents
-    ia, ja, iw, jh = ax.get_window_extent().bounds
+    ia, ja, iw, jh = ax.get_window_extent(renderer).bounds
     # Add width and height
     ib = ia + iw
     jb = ja + jh
@@ -3424,14 +3807,19 @@ def _get_axes_plot_extents(ax):
 
 
 # Get extents of axes with labels
-def _get_axes_full_extents(ax):
+def _get_axes_full_extents(ax, renderer=None, plot_extents=None):
     r"""Get extents of axes including labels in pixels
 
     :Call:
-        >>> ia, ja, ib, jb = _get_axes_full_extents(ax)
+        >>> ia, ja, ib, jb = _get_axes_full_extents(ax, renderer=None)
+        >>> ia, ja, ib, jb = _get_axes_full_extents(ax, r, plot_extents)
     :Inputs:
         *ax*: :class:`Axes`
             Axes handle
+        *renderer*, *r*: {``None``} | :class:`RendererBase`
+            Renderer to use for text extents (default from figure)
+        *plot_extents*: {``None``} | :class:`tuple`\ [:class:`float`]
+            Pixel extents of plot region, if already calculated
     :Outputs:
         *ia*: :class:`float`
             Pixel count of plot plus labels left edge
@@ -3443,108 +3831,41 @@ def _get_axes_full_extents(ax):
             Pixel count of plot plus labels top edge
     :Versions:
         * 2020-01-08 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Use :func:`Axis.get_tightbbox`
     """
     # Get pixel count for axes extents
-    ia, ja, ib, jb = _get_axes_plot_extents(ax)
-    # Get plot window bounds to check for valid tick labels
-    xmin, xmax = ax.get_xlim()
-    ymin, ymax = ax.get_ylim()
-    # Get axis label extents
-    ia_x, ja_x, iw_x, jw_x = ax.xaxis.label.get_window_extent().bounds
-    ia_y, ja_y, iw_y, jw_y = ax.yaxis.label.get_window_extent().bounds
-    # Initialize bounds of labels and axes, if the extent is nonzero
-    if iw_x*jw_x > 0:
-        # Get axes bounds
-        ib_x = ia_x + iw_x
-        jb_x = ja_x + jw_x
-        # Note: could be logical here and just use xlabel to set bottom
-        # bounds, but why not be conservative?
-        ia = min(ia, ia_x)
-        ib = max(ib, ib_x)
-        ja = min(ja, ja_x)
-        jb = max(jb, jb_x)
-    # Process ylabel
-    if iw_y*jw_y > 0:
-        # Get axes bounds
-        ib_y = ia_y + iw_y
-        jb_y = ja_y + jw_y
-        # Note: could be logical here and just use xlabel to set bottom
-        # bounds, but why not be conservative?
-        ia = min(ia, ia_y)
-        ib = max(ib, ib_y)
-        ja = min(ja, ja_y)
-        jb = max(jb, jb_y)
-    # Loop through xtick labels
-    for tick in ax.get_xticklabels():
-        # Get position in data coordinates
-        xtick, _ = tick.get_position()
-        # Check if it's clipped
-        if (xtick < xmin) or (xtick > xmax):
+    if plot_extents is None:
+        plot_extents = _get_axes_plot_extents(ax, renderer)
+    # Unpack
+    ia, ja, ib, jb = plot_extents
+    # Default renderer
+    if renderer is None:
+        renderer, _ = _get_renderer(ax.figure)
+    # Loop through axes, including tick labels, label, and offset text
+    for axis in (ax.xaxis, ax.yaxis):
+        # Get combined window extents (None if axis is hidden)
+        bb = axis.get_tightbbox(renderer)
+        # Check for null axis
+        if bb is None or not (bb.width and bb.height):
             continue
-        # Get window extents
-        ia_t, ja_t, iw_t, jw_t = tick.get_window_extent().bounds
-        # Check for null tick
-        if iw_t*jw_t == 0.0:
-            continue
-        # Translate to actual bounds
-        ib_t = ia_t + iw_t
-        jb_t = ja_t + jw_t
         # Update bounds
-        ia = min(ia, ia_t)
-        ib = max(ib, ib_t)
-        ja = min(ja, ja_t)
-        jb = max(jb, jb_t)
-    # Loop through ytick labels
-    for tick in ax.get_yticklabels():
-        # Get position in data coordinates
-        _, ytick = tick.get_position()
-        # Check if it's clipped
-        if (ytick < ymin) or (ytick > ymax):
-            continue
-        # Get window extents
-        ia_t, ja_t, iw_t, jw_t = tick.get_window_extent().bounds
-        # Check for null tick
-        if iw_t*jw_t == 0.0:
-            continue
-        # Translate to actual bounds
-        ib_t = ia_t + iw_t
-        jb_t = ja_t + jw_t
-        # Update bounds
-        ia = min(ia, ia_t)
-        ib = max(ib, ib_t)
-        ja = min(ja, ja_t)
-        jb = max(jb, jb_t)
-    # Deal with silly scaling factors for both axes
-    for tick in [ax.xaxis.offsetText, ax.yaxis.offsetText]:
-        # Get window extents
-        ia_t, ja_t, iw_t, jw_t = tick.get_window_extent().bounds
-        # Check for null tick
-        if iw_t*jw_t == 0.0:
-            continue
-        # Translate to actual bounds
-        ib_t = ia_t + iw_t
-        jb_t = ja_t + jw_t
-        # Update bounds
-        ia = min(ia, ia_t)
-        ib = max(ib, ib_t)
-        ja = min(ja, ja_t)
-        jb = max(jb, jb_t)
+        ia = min(ia, bb.x0)
+        ib = max(ib, bb.x1)
+        ja = min(ja, bb.y0)
+        jb = max(jb, bb.y1)
     # Deal with legend
     leg = ax.get_legend()
     # Check for null legend
     if leg:
         # Get window extents
-        ia_t, ja_t, iw_t, jw_t = leg.get_window_extent().bounds
-        # Check for null tick
-        if iw_t*jw_t > 0.0:
-            # Translate to actual bounds
-            ib_t = ia_t + iw_t
-            jb_t = ja_t + jw_t
+        bb = leg.get_window_extent(renderer)
+        # Check for null legend
+        if bb.width and bb.height:
             # Update bounds
-            ia = min(ia, ia_t)
-            ib = max(ib, ib_t)
-            ja = min(ja, ja_t)
-            jb = max(jb, jb_t)
+            ia = min(ia, bb.x0)
+            ib = max(ib, bb.x1)
+            ja = min(ja, bb.y0)
+            jb = max(jb, bb.y1)
     # Deal with children
     for h in ax.get_children():
         # Only process certain types
@@ -3558,30 +3879,29 @@ def _get_axes_full_extents(ax):
             # Don't process this kind of Matplotlib object
             continue
         # Get window extents
-        ia_t, ja_t, iw_t, jw_t = h.get_window_extent().bounds
+        bb = h.get_window_extent(renderer)
         # Check for null window
-        if iw_t*jw_t > 0.0:
-            # Translate to actual bounds
-            ib_t = ia_t + iw_t
-            jb_t = ja_t + jw_t
+        if bb.width and bb.height:
             # Update bounds
-            ia = min(ia, ia_t)
-            ib = max(ib, ib_t)
-            ja = min(ja, ja_t)
-            jb = max(jb, jb_t)
+            ia = min(ia, bb.x0)
+            ib = max(ib, bb.x1)
+            ja = min(ja, bb.y0)
+            jb = max(jb, bb.y1)
     # Output
     return ia, ja, ib, jb
 
 
 # Get extents of axes with labels
-def _get_axes_label_margins(ax):
+def _get_axes_label_margins(ax, renderer=None):
     r"""Get pixel counts of tick and axes labels on all four sides
 
     :Call:
-        >>> wa, ha, wb, hb = _get_axes_label_margins(ax)
+        >>> wa, ha, wb, hb = _get_axes_label_margins(ax, renderer=None)
     :Inputs:
         *ax*: :class:`Axes`
             Axes handle
+        *renderer*: {``None``} | :class:`RendererBase`
+            Renderer to use for text extents (default from figure)
     :Outputs:
         *wa*: :class:`float`
             Pixel count beyond plot of labels on left
@@ -3593,11 +3913,13 @@ def _get_axes_label_margins(ax):
             Pixel count beyond plot of labels above
     :Versions:
         * 2020-01-08 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Add *renderer*; reuse plot extents
     """
     # Get pixel count for plot extents
-    ia_ax, ja_ax, ib_ax, jb_ax = _get_axes_plot_extents(ax)
-    # Get pixel count for plot extents
-    ia, ja, ib, jb = _get_axes_full_extents(ax)
+    plot_extents = _get_axes_plot_extents(ax, renderer)
+    ia_ax, ja_ax, ib_ax, jb_ax = plot_extents
+    # Get pixel count for plot extents plus labels
+    ia, ja, ib, jb = _get_axes_full_extents(ax, renderer, plot_extents)
     # Margins
     wa = ia_ax - ia
     ha = ja_ax - ja
@@ -61,6 +61,17 @@ _rst_str = """{``None``} | :class:`str`"""
 _rst_strnum = """{``None``} | :class:`str` | :class:`int` | :class:`float`"""
 
 
+# Common spellings of min/max plot types; ``True`` for error bars
+_MINMAX_ERRORBAR = {
+    "errorbar": True,
+    "ErrorBar": True,
+    "error_bar": True,
+    "fillbetween": False,
+    "FillBetween": False,
+    "fill_between": False,
+}
+
+
 # Options interface
 class MPLOpts(kwutils.KwargHandler):
     r"""Options class for all plot methods in :mod:`plot_mpl` module
@@ -1757,6 +1768,14 @@ class MPLOpts(kwutils.KwargHandler):
             'verticalalignment': 'top',
         },
     }
+
+   # --- Min/Max Sections ---
+    # Main option and plot type option for min/max-like sections
+    _MM_SPECS = {
+        "error": ("ErrorOptions", "MinMaxPlotType"),
+        "minmax": ("MinMaxOptions", "MinMaxPlotType"),
+        "uq": ("UncertaintyOptions", "UncertaintyPlotType"),
+    }
   # >
 
   # ==================
@@ -1945,25 +1964,63 @@ class MPLOpts(kwutils.KwargHandler):
             * 2019-03-04 ``@ddalle``: First version
             * 2019-12-23 ``@ddalle``: From :mod:`tnakit.mpl.mplopts`
             * 2020-01-17 ``@ddalle``: Using :class:`KwargHandler`
+            * 2026-10-16 ``@agent``: Use :func:`_merge_minmax`
         """
-        # Use the "minmax" section
-        kw = self.section_options("error")
-        # Save section name
-        mainopt = "ErrorOptions"
+        return self._merge_minmax("error")
+
+    # Combine options for min/max-like sections
+    def _merge_minmax(self, sec):
+        r"""Process options for a min/max, error, or UQ section
+
+        The options for the plot type, either *ErrorBarOptions* or
+        *FillBetweenOptions*, are merged into the main option of the
+        section.  The merged result is saved until *opts* changes.
+
+        :Call:
+            >>> kw = opts._merge_minmax(sec)
+        :Inputs:
+            *opts*: :class:`MPLOpts`
+                Options interface
+            *sec*: ``"error"`` | ``"minmax"`` | ``"uq"``
+                Name of options section
+        :Outputs:
+            *kw*: :class:`dict`
+                Dictionary of options for section *sec*
+        :Versions:
+            * 2026-10-16 ``@agent``: Fused from :func:`error_options`,
+              :func:`minmax_options`, and :func:`uq_options`
+        """
+        # Get main option and plot type option
+        mainopt, typekey = self._MM_SPECS[sec]
+        # Get processed sections (same cache as section_options)
+        cache = self.__dict__.get("_section_cache")
+        # Check for previous result
+        if cache is not None:
+            kw = cache.get((sec, mainopt))
+            # Copy so callers can modify result
+            if kw is not None:
+                return kwutils._copy_section(kw)
+        # Use the section
+        kw = self.section_options(sec)
         # Get type-specific options removed
         kw_eb = kw.pop("ErrorBarOptions", {})
         kw_fb = kw.pop("FillBetweenOptions", {})
         kw_mm = kw.get(mainopt, {})
         # Get the plot type
-        mmax_type = kw.get("MinMaxPlotType", "fillbetween").lower()
-        mmax_type = mmax_type.replace("_", "")
+        mmax_type = kw.get(typekey, "fillbetween")
+        # Check common spellings before normalizing
+        q_eb = _MINMAX_ERRORBAR.get(mmax_type)
+        if q_eb is None:
+            q_eb = mmax_type.lower().replace("_", "") == "errorbar"
         # Check type
-        if mmax_type == "errorbar":
+        if q_eb:
             # Combine ErrorBar options into main options
             kw[mainopt] = dict(kw_eb, **kw_mm)
         else:
             # Combine FillBetween options into main options
             kw[mainopt] = dict(kw_fb, **kw_mm)
+        # Save result (section_options() created the cache)
+        self._section_cache[(sec, mainopt)] = kwutils._copy_section(kw)
         # Output
         return kw
 
@@ -2230,10 +2287,10 @@ class MPLOpts(kwutils.KwargHandler):
         # Specific location options
         loc = kw.get("loc")
         # Check it
-        if loc in ["upper center", 9]:
+        if loc in ("upper center", 9):
             # Bounding box location on top spine
             kw.setdefault("bbox_to_anchor", (0.5, 1.05))
-        elif loc in ["lower center", 8]:
+        elif loc in ("lower center", 8):
             # Bounding box location on bottom spine
             kw.setdefault("bbox_to_anchor", (0.5, -0.05))
         # Output
@@ -2365,27 +2422,9 @@ class MPLOpts(kwutils.KwargHandler):
             * 2019-03-04 ``@ddalle``: First version
             * 2019-12-20 ``@ddalle``: From :mod:`tnakit.mpl.mplopts`
             * 2020-01-17 ``@ddalle``: Using :class:`KwargHandler`
+            * 2026-10-16 ``@agent``: Use :func:`_merge_minmax`
         """
-        # Use the "minmax" section
-        kw = self.section_options("minmax")
-        # Save section name
-        mainopt = "MinMaxOptions"
-        # Get type-specific options removed
-        kw_eb = kw.pop("ErrorBarOptions", {})
-        kw_fb = kw.pop("FillBetweenOptions", {})
-        kw_mm = kw.get(mainopt, {})
-        # Get the plot type
-        mmax_type = kw.get("MinMaxPlotType", "fillbetween").lower()
-        mmax_type = mmax_type.replace("_", "")
-        # Check type
-        if mmax_type == "errorbar":
-            # Combine ErrorBar options into main options
-            kw[mainopt] = dict(kw_eb, **kw_mm)
-        else:
-            # Combine FillBetween options into main options
-            kw[mainopt] = dict(kw_fb, **kw_mm)
-        # Output
-        return kw
+        return self._merge_minmax("minmax")
 
     # Process options for UQ plot
     def uq_options(self):
@@ -2405,27 +2444,9 @@ class MPLOpts(kwutils.KwargHandler):
             * 2019-03-04 ``@ddalle``: First version
             * 2019-12-23 ``@ddalle``: From :mod:`tnakit.mpl.mplopts`
             * 2020-01-17 ``@ddalle``: Using :class:`KwargHandler`
+            * 2026-10-16 ``@agent``: Use :func:`_merge_minmax`
         """
-        # Use the "uq" section
-        kw = self.section_options("uq")
-        # Save section name
-        mainopt = "UncertaintyOptions"
-        # Get type-specific options removed
-        kw_eb = kw.pop("ErrorBarOptions", {})
-        kw_fb = kw.pop("FillBetweenOptions", {})
-        kw_mm = kw.get(mainopt, {})
-        # Get the plot type
-        mmax_type = kw.get("UncertaintyPlotType", "fillbetween").lower()
-        mmax_type = mmax_type.replace("_", "")
-        # Check type
-        if mmax_type == "errorbar":
-            # Combine ErrorBar options into main options
-            kw[mainopt] = dict(kw_eb, **kw_mm)
-        else:
-            # Combine FillBetween options into main options
-            kw[mainopt] = dict(kw_fb, **kw_mm)
-        # Output
-        return kw
+        return self._merge_minmax("uq")
 
    # Options for scatter plots
     def scatter_options(self):
@@ -2538,3 +2559,8 @@ MPLOpts._doc_keys("errorbar_options", ["ErrorBarOptions"])
 MPLOpts._doc_keys("fillbetween_options", ["FillBetweenOptions"])
 MPLOpts._doc_keys("legend_font_options", ["LegendFontOptions"])
 MPLOpts._doc_keys("legend_options", ["LegendOptions"])
+
+# Preprocess cascading options once at import
+for _opt in MPLOpts._kw_submap:
+    MPLOpts._get_kw_submap_split(_opt)
+del _opt
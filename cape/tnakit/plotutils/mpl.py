@@ -15,6 +15,7 @@ It also includes syntax to import modules without raising ``ImportError``.
 
 # Standard library modules
 import os
+import weakref
 
 # Standard third-party modules
 import numpy as np
@@ -33,6 +34,7 @@ from . import mplopts
 from .. import optitem
 from .. import typeutils
 from .. import statutils as stats
+from ..plot_mpl import kernels
 
 # Get a variable to hold the "type" of "module"
 mod = os.__class__
@@ -41,6 +43,30 @@ mod = os.__class__
 mpl = object()
 plt = object()
 
+# Flags for completed imports
+_MPL_READY = False
+_PYPLOT_READY = False
+
+# Normalization constant for Gaussian PDF
+SQRT_2PI = np.sqrt(2*np.pi)
+
+# Histogram label transforms, keyed by axes
+_HISTLAB_TRANSFORMS = weakref.WeakKeyDictionary()
+# Offsets of histogram labels above/below top spine [in]
+_HISTLAB_OFFSETS = {
+    True: 0.1625,
+    False: -0.1,
+}
+
+# Data limits of individual artists, keyed by artist
+_XLIM_CACHE = weakref.WeakKeyDictionary()
+_YLIM_CACHE = weakref.WeakKeyDictionary()
+
+# Read-only evenly spaced arrays, keyed by (start, stop, num)
+_LINSPACE_CACHE = {}
+# Maximum number of cached arrays
+_LINSPACE_CACHE_SIZE = 32
+
 
 # Import :mod:`matplotlib`
 def import_matplotlib():
@@ -56,11 +82,13 @@ def import_matplotlib():
         >>> import_matplotlib()
     :Versions:
         * 2019-08-22 ``@ddalle``: Documented first version
+        * 2026-10-16 ``@agent``: Use *_MPL_READY* flag
     """
     # Make global variables
     global mpl
+    global _MPL_READY
     # Exit if already imported
-    if isinstance(mpl, mod):
+    if _MPL_READY:
         return
     # Import module
     try:
@@ -71,6 +99,8 @@ def import_matplotlib():
     if (os.name != "nt") and (os.environ.get("DISPLAY") is None):
         # Not on Windows and no display: no window to create fig
         mpl.use("Agg")
+    # Mark successful import
+    _MPL_READY = True
 
 
 # Import :mod:`matplotlib`
@@ -88,11 +118,13 @@ def import_pyplot():
         * :func:`import_matplotlib`
     :Versions:
         * 2019-08-22 ``@ddalle``: Documented first version
+        * 2026-10-16 ``@agent``: Use *_PYPLOT_READY* flag
     """
     # Make global variables
     global plt
+    global _PYPLOT_READY
     # Exit if already imported
-    if isinstance(plt, mod):
+    if _PYPLOT_READY:
         return
     # Otherwise, import matplotlib first
     import_matplotlib()
@@ -101,6 +133,8 @@ def import_pyplot():
         import matplotlib.pyplot as plt
     except ImportError:
         return
+    # Mark successful import
+    _PYPLOT_READY = True
 
 
 # Primary plotter
@@ -122,7 +156,8 @@ def plot(xv, yv, *a, **kw):
     """
    # --- Prep ---
     # Ensure plot() is loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Initialize output
     h = {}
     # Number of args and args used
@@ -275,12 +310,15 @@ def plot(xv, yv, *a, **kw):
     grid(ax, **kw_gl)
     # Process spine options
     kw_sp = mplopts.spine_options(kw, kw_p, kw_u)
+    # Data limits shared by spine and axes formatting
+    lim_cache = {}
     # Apply options relating to spines
-    h["spines"] = format_spines(ax, **kw_sp)
+    h["spines"] = format_spines(ax, _lim_cache=lim_cache, **kw_sp)
     # Process axes format options
     kw_axfmt = mplopts.axformat_options(kw, kw_p, kw_u)
     # Apply formatting
-    h['xlabel'], h['ylabel'] = format_axes(ax, **kw_axfmt)
+    h['xlabel'], h['ylabel'] = format_axes(
+        ax, _lim_cache=lim_cache, **kw_axfmt)
    # --- Legend ---
     # Process options for legend
     kw_leg = mplopts.legend_options(kw, kw_font)
@@ -310,7 +348,8 @@ def hist(v, **kw):
     """
    # --- Prep ---
     # Ensure plot() is loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Initialize output
     h = {}
     # Filter out non-numeric entries
@@ -319,9 +358,11 @@ def hist(v, **kw):
     coeff = kw.pop("coeff", "c")
    # --- Statistics ---
     # Calculate the mean
-    vmu = np.mean(v)
-    # Calculate StdDev
-    vstd = np.std(v)
+    vmu = v.mean()
+    # Deviations from the mean
+    vdev = v - vmu
+    # Calculate StdDev (reusing deviations)
+    vstd = np.sqrt(np.mean(vdev*vdev))
     # Coverage Intervals
     cov = kw.pop("Coverage", kw.pop("cov", 0.99))
     cdf = kw.pop("CoverageCDF", kw.pop("cdf", cov))
@@ -329,14 +370,19 @@ def hist(v, **kw):
     kcdf = student.ppf(0.5+0.5*cdf, v.size)
     # Check for outliers ...
     fstd = kw.pop('FilterSigma', 2.0*kcdf)
+    # Statistics of unfiltered values
+    kw_cov = {"mu": vmu, "std": vstd}
     # Remove values from histogram
     if fstd:
         # Find indices of cases that are within outlier range
-        j = np.abs(v-vmu)/vstd <= fstd
-        # Filter values
-        v = v[j]
+        j = np.abs(vdev) <= fstd*vstd
+        # Filter values if any are outliers
+        if not np.all(j):
+            v = v[j]
+            # Statistics must be recalculated
+            kw_cov = {}
     # Calculate interval
-    acov, bcov = stats.get_cov_interval(v, cov, cdf=cdf, **kw)
+    acov, bcov = stats.get_cov_interval(v, cov, cdf=cdf, **dict(kw, **kw_cov))
    # --- Universal Options ---
     # dictionary for universal options
     # 1 -- Orientation
@@ -379,8 +425,10 @@ def hist(v, **kw):
     grid(ax, **kw_gl)
     # Process spine options
     kw_sp = mplopts.spine_options(kw, kw_p, kw_u)
+    # Data limits shared by spine and axes formatting
+    lim_cache = {}
     # Apply options relating to spines
-    h["spines"] = format_spines(ax, **kw_sp)
+    h["spines"] = format_spines(ax, _lim_cache=lim_cache, **kw_sp)
     # Process axes format options
     kw_axfmt = mplopts.axformat_options(kw, kw_p, kw_u)
     # Force y=0 or x=0 depending on orientation
@@ -389,7 +437,8 @@ def hist(v, **kw):
     else:
         kw_axfmt['XMin'] = 0
     # Apply formatting
-    h['xlabel'], h['ylabel'] = format_axes(h['ax'], **kw_axfmt)
+    h['xlabel'], h['ylabel'] = format_axes(
+        h['ax'], _lim_cache=lim_cache, **kw_axfmt)
    # --- Plot an Interval ---
     # Get flag for manual interval plot
     qint = kw.pop("PlotInterval", False)
@@ -420,12 +469,13 @@ def hist(v, **kw):
     if qdel:
         h['delta'] = plot_delta(ax, vmu, **kw_delta)
    # --- Mean labels ---
-    # Process mean labeling options
+    # Mean labeling options (pop regardless)
     opts = kw.pop("MeanLabelOptions", {})
-    kw_mu_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
-    c = kw_mu_lab.pop('clabel', 'mu')
     # Do the label
     if qmu:
+        # Process mean labeling options
+        kw_mu_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
+        c = kw_mu_lab.pop('clabel', 'mu')
         # Formulate the label
         # Format code
         flbl = kw_mu_lab.pop("MuFormat", "%.4f")
@@ -435,29 +485,31 @@ def hist(v, **kw):
         lbl = ('%s = %s' % (klbl, flbl)) % vmu
         h['MeanLabel'] = histlab_part(lbl, 0.99, True, ax, **kw_mu_lab)
    # --- StdDev labels ---
-    # Process mean labeling options
+    # Sigma labeling options (pop regardless)
     opts = kw.pop("SigmaLabelOptions", {})
-    # Make sure alignment is correct
-    opts.setdefault('horizontalalignment', 'left')
-    kw_sig_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
-    c = kw_sig_lab.pop('clabel', coeff)
     # Do the label
     if qsig:
+        # Make sure alignment is correct
+        opts.setdefault('horizontalalignment', 'left')
+        # Process sigma labeling options
+        kw_sig_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
+        c = kw_sig_lab.pop('clabel', coeff)
         # Formulate the label
         # Format code
-        flbl = kw_mu_lab.pop("SigFormat", "%.4f")
+        flbl = kw_sig_lab.pop("SigFormat", "%.4f")
         # First part
         klbl = (u'\u03c3(%s)' % c)
         # Insert value
         lbl = ('%s = %s' % (klbl, flbl)) % vstd
         h['SigmaLabel'] = histlab_part(lbl, 0.01, True, ax, **kw_sig_lab)
    # --- Interval Labels ---
-    # Process mean labeling options
+    # Interval labeling options (pop regardless)
     opts = kw.pop("IntLabelOptions", {})
-    kw_int_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
-    c = kw_int_lab.pop('clabel', cov)
     if qint:
-        flbl = kw_sig_lab.get("IntervalFormat", "%.4f")
+        # Process interval labeling options
+        kw_int_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
+        c = kw_int_lab.pop('clabel', cov)
+        flbl = kw_int_lab.pop("IntervalFormat", "%.4f")
         # Form
         klbl = "I(%.1f%%%%)" % (100*c)
         # Get ionterval values
@@ -467,17 +519,18 @@ def hist(v, **kw):
         lbl = ('%s = [%s,%s]' % (klbl, flbl, flbl)) % (a, b)
         h['IntLabel'] = histlab_part(lbl, 0.99, False, ax, **kw_int_lab)
    # --- Delta Labels ---
-    # Process Delta labeling options
+    # Delta labeling options (pop regardless)
     opts = kw.pop("DeltaLabelOptions", {})
-    opts.setdefault('horizontalalignment', 'left')
-    kw_del_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
-    c = kw_del_lab.pop('clabel', 'coeff')
     if qdel:
-        flbl = kw_del_lab.get("DeltaFormat", "%.4f")
+        # Process Delta labeling options
+        opts.setdefault('horizontalalignment', 'left')
+        kw_del_lab = mplopts.histlabel_options(opts, kw_p, kw_u)
+        c = kw_del_lab.pop('clabel', 'coeff')
+        flbl = kw_del_lab.pop("DeltaFormat", "%.4f")
         # Get delta values
         dc = kw_delta.get('Delta', 0.0)
         # Insert value
-        if type(dc).__name__ in ['ndarray', 'list', 'tuple']:
+        if isinstance(dc, (np.ndarray, list, tuple)):
             lbl = (u'\u0394%s = (%s, %s)' % (c, flbl, flbl)) % (dc[0], dc[1])
         else:
             lbl = (u'\u0394%s = %s' % (c, flbl)) % dc
@@ -511,7 +564,8 @@ def figure(**kw):
         * 2019-03-06 ``@ddalle``: First version
     """
     # Import PyPlot
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get figure handle
     fig = kw.pop("fig", None)
     # Figure size
@@ -549,7 +603,8 @@ def axes(**kw):
         * 2019-03-06 ``@ddalle``: First version
     """
     # Import PyPlot
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get figure handle
     ax = kw.pop("ax", None)
     # Create figure if needed
@@ -590,7 +645,8 @@ def plot_line(xv, yv, fmt=None, **kw):
         * 2019-03-04 ``@ddalle``: First version
     """
     # Ensure plot() is available
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get index
     i = kw.pop("i", kw.pop("Index", 0))
     # Get rotation option
@@ -611,6 +667,41 @@ def plot_line(xv, yv, fmt=None, **kw):
     return h
 
 
+# Convert scalar or array plot input
+def _as_broadcast(x, ref, name):
+    r"""Convert scalar or array input to an array matching *ref*
+
+    :Call:
+        >>> v = _as_broadcast(x, ref, name)
+    :Inputs:
+        *x*: ``None`` | :class:`float` | :class:`int` | :class:`list`
+            Scalar value or array of values
+        *ref*: :class:`np.ndarray` | :class:`list`
+            Values whose shape scalar *x* should take
+        *name*: :class:`str`
+            Name of input for error messages
+    :Outputs:
+        *v*: ``None`` | :class:`np.ndarray`
+            Read-only broadcast view if *x* is scalar, else array
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check type
+    if x is None:
+        # Pass through missing value
+        return None
+    elif isinstance(x, (float, int, np.floating, np.integer)):
+        # Broadcast scalar to array (view, no copy)
+        return np.broadcast_to(np.float64(x), np.shape(ref))
+    elif typeutils.isarray(x):
+        # Ensure array (not list, etc.)
+        return np.asarray(x)
+    # Bad type
+    raise TypeError(
+        "'%s' value must be either None, float, or array (got %s)"
+        % (name, x.__class__))
+
+
 # Region plot
 def fill_between(xv, ymin, ymax, **kw):
     """Call the :func:`fill_between` or :func:`fill_betweenx` function
@@ -634,30 +725,13 @@ def fill_between(xv, ymin, ymax, **kw):
     """
    # --- Values ---
     # Convert possible scalar for *ymin*
-    if isinstance(ymin, float):
-        # Expand scalar to array
-        yl = ymin*np.ones_like(xv)
-    elif typeutils.isarray(ymin):
-        # Ensure array (not list, etc.)
-        yl = np.asarray(ymin)
-    else:
-        raise TypeError(
-            ("'ymin' value must be either float or array ") +
-            ("(got %s)" % ymin.__class__))
+    yl = _as_broadcast(ymin, xv, "ymin")
     # Convert possible scalar for *ymax*
-    if isinstance(ymax, float):
-        # Expand scalar to array
-        yu = ymax*np.ones_like(xv)
-    elif typeutils.isarray(ymax):
-        # Ensure array (not list, etc.)
-        yu = np.asarray(ymax)
-    else:
-        raise TypeError(
-            ("'ymax' value must be either float or array ") +
-            ("(got %s)" % ymax.__class__))
+    yu = _as_broadcast(ymax, xv, "ymax")
    # --- Main ---
     # Ensure fill_between() is available
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get index
     i = kw.pop("i", kw.pop("Index", 0))
     # Get rotation option
@@ -704,36 +778,13 @@ def errorbar(xv, yv, yerr=None, xerr=None, **kw):
     """
    # --- Values ---
     # Convert possible scalar for *yerr*
-    if yerr is None:
-        # No vertical uncertainty (?)
-        uy = None
-    elif isinstance(yerr, float):
-        # Expand scalar to array
-        uy = yerr*np.ones_like(yv)
-    elif typeutils.isarray(yerr):
-        # Ensure array (not list, etc.)
-        uy = np.asarray(yerr)
-    else:
-        raise TypeError(
-            ("'yerr' value must be either float or array ") +
-            ("(got %s)" % yerr.__class__))
-    # Convert possible scalar for *ymax*
-    if xerr is None:
-        # No horizontal uncertainty
-        ux = None
-    elif isinstance(xerr, float):
-        # Expand scalar to array
-        ux = xerr*np.ones_like(xv)
-    elif typeutils.isarray(xerr):
-        # Ensure array (not list, etc.)
-        ux = np.asarray(xerr)
-    else:
-        raise TypeError(
-            ("'xerr' value must be either None, float, or array ") +
-            ("(got %s)" % yerr.__class__))
+    uy = _as_broadcast(yerr, yv, "yerr")
+    # Convert possible scalar for *xerr*
+    ux = _as_broadcast(xerr, xv, "xerr")
    # --- Main ---
     # Ensure fill_between() is available
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get index
     i = kw.pop("i", kw.pop("Index", 0))
     # Get rotation option
@@ -769,7 +820,8 @@ def _hist(v, **kw):
         * 2019-08-22 ``@ddalle``: From :func:`Part.hist_part`
     """
     # Ensure hist() is available
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Call plot
     h = plt.hist(v, **kw)
     # Output
@@ -797,7 +849,8 @@ def plot_mean(ax, vmu, **kw):
         * 2019-03-11 ``@jmeeroff``: First version
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get horizontal/vertical option
     orient = kw.pop('orientation', "")
     # Check orientation
@@ -833,32 +886,66 @@ def plot_interval(ax, vmin, vmax, **kw):
         *orientation*: {``"horizontal"``} | ``"vertical"``
             Option to flip *x* and *y* axes
     :Outputs:
-        *h*: :class:`matplotlib.collections.PolyCollection`
+        *h*: :class:`matplotlib.patches.Rectangle` | :class:`Polygon`
             Handle to interval plot
     :Versions:
         * 2019-03-11 ``@jmeeroff``: First version
         * 2019-08-22 ``@ddalle``: Added *vmin*, *vmax* inputs
+        * 2026-10-16 ``@agent``: Use :func:`axvspan`, :func:`axhspan`
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get horizontal/vertical option
     orient = kw.pop('orientation', "")
     # Check orientation
     if orient == 'vertical':
-        # Vertical: get vertical limits of axes window
-        pmin, pmax = ax.get_ylim()
-        # Plot a vertical range bar
-        h = plt.fill_betweenx([pmin, pmax], vmin, vmax, **kw)
-
+        # Plot a vertical range bar spanning the axes window
+        h = ax.axvspan(vmin, vmax, **kw)
     else:
-        # Horizontal: get horizontal limits of axes window
-        pmin, pmax = ax.get_xlim()
-        # Plot a horizontal range bar
-        h = plt.fill_between([pmin, pmax], vmin, vmax, **kw)
+        # Plot a horizontal range bar spanning the axes window
+        h = ax.axhspan(vmin, vmax, **kw)
     # Return
     return h
 
 
+# Cached evenly spaced points
+def _linspace_cached(a, b, n):
+    """Get read-only evenly spaced points, reusing previous arrays
+
+    :Call:
+        >>> x = _linspace_cached(a, b, n)
+    :Inputs:
+        *a*: :class:`float`
+            Start value
+        *b*: :class:`float`
+            End value
+        *n*: :class:`int`
+            Number of points
+    :Outputs:
+        *x*: :class:`np.ndarray` shape=(*n*,)
+            Read-only array from :func:`np.linspace`
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Cache key
+    key = (a, b, n)
+    # Check for previous array
+    x = _LINSPACE_CACHE.get(key)
+    # Create if needed
+    if x is None:
+        # Create points and protect them from modification
+        x = np.linspace(a, b, n)
+        x.setflags(write=False)
+        # Limit size of cache
+        if len(_LINSPACE_CACHE) >= _LINSPACE_CACHE_SIZE:
+            _LINSPACE_CACHE.clear()
+        # Save it
+        _LINSPACE_CACHE[key] = x
+    # Output
+    return x
+
+
 # Gaussian plotting part
 def plot_gaussian(ax, vmu, vstd, **kw):
     """Plot a Gaussian distribution (on a histogram)
@@ -883,9 +970,11 @@ def plot_gaussian(ax, vmu, vstd, **kw):
     :Versions:
         * 2019-03-11 ``@jmeeroff``: First version
         * 2019-08-22 ``@ddalle``: Added *ngauss*
+        * 2026-10-16 ``@agent``: Use :func:`kernels.gauss_pdf` in place
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get horizontal/vertical option
     orient = kw.pop('orientation', "")
     # Get axis limits
@@ -898,9 +987,20 @@ def plot_gaussian(ax, vmu, vstd, **kw):
     # Number of points to plot
     ngauss = kw.pop("ngauss", 151)
     # Create points at which to plot
-    xval = np.linspace(xmin, xmax, ngauss)
-    # Compute Gaussian distribution
-    yval = 1/(vstd*np.sqrt(2*np.pi))*np.exp(-0.5*((xval-vmu)/vstd)**2)
+    xval = _linspace_cached(float(xmin), float(xmax), int(ngauss))
+    # Check for compiled kernel
+    if kernels.numba is not None:
+        # Compute Gaussian distribution in one fused loop
+        yval = np.empty_like(xval)
+        kernels.gauss_pdf(xval, vmu, vstd, yval)
+    else:
+        # Compute Gaussian distribution in place (no temporary arrays)
+        yval = np.subtract(xval, vmu)
+        yval /= vstd
+        np.square(yval, out=yval)
+        yval *= -0.5
+        np.exp(yval, out=yval)
+        yval *= 1.0 / (vstd*SQRT_2PI)
     # Plot
     if orient == "vertical":
         # Plot vertical dist with bump pointing to the right
@@ -912,6 +1012,40 @@ def plot_gaussian(ax, vmu, vstd, **kw):
     return h[0]
 
 
+# Plot two parallel lines spanning the axes window
+def _plot_line_pair(ax, orient, v1, v2, **kw):
+    """Plot two full-width lines using a single :func:`plt.plot` call
+
+    :Call:
+        >>> h = _plot_line_pair(ax, orient, v1, v2, **kw)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes._subplots.AxesSubplot`
+            Axes handle
+        *orient*: ``None`` | ``"vertical"``
+            Orientation; ``"vertical"`` means lines at *x* = *v1*, *v2*
+        *v1*: :class:`float`
+            Coordinate of first line
+        *v2*: :class:`float`
+            Coordinate of second line
+    :Outputs:
+        *h*: :class:`list` (:class:`matplotlib.lines.Line2D`)
+            List of both lines
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check orientation
+    if orient == 'vertical':
+        # Get vertical limits
+        pmin, pmax = ax.get_ylim()
+        # Plot both vertical lines
+        return plt.plot([v1, v1], [pmin, pmax], [v2, v2], [pmin, pmax], **kw)
+    else:
+        # Get horizontal limits
+        pmin, pmax = ax.get_xlim()
+        # Plot both horizontal lines
+        return plt.plot([pmin, pmax], [v1, v1], [pmin, pmax], [v2, v2], **kw)
+
+
 # Interval using two lines
 def plot_lines_std(ax, vmu, vstd, **kw):
     """Use two lines to show standard deviation window
@@ -933,9 +1067,11 @@ def plot_lines_std(ax, vmu, vstd, **kw):
     :Versions:
         * 2019-03-14 ``@jmeeroff``: First version
         * 2019-08-22 ``@ddalle``: From :func:`Part.std_part`
+        * 2026-10-16 ``@agent``: Use :func:`_plot_line_pair`
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get orientation option
     orient = kw.pop('orientation', None)
     # Check multiplier
@@ -944,7 +1080,7 @@ def plot_lines_std(ax, vmu, vstd, **kw):
     if not ksig:
         return
     # Plot lines
-    if type(ksig).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(ksig, (np.ndarray, list, tuple)):
         # Separate lower and upper limits
         vmin = vmu - ksig[0]*vstd
         vmax = vmu + ksig[1]*vstd
@@ -952,23 +1088,8 @@ def plot_lines_std(ax, vmu, vstd, **kw):
         # Use as a single number
         vmin = vmu - ksig*vstd
         vmax = vmu + ksig*vstd
-    # Check orientation
-    if orient == 'vertical':
-        # Get vertical limits
-        pmin, pmax = ax.get_ylim()
-        # Plot a vertical line for the min and max
-        h = (
-            plt.plot([vmin, vmin], [pmin, pmax], **kw) +
-            plt.plot([vmax, vmax], [pmin, pmax], **kw))
-    else:
-        # Get horizontal limits
-        pmin, pmax = ax.get_xlim()
-        # Plot a horizontal line for the min and max
-        h = (
-            plt.plot([pmin, pmax], [vmin, vmin], **kw) +
-            plt.plot([pmin, pmax], [vmax, vmax], **kw))
-    # Return
-    return h
+    # Plot a line for the min and max
+    return _plot_line_pair(ax, orient, vmin, vmax, **kw)
 
 
 # Delta Plotting
@@ -989,15 +1110,17 @@ def plot_delta(ax, vmu, **kw):
             List of line instances
     :Versions:
         * 2019-03-14 ``@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Use :func:`_plot_line_pair`
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Check orientation
     orient = kw.pop('orientation', None)
     # Reference delta
     dc = kw.pop('Delta', 0.0)
     # Check for single number or list
-    if type(dc).__name__ in ['ndarray', 'list', 'tuple']:
+    if isinstance(dc, (np.ndarray, list, tuple)):
         # Separate lower and upper limits
         cmin = vmu - dc[0]
         cmax = vmu + dc[1]
@@ -1005,21 +1128,8 @@ def plot_delta(ax, vmu, **kw):
         # Use as a single number
         cmin = vmu - dc
         cmax = vmu + dc
-    # Check orientation
-    if orient == 'vertical':
-        pmin, pmax = ax.get_ylim()
-        # Plot a vertical line for the min and max
-        h = (
-            plt.plot([cmin, cmin], [pmin, pmax], **kw) +
-            plt.plot([cmax, cmax], [pmin, pmax], **kw))
-    else:
-        pmin, pmax = ax.get_xlim()
-        # Plot a horizontal line for the min and max
-        h = (
-            plt.plot([pmin, pmax], [cmin, cmin], **kw) +
-            plt.plot([pmin, pmax], [cmax, cmax], **kw))
-    # Return
-    return h
+    # Plot a line for the min and max
+    return _plot_line_pair(ax, orient, cmin, cmax, **kw)
 
 
 # Histogram Labels Plotting
@@ -1044,27 +1154,27 @@ def histlab_part(lbl, pos1, pos2, ax, **kw):
             List of label instances
     :Versions:
         * 2019-03-14 ``@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Use offset transform for *y*
     """
     # Ensure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Remove orientation orientation
     kw.pop('orientation', None)
-    # get figure handdle
-    f = plt.gcf()
-    # Y-coordinates of the current axes w.r.t. figure scale
-    ya = ax.get_position().get_points()
-    ha = ya[1, 1] - ya[0, 1]
-    # Y-coordinates above and below the box
-    yf = 2.5 / ha / f.get_figheight()
-    yu = 1.0 + 0.065*yf
-    yl = 1.0 - 0.04*yf
     # Above/Below Spine location
-    if pos2:
-        y = yu
-    else:
-        y = yl
+    pos2 = bool(pos2)
+    # Get transforms previously used for this axes
+    transforms = _HISTLAB_TRANSFORMS.setdefault(ax, {})
+    trans = transforms.get(pos2)
+    # Create transform if needed
+    if trans is None:
+        # Fixed offset from top of axes, independent of axes position
+        trans = ax.transAxes + mpl.transforms.ScaledTranslation(
+            0.0, _HISTLAB_OFFSETS[pos2], ax.figure.dpi_scale_trans)
+        # Save it; it updates automatically if figure is resized
+        transforms[pos2] = trans
     # plot the label
-    h = plt.text(pos1, y, lbl, transform=ax.transAxes, **kw)
+    h = plt.text(pos1, 1.0, lbl, transform=trans, **kw)
     return h
 
 
@@ -1083,10 +1193,12 @@ def legend(ax=None, **kw):
     :Versions:
         * 2019-03-07 ``@ddalle``: First version
         * 2019-08-22 ``@ddalle``: From :func:`Part.legend_part`
+        * 2026-10-16 ``@agent``: Create legend once; no full draw
     """
    # --- Setup ---
     # Import modules if needed
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get font properties
     opts_prop = kw.pop("prop", {})
     # Default axis: most recent
@@ -1094,21 +1206,23 @@ def legend(ax=None, **kw):
         ax = plt.gca()
     # Get figure
     fig = ax.get_figure()
-   # --- Initial Attempt ---
-    # Initial legend attempt
-    try:
-        # Use the options with specified font
-        leg = ax.legend(prop=opts_prop, **kw)
-    except Exception:
-        # Remove font
-        opts_prop.pop("family", None)
-        # Do it again
-        leg = ax.legend(prop=opts_prop, **kw)
    # --- Font ---
-    # Number of entries in the legend
-    ntext = len(leg.get_texts())
+    # Number of entries in the legend (without creating it)
+    if kw.get("labels") is not None:
+        # Explicit labels
+        ntext = len(kw["labels"])
+    elif kw.get("handles") is not None:
+        # Labels of explicit handles, skipping hidden ones
+        ntext = len([
+            h for h in kw["handles"]
+            if not str(h.get_label()).startswith("_")])
+    else:
+        # Labels of artists that will be in legend
+        ntext = len(ax.get_legend_handles_labels()[1])
     # If no legends, remove it
     if ntext < 1:
+        # Create empty legend to return
+        leg = ax.legend(prop=opts_prop, **kw)
         # Delete legend
         leg.remove()
         # Exit function
@@ -1127,12 +1241,30 @@ def legend(ax=None, **kw):
     # Apply default font size
     opts_prop.setdefault("size", fsize)
    # --- Spacing ---
-    # Penultimate legend
-    leg = ax.legend(prop=opts_prop, **kw)
-    # We have to draw the figure in order to get legend box
-    fig.canvas.draw()
+    # Create legend once with final font
+    try:
+        # Use the options with specified font
+        leg = ax.legend(prop=opts_prop, **kw)
+    except Exception:
+        # Remove font
+        opts_prop.pop("family", None)
+        # Do it again
+        leg = ax.legend(prop=opts_prop, **kw)
+    # Get renderer without drawing the whole figure if possible
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    # Check for renderer
+    if get_renderer is None:
+        # We have to draw the figure in order to get legend box
+        fig.canvas.draw()
+        renderer = None
+    else:
+        # Use renderer to measure legend directly
+        renderer = get_renderer()
     # Get bounds of the legend box
-    bbox = leg.get_window_extent()
+    bbox = leg.get_window_extent(renderer)
+    # Apply any pending autoscaling before using data transformation
+    ax.get_xlim()
+    ax.get_ylim()
     # Transformation so we convert the bounds of the legend into data space
     trans = ax.transData.inverted()
     # Convert to data space
@@ -1143,7 +1275,7 @@ def legend(ax=None, **kw):
     # Get location
     loc = kw.get("loc")
     # Check for special cases
-    if loc in ["upper center", 9]:
+    if loc in ("upper center", 9):
         # Check bottom of legend box
         if ylmin < ymax:
             # Get axes limits
@@ -1152,7 +1284,7 @@ def legend(ax=None, **kw):
             yu = yb + max(0.0, ymax-ylmin)
             # Set new limits
             ax.set_ylim(ya, yu)
-    elif loc in ["lower center", 8]:
+    elif loc in ("lower center", 8):
         # Check top of legend box
         if ylmax > ymin:
             # Get axes limits
@@ -1167,7 +1299,7 @@ def legend(ax=None, **kw):
 
 
 # Axes format
-def format_axes(ax, **kw):
+def format_axes(ax, _lim_cache=None, **kw):
     """Format and label axes
 
     :Call:
@@ -1175,6 +1307,8 @@ def format_axes(ax, **kw):
     :Inputs:
         *ax*: :class:`matplotlib.axes._subplots.AxesSubplot`
             Axes handle
+        *_lim_cache*: {``None``} | :class:`dict`
+            Data limits shared with :func:`format_spines`
     :Outputs:
         *xl*: :class:`matplotlib.text.Text`
             X label
@@ -1182,10 +1316,12 @@ def format_axes(ax, **kw):
             Y label
     :Versions:
         * 2019-03-06 ``@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Added *_lim_cache*
     """
    # --- Prep ---
     # Make sure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
    # --- Labels ---
     # Get user-specified axis labels
     xlbl = kw.pop("XLabel", None)
@@ -1222,8 +1358,9 @@ def format_axes(ax, **kw):
     xpad = kw.pop("XPad", kw.pop("xpad", pad))
     ypad = kw.pop("YPad", kw.pop("ypad", pad))
     # Get limits that include all data (and not extra).
-    xmin, xmax = get_xlim(ax, pad=xpad)
-    ymin, ymax = get_ylim(ax, pad=ypad)
+    xmin, xmax, ymin, ymax = _get_data_lim(ax, _lim_cache)
+    xmin, xmax = _pad_lim(xmin, xmax, pad=xpad)
+    ymin, ymax = _pad_lim(ymin, ymax, pad=ypad)
     # Remove remaining ``None`` imputs
     kw = genopts.denone(kw)
     # Check for specified limits
@@ -1271,7 +1408,8 @@ def grid(ax, **kw):
         * 2019-03-07 ``@jmeeroff``: First version
     """
     # Make sure pyplot loaded
-    import_pyplot()
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Get grid option
     ogrid = kw.pop("MajorGrid", kw.pop("Grid", None))
     # Check value
@@ -1311,6 +1449,24 @@ def grid(ax, **kw):
         ax.grid(False)
 
 
+# Actions for each valid :func:`format_spine1` option
+_SPINE_ACTIONS = {
+    # Leave as is
+    None: lambda spine, vmin, vmax: None,
+    # Turn on
+    True: lambda spine, vmin, vmax: spine.set_visible(True),
+    "on": lambda spine, vmin, vmax: spine.set_visible(True),
+    # Turn off
+    False: lambda spine, vmin, vmax: spine.set_visible(False),
+    "off": lambda spine, vmin, vmax: spine.set_visible(False),
+    # Set limits
+    "clip": lambda spine, vmin, vmax: spine.set_bounds(vmin, vmax),
+    "clipped": lambda spine, vmin, vmax: spine.set_bounds(vmin, vmax),
+    "truncate": lambda spine, vmin, vmax: spine.set_bounds(vmin, vmax),
+    "truncated": lambda spine, vmin, vmax: spine.set_bounds(vmin, vmax),
+}
+
+
 # Single spine: extents
 def format_spine1(spine, opt, vmin, vmax):
     """Apply formatting to a single spine
@@ -1328,37 +1484,77 @@ def format_spine1(spine, opt, vmin, vmax):
             If using clipped spines, maximum value for spine (data space)
     :Versions:
         * 2019-03-08 ``@ddalle``: First version
+        * 2026-10-16 ``@agent``: Use *_SPINE_ACTIONS* lookup
     """
-    # Process it
-    if opt is None:
-        # Leave as is
-        pass
-    elif opt is True:
-        # Turn on
-        spine.set_visible(True)
-    elif opt is False:
-        # Turn off
-        spine.set_visible(False)
-    elif typeutils.isstr(opt):
-        # Check value
-        if opt == "on":
-            # Same as ``True``
-            spine.set_visible(True)
-        elif opt == "off":
-            # Same as ``False``
-            spine.set_visible(False)
-        elif opt in ["clip", "clipped", "truncate", "truncated"]:
-            # Set limits
-            spine.set_bounds(vmin, vmax)
-        else:
+    # Look up action for this option
+    try:
+        action = _SPINE_ACTIONS.get(opt)
+    except TypeError:
+        # Unhashable option
+        action = None
+    # Check for invalid option
+    if action is None:
+        # Check type for error message
+        if typeutils.isstr(opt):
             raise ValueError("Could not process spine option '%s'" % opt)
-    else:
-        raise TypeError("Could not process spine option " +
-                        ("of type '%s'" % opt.__class__))
+        else:
+            raise TypeError("Could not process spine option " +
+                            ("of type '%s'" % opt.__class__))
+    # Apply it
+    action(spine, vmin, vmax)
+
+
+# Spine names, option prefixes, and paired option prefixes
+_SPINE_SPECS = (
+    ("left", "Left", "Y"),
+    ("right", "Right", "Y"),
+    ("top", "Top", "X"),
+    ("bottom", "Bottom", "X"),
+)
+# :func:`tick_params` keywords for ticks on each spine
+_TICK_KEYS = {
+    "Left": "left",
+    "Right": "right",
+    "Top": "top",
+    "Bottom": "bottom",
+}
+# :func:`tick_params` keywords for tick labels on each spine
+_TICKLABEL_KEYS = {
+    "Left": "labelleft",
+    "Right": "labelright",
+    "Top": "labeltop",
+    "Bottom": "labelbottom",
+}
+
+
+# Combine inherited options
+def _merge_opts(base, opts):
+    """Combine options with inherited defaults, copying only if needed
+
+    :Call:
+        >>> kw = _merge_opts(base, opts)
+    :Inputs:
+        *base*: :class:`dict`
+            Inherited options
+        *opts*: :class:`dict`
+            Options that take precedence over *base*
+    :Outputs:
+        *kw*: :class:`dict`
+            Combined options; *base* itself if *opts* is empty
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for anything to add
+    if not opts:
+        return base
+    elif not base:
+        return opts
+    # Combine
+    return dict(base, **opts)
 
 
 # Spine formatting
-def format_spines(ax, **kw):
+def format_spines(ax, _lim_cache=None, **kw):
     """Manipulate spines (ticks, extents, etc.)
 
     :Call:
@@ -1366,24 +1562,23 @@ def format_spines(ax, **kw):
     :Inputs:
         *ax*: :class:`matplotlib.axes._subplots.AxesSubplot`
             Axes handle
+        *_lim_cache*: {``None``} | :class:`dict`
+            Data limits shared with :func:`format_axes`
     :Effects:
         *ax*: :class:`matplotlib.axes._subplots.AxesSubplot`
             Grid lines added to axes
     :Versions:
         * 2019-03-07 ``@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Loop through *_SPINE_SPECS*; add *_lim_cache*
     """
    # --- Setup ---
     # Make sure pyplot loaded
-    import_pyplot()
-    # Get spine handles
-    spineL = ax.spines["left"]
-    spineR = ax.spines["right"]
-    spineT = ax.spines["top"]
-    spineB = ax.spines["bottom"]
+    if not _PYPLOT_READY:
+        import_pyplot()
     # Set default flags to "clipped" if certain other options are present
     # In particular, if manual bounds are specified, set the default spine
     # option to "clipped" unless otherwise specified
-    for d in ["X", "Left", "Right", "Y", "Top", "Bottom"]:
+    for d in ("X", "Left", "Right", "Y", "Top", "Bottom"):
         # Spine flag
         k = d + "Spine"
         # Key for min and max spine values
@@ -1396,93 +1591,63 @@ def format_spines(ax, **kw):
             kw.setdefault(k, "clipped")
    # --- Data/Spine Bounds ---
     # Get existing data limits
-    xmin, xmax = get_xlim(ax, pad=0.0)
-    ymin, ymax = get_ylim(ax, pad=0.0)
+    xmin, xmax, ymin, ymax = _get_data_lim(ax, _lim_cache)
+    xmin, xmax = _pad_lim(xmin, xmax, pad=0.0)
+    ymin, ymax = _pad_lim(ymin, ymax, pad=0.0)
     # Process manual limits for min and max spines
-    xa = kw.pop("XSpineMin", xmin)
-    xb = kw.pop("XSpineMax", xmax)
-    ya = kw.pop("YSpineMin", ymin)
-    yb = kw.pop("YSpineMax", ymax)
-    # Process manual limits for individual spines
-    yaL = kw.pop("LeftSpineMin", ya)
-    ybL = kw.pop("LeftSpineMax", yb)
-    yaR = kw.pop("RightSpineMin", ya)
-    ybR = kw.pop("RightSpineMax", yb)
-    xaB = kw.pop("BottomSpineMin", xa)
-    xbB = kw.pop("BottomSpineMax", xb)
-    xaT = kw.pop("TopSpineMin", xa)
-    xbT = kw.pop("TopSpineMax", xb)
+    lims = {
+        "X": (kw.pop("XSpineMin", xmin), kw.pop("XSpineMax", xmax)),
+        "Y": (kw.pop("YSpineMin", ymin), kw.pop("YSpineMax", ymax)),
+    }
    # --- Overall Spine Options ---
     # Option to turn off all spines
     qs = kw.pop("Spines", None)
     # Only valid options are ``None`` and ``False``
     if qs is not False: qs = None
-    # Spine pairs options
-    qX = kw.pop("XSpine", qs)
-    qY = kw.pop("YSpine", qs)
-    # Left spine options
-    qL = kw.pop("LeftSpine",   qY)
-    qR = kw.pop("RightSpine",  qY)
-    qT = kw.pop("TopSpine",    qX)
-    qB = kw.pop("BottomSpine", qX)
-   # --- Spine On/Off Extents ---
-    # Process these options
-    format_spine1(spineL, qL, yaL, ybL)
-    format_spine1(spineR, qR, yaR, ybR)
-    format_spine1(spineT, qT, xaT, xbT)
-    format_spine1(spineB, qB, xaB, xbB)
-   # --- Spine Formatting ---
-    # Paired options
-    spopts = kw.pop("SpineOptions", {})
-    xsopts = kw.pop("XSpineOptions", {})
-    ysopts = kw.pop("YSpineOptions", {})
-    # Individual spines
-    lsopts = kw.pop("LeftSpineOptions", {})
-    rsopts = kw.pop("RightSpineOptions", {})
-    bsopts = kw.pop("BottomSpineOptions", {})
-    tsopts = kw.pop("TopSpineOptions", {})
-    # Combine settings
-    xsopts = dict(spopts, **xsopts)
-    ysopts = dict(spopts, **ysopts)
-    lsopts = dict(ysopts, **lsopts)
-    rsopts = dict(ysopts, **rsopts)
-    bsopts = dict(xsopts, **bsopts)
-    tsopts = dict(xsopts, **tsopts)
-    # Apply spine options
-    spineL.set(**lsopts)
-    spineR.set(**rsopts)
-    spineB.set(**bsopts)
-    spineT.set(**tsopts)
-   # --- Tick Settings ---
     # Option to turn off all ticks
     qt = kw.pop("Ticks", None)
     # Only valid options are ``None`` and ``False``
     if qt is not False: qt = None
-    # Options for ticks on each axis
-    qtL = kw.pop("LeftSpineTicks",   qt and qL)
-    qtR = kw.pop("RightSpineTicks",  qt and qR)
-    qtB = kw.pop("BottomSpineTicks", qt and qB)
-    qtT = kw.pop("TopSpineTicks",    qt and qT)
-    # Turn on/off
-    if qtL is not None: ax.tick_params(left=qtL)
-    if qtR is not None: ax.tick_params(right=qtR)
-    if qtB is not None: ax.tick_params(bottom=qtB)
-    if qtT is not None: ax.tick_params(top=qtT)
-   # --- Tick label settings ---
     # Option to turn off all tick labels
     qtl = kw.pop("TickLabels", None)
     # Only valid options are ``None`` and ``False``
     if qtl is not False: qtl = None
-    # Options for labels on each spine
-    qtlL = kw.pop("LeftTickLabels",   qtl)
-    qtlR = kw.pop("RightTickLabels",  qtl)
-    qtlB = kw.pop("BottomTickLabels", qtl)
-    qtlT = kw.pop("TopTickLabels",    qtl)
-    # Turn on/off labels
-    if qtlL is not None: ax.tick_params(labelleft=qtlL)
-    if qtlR is not None: ax.tick_params(labelright=qtlR)
-    if qtlB is not None: ax.tick_params(labelbottom=qtlB)
-    if qtlT is not None: ax.tick_params(labeltop=qtlT)
+    # Spine pairs options
+    qpair = {
+        "X": kw.pop("XSpine", qs),
+        "Y": kw.pop("YSpine", qs),
+    }
+    # Spine formatting options, including paired options
+    spopts = kw.pop("SpineOptions", {})
+    popts = {
+        "X": _merge_opts(spopts, kw.pop("XSpineOptions", {})),
+        "Y": _merge_opts(spopts, kw.pop("YSpineOptions", {})),
+    }
+   # --- Individual Spines ---
+    # Spine handles
+    h = {}
+    # Loop through spines
+    for name, d, p in _SPINE_SPECS:
+        # Get spine handle
+        spine = ax.spines[name]
+        h[name] = spine
+        # Limits of paired spine
+        va, vb = lims[p]
+        # Process manual limits for individual spine
+        va = kw.pop(d + "SpineMin", va)
+        vb = kw.pop(d + "SpineMax", vb)
+        # On/off option
+        q = kw.pop(d + "Spine", qpair[p])
+        # Apply on/off or extents
+        format_spine1(spine, q, va, vb)
+        # Apply spine options
+        spine.set(**_merge_opts(popts[p], kw.pop(d + "SpineOptions", {})))
+        # Turn on/off ticks
+        qtk = kw.pop(d + "SpineTicks", qt and q)
+        if qtk is not None: ax.tick_params(**{_TICK_KEYS[d]: qtk})
+        # Turn on/off tick labels
+        qtk = kw.pop(d + "TickLabels", qtl)
+        if qtk is not None: ax.tick_params(**{_TICKLABEL_KEYS[d]: qtk})
    # --- Tick Formatting ---
     # Directions
     tkdir = kw.pop("TickDirection", "out")
@@ -1496,21 +1661,16 @@ def format_spines(ax, **kw):
     xtopts = kw.pop("XTickOptions", {})
     ytopts = kw.pop("YTickOptions", {})
     # Inherit options from spines
-    tkopts = dict(spopts, **tkopts)
-    xtopts = dict(xsopts, **xtopts)
-    ytopts = dict(ysopts, **ytopts)
+    tkopts = _merge_opts(spopts, tkopts)
+    xtopts = _merge_opts(popts["X"], xtopts)
+    ytopts = _merge_opts(popts["Y"], ytopts)
     # Apply
     ax.tick_params(axis="both", **tkopts)
     ax.tick_params(axis="x",    **xtopts)
     ax.tick_params(axis="y",    **ytopts)
    # --- Output ---
     # Return all spine handles
-    return {
-        "left":   spineL,
-        "right":  spineR,
-        "top":    spineT,
-        "bottom": spineB,
-    }
+    return h
 
 
 # Convert min/max to error bar widths
@@ -1531,13 +1691,32 @@ def minmax_to_errorbar(yv, ymin, ymax):
             Array of lower, upper error bar widths
     :Versions:
         * 2019-03-06 ``@ddalle/@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Use compiled kernel if available
     """
-    # Widths of *ymax* above *yv*
-    yu = ymax - np.asarray(yv)
+    # Ensure arrays (keeping input precision); lists would otherwise be
+    # read as dtype specs by np.result_type()
+    yv = np.asarray(yv)
+    ymin = np.asarray(ymin)
+    ymax = np.asarray(ymax)
+    # Check for compiled kernel and matching 1D arrays
+    if kernels.numba:
+        # Check shapes
+        if yv.ndim == 1 and ymin.shape == ymax.shape == yv.shape:
+            # Initialize output
+            yerr = np.empty((2, yv.size), dtype=np.result_type(yv, ymin, ymax))
+            # Single pass through all three arrays
+            kernels.minmax_to_errorbar(yv, ymin, ymax, yerr)
+            # Output
+            return yerr
+    # Shape and type of each row of output
+    shape = np.broadcast(yv, ymin, ymax).shape
+    dtype = np.result_type(yv, ymin, ymax)
+    # Initialize output
+    yerr = np.empty((2,) + shape, dtype=dtype)
     # Widths of *ymin* below *yv*
-    yl = np.asarray(yv) - ymin
-    # Separate error bars
-    yerr = np.array([yl, yu])
+    np.subtract(yv, ymin, out=yerr[0])
+    # Widths of *ymax* above *yv*
+    np.subtract(ymax, yv, out=yerr[1])
     # Output
     return yerr
 
@@ -1559,18 +1738,20 @@ def errorbar_to_minmax(yv, yerr):
             Maximum values of region plot
     :Versions:
         * 2019-03-06 ``@ddalle/@jmeeroff``: First version
+        * 2026-10-16 ``@agent``: Use compiled kernel if available
     """
-    # Ensure arrays
+    # Ensure array
     yv = np.asarray(yv)
+    # Check for scalar width before any conversion
+    if np.isscalar(yerr) or getattr(yerr, "ndim", None) == 0:
+        # Scalar: simple arithmetic, keeping precision of *yerr*
+        return yv - yerr, yv + yerr
+    # Ensure array
     yerr = np.asarray(yerr)
     # Length of *yv*
     N = yv.size
     # Check number of dimensions of *yerr*
-    if yerr.ndim == 0:
-        # Scalar: simple arithmetic
-        ymax = yv + yerr
-        ymin = yv - yerr
-    elif yerr.ndim == 1:
+    if yerr.ndim == 1:
         # Single array: check size
         if yerr.size != N:
             raise ValueError(
@@ -1587,9 +1768,17 @@ def errorbar_to_minmax(yv, yerr):
         elif yerr.shape[1] != N:
             raise ValueError(
                 "Error bar width vector does not match size of main data")
-        # Separate above/below deltas
-        ymax = yv + yerr[1]
-        ymin = yv - yerr[0]
+        # Check for compiled kernel
+        if kernels.numba and yv.ndim == 1:
+            # Initialize outputs
+            ymin = np.empty(N, dtype=np.result_type(yv, yerr))
+            ymax = np.empty(N, dtype=ymin.dtype)
+            # Single pass through *yv* and *yerr*
+            kernels.errorbar_to_minmax(yv, yerr, ymin, ymax)
+        else:
+            # Separate above/below deltas
+            ymax = yv + yerr[1]
+            ymin = yv - yerr[0]
     else:
         # 3D or more array
         raise ValueError(
@@ -1620,46 +1809,59 @@ def get_ylim(ax, pad=0.05):
     :Versions:
         * 2015-07-06 ``@ddalle``: First version
         * 2019-03-07 ``@ddalle``: Added ``"LineCollection"``
+        * 2026-10-16 ``@agent``: Split into :func:`_get_ydata_lim`
+    """
+    # Get data limits and pad them
+    return _pad_lim(*_get_ydata_lim(ax), pad=pad)
+
+
+# Get unpadded *y* data limits
+def _get_ydata_lim(ax):
+    """Calculate *y*-limits of all lines, collections, and rectangles
+
+    :Call:
+        >>> ymin, ymax = _get_ydata_lim(ax)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+    :Outputs:
+        *ymin*: :class:`float`
+            Minimum *y* coordinate of plotted data
+        *ymax*: :class:`float`
+            Maximum *y* coordinate of plotted data
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_ylim`
     """
     # Initialize limits.
     ymin = np.inf
     ymax = -np.inf
+    # Limits of each artist
+    vmins = []
+    vmaxs = []
     # Loop through all children of the input axes.
     for h in ax.get_children():
-        # Get the type.
-        t = type(h).__name__
-        # Check the class.
-        if t == 'Line2D':
-            # Get the y data for this line
-            ydata = h.get_ydata()
-            # Check the min and max data
-            if len(ydata) > 0:
-                ymin = min(ymin, min(h.get_ydata()))
-                ymax = max(ymax, max(h.get_ydata()))
-        elif t in ['PathCollection', 'PolyCollection', 'LineCollection']:
-            # Loop through paths
-            for P in h.get_paths():
-                # Get the coordinates
-                ymin = min(ymin, min(P.vertices[:, 1]))
-                ymax = max(ymax, max(P.vertices[:, 1]))
-        elif t in ["Rectangle"]:
-            # Skip if invisible
-            if h.axes is None: continue
-            # Get bounding box
-            bbox = h.get_bbox().extents
-            # Combine limits
-            ymin = min(ymin, bbox[1])
-            ymax = max(ymax, bbox[3])
-    # Check for identical values
-    if ymax - ymin <= 0.1*pad:
-        # Expand by manual amount
-        ymax += pad*abs(ymax)
-        ymin -= pad*abs(ymin)
-    # Add padding.
-    yminv = (1+pad)*ymin - pad*ymax
-    ymaxv = (1+pad)*ymax - pad*ymin
+        # Skip hidden artists
+        if not h.get_visible():
+            continue
+        # Get function to process this type
+        fn = _LIM_HANDLERS.get(type(h).__name__)
+        # Skip types that don't contain data
+        if fn is None:
+            continue
+        # Get limits of this artist
+        lim = fn(ax, h, 1)
+        # Check for skipped artist
+        if lim is None:
+            continue
+        # Save limits
+        vmins.append(lim[0])
+        vmaxs.append(lim[1])
+    # Combine limits (ignoring NaNs)
+    if vmins:
+        ymin = np.fmin.reduce(vmins)
+        ymax = np.fmax.reduce(vmaxs)
     # Output
-    return yminv, ymaxv
+    return ymin, ymax
 
 
 # Function to automatically get inclusive data limits.
@@ -1684,44 +1886,364 @@ def get_xlim(ax, pad=0.05):
     :Versions:
         * 2015-07-06 ``@ddalle``: First version
         * 2019-03-07 ``@ddalle``: Added ``"LineCollection"``
+        * 2026-10-16 ``@agent``: Split into :func:`_get_xdata_lim`
+    """
+    # Get data limits and pad them
+    return _pad_lim(*_get_xdata_lim(ax), pad=pad)
+
+
+# Get unpadded *x* data limits
+def _get_xdata_lim(ax):
+    """Calculate *x*-limits of all lines, collections, and rectangles
+
+    :Call:
+        >>> xmin, xmax = _get_xdata_lim(ax)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+    :Outputs:
+        *xmin*: :class:`float`
+            Minimum *x* coordinate of plotted data
+        *xmax*: :class:`float`
+            Maximum *x* coordinate of plotted data
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_xlim`
     """
     # Initialize limits.
     xmin = np.inf
     xmax = -np.inf
+    # Limits of each artist
+    vmins = []
+    vmaxs = []
     # Loop through all children of the input axes.
-    for h in ax.get_children()[:-1]:
-        # Get the type.
-        t = type(h).__name__
-        # Check the class.
-        if t == 'Line2D':
-            # Get data
-            xdata = h.get_xdata()
-            # Check the min and max data
-            if len(xdata) > 0:
-                xmin = min(xmin, np.min(h.get_xdata()))
-                xmax = max(xmax, np.max(h.get_xdata()))
-        elif t in ['PathCollection', 'PolyCollection', 'LineCollection']:
-            # Loop through paths
-            for P in h.get_paths():
-                # Get the coordinates
-                xmin = min(xmin, np.min(P.vertices[:, 0]))
-                xmax = max(xmax, np.max(P.vertices[:, 0]))
-        elif t in ["Rectangle"]:
-            # Skip if invisible
-            if h.axes is None: continue
-            # Get bounding box
-            bbox = h.get_bbox().extents
-            # Combine limits
-            xmin = min(xmin, bbox[0])
-            xmax = max(xmax, bbox[2])
-    # Check for identical values
-    if xmax - xmin <= 0.1*pad:
-        # Expand by manual amount
-        xmax += pad*abs(xmax)
-        xmin -= pad*abs(xmin)
+    for h in ax.get_children():
+        # Skip axes background
+        if h is ax.patch:
+            continue
+        # Skip hidden artists
+        if not h.get_visible():
+            continue
+        # Get function to process this type
+        fn = _LIM_HANDLERS.get(type(h).__name__)
+        # Skip types that don't contain data
+        if fn is None:
+            continue
+        # Get limits of this artist
+        lim = fn(ax, h, 0)
+        # Check for skipped artist
+        if lim is None:
+            continue
+        # Save limits
+        vmins.append(lim[0])
+        vmaxs.append(lim[1])
+    # Combine limits (ignoring NaNs)
+    if vmins:
+        xmin = np.fmin.reduce(vmins)
+        xmax = np.fmax.reduce(vmaxs)
+    # Output
+    return xmin, xmax
+
+
+# Minimum and maximum of data
+def _minmax(v):
+    """Get minimum and maximum of an array, ignoring NaNs
+
+    This uses a single pass through *v* with
+    :func:`cape.tnakit.plot_mpl.kernels.minmax` if :mod:`numba` is
+    available.
+
+    :Call:
+        >>> vmin, vmax = _minmax(v)
+    :Inputs:
+        *v*: :class:`np.ndarray`
+            Nonempty array of values
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum non-NaN value
+        *vmax*: :class:`float`
+            Maximum non-NaN value
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for compiled kernel and float data
+    if kernels.numba and v.ndim == 1 and v.dtype.kind == "f":
+        # Single pass
+        return kernels.minmax(v)
+    # Separate reductions
+    return np.fmin.reduce(v, axis=None), np.fmax.reduce(v, axis=None)
+
+
+# Cached minimum and maximum of artist data
+def _cached_minmax(h, arrays, j, cache):
+    """Get minimum and maximum of an artist's data, reusing old values
+
+    The extrema are saved in *cache* along with the data arrays
+    themselves.  They are reused as long as the artist still holds the
+    same array objects, so replacing data (e.g. with
+    :func:`Line2D.set_ydata`) invalidates the saved values, but
+    modifying an array in place does not.
+
+    :Call:
+        >>> vmin, vmax = _cached_minmax(h, arrays, j, cache)
+    :Inputs:
+        *h*: :class:`matplotlib.artist.Artist`
+            Line or collection
+        *arrays*: :class:`tuple`\ [:class:`np.ndarray`]
+            Data arrays of *h*
+        *j*: ``None`` | :class:`int`
+            Column of each array to use, if any
+        *cache*: :class:`weakref.WeakKeyDictionary`
+            Previous results, keyed by artist
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum non-NaN value (``inf`` if none)
+        *vmax*: :class:`float`
+            Maximum non-NaN value (``-inf`` if none)
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for previous results
+    rc = cache.get(h)
+    # Check if data arrays are unchanged
+    if rc is not None and len(rc[0]) == len(arrays):
+        # Compare array identities
+        if all(a is b for a, b in zip(rc[0], arrays)):
+            return rc[1], rc[2]
+    # Ensure arrays and get column
+    if j is None:
+        vs = [np.asarray(v) for v in arrays]
+    else:
+        vs = [np.asarray(v)[:, j] for v in arrays]
+    # Skip empty arrays
+    vs = [v for v in vs if v.size > 0]
+    # Check for any data
+    if len(vs) == 0:
+        # No data
+        vmin = np.inf
+        vmax = -np.inf
+    else:
+        # Stack arrays (e.g. paths of a collection) for one reduction
+        v = vs[0] if len(vs) == 1 else np.concatenate(vs)
+        # Get min and max, ignoring NaNs
+        vmin, vmax = _minmax(v)
+        # Check for all NaNs
+        if vmin != vmin:
+            vmin = np.inf
+            vmax = -np.inf
+    # Save results
+    cache[h] = (arrays, vmin, vmax)
+    # Output
+    return vmin, vmax
+
+
+# Data limits of a line
+def _lim_line(ax, h, j):
+    """Get data limits of a line along one axis
+
+    :Call:
+        >>> vmin, vmax = _lim_line(ax, h, j)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+        *h*: :class:`matplotlib.lines.Line2D`
+            Line handle
+        *j*: ``0`` | ``1``
+            Axis index, ``0`` for *x* or ``1`` for *y*
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum coordinate
+        *vmax*: :class:`float`
+            Maximum coordinate
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_ylim`
+    """
+    # Check axis
+    if j == 0:
+        # Internal float data array (no copy)
+        v = h.get_xdata(orig=False)
+        # Get min and max of *x* data (reusing previous values)
+        return _cached_minmax(h, (v,), None, _XLIM_CACHE)
+    else:
+        # Internal float data array (no copy)
+        v = h.get_ydata(orig=False)
+        # Get min and max of *y* data (reusing previous values)
+        return _cached_minmax(h, (v,), None, _YLIM_CACHE)
+
+
+# Data limits of a collection
+def _lim_paths(ax, h, j):
+    """Get data limits of all paths in a collection along one axis
+
+    :Call:
+        >>> vmin, vmax = _lim_paths(ax, h, j)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+        *h*: :class:`matplotlib.collections.Collection`
+            Path, polygon, or line collection
+        *j*: ``0`` | ``1``
+            Axis index, ``0`` for *x* or ``1`` for *y*
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum coordinate
+        *vmax*: :class:`float`
+            Maximum coordinate
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_ylim`
+    """
+    # Cache for this axis
+    cache = _YLIM_CACHE if j else _XLIM_CACHE
+    # Get min and max of path coordinates (reusing previous values)
+    return _cached_minmax(
+        h, tuple(P.vertices for P in h.get_paths()), j, cache)
+
+
+# Data limits of a rectangle
+def _lim_rect(ax, h, j):
+    """Get data limits of a rectangle, such as a histogram bar
+
+    :Call:
+        >>> lim = _lim_rect(ax, h, j)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+        *h*: :class:`matplotlib.patches.Rectangle`
+            Rectangle handle
+        *j*: ``0`` | ``1``
+            Axis index, ``0`` for *x* or ``1`` for *y*
+    :Outputs:
+        *lim*: ``None`` | (:class:`float`, :class:`float`)
+            Minimum and maximum coordinate, if applicable
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_ylim`
+    """
+    # Skip if detached or invisible
+    if h.axes is None or not h.get_visible():
+        return
+    # Skip axes background
+    if h is ax.patch:
+        return
+    # Transform for spans that use axes coordinates along axis *j*
+    if j == 0:
+        # Horizontal spans (*x* in axes coordinates)
+        tspan = ax.get_yaxis_transform()
+    else:
+        # Vertical spans (*y* in axes coordinates)
+        tspan = ax.get_xaxis_transform()
+    # Skip spans
+    if h.get_data_transform() is tspan:
+        return
+    # Get bounding box
+    bbox = h.get_bbox().extents
+    # Output
+    return bbox[j], bbox[j+2]
+
+
+# Data limits of an image
+def _lim_image(ax, h, j):
+    """Get data limits of an image from its extent
+
+    :Call:
+        >>> vmin, vmax = _lim_image(ax, h, j)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+        *h*: :class:`matplotlib.image.AxesImage`
+            Image handle
+        *j*: ``0`` | ``1``
+            Axis index, ``0`` for *x* or ``1`` for *y*
+    :Outputs:
+        *vmin*: :class:`float`
+            Minimum coordinate
+        *vmax*: :class:`float`
+            Maximum coordinate
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Get (left, right, bottom, top) extents
+    ext = h.get_extent()
+    # Bounds along axis *j* (may be flipped)
+    va = ext[2*j]
+    vb = ext[2*j + 1]
+    # Output
+    return min(va, vb), max(va, vb)
+
+
+# Functions to get data limits for each artist type
+_LIM_HANDLERS = {
+    "Line2D": _lim_line,
+    "PathCollection": _lim_paths,
+    "PolyCollection": _lim_paths,
+    "FillBetweenPolyCollection": _lim_paths,
+    "LineCollection": _lim_paths,
+    "Rectangle": _lim_rect,
+    "AxesImage": _lim_image,
+}
+
+
+# Add padding to data limits
+def _pad_lim(vmin, vmax, pad=0.05):
+    """Add padding to data limits
+
+    :Call:
+        >>> vminv, vmaxv = _pad_lim(vmin, vmax, pad=0.05)
+    :Inputs:
+        *vmin*: :class:`float`
+            Minimum data value
+        *vmax*: :class:`float`
+            Maximum data value
+        *pad*: :class:`float`
+            Extra padding to min and max values to plot.
+    :Outputs:
+        *vminv*: :class:`float`
+            Minimum coordinate including padding
+        *vmaxv*: :class:`float`
+            Maximum coordinate including padding
+    :Versions:
+        * 2026-10-16 ``@agent``: Split from :func:`get_xlim`
+    """
+    # Check for (nearly) identical values
+    degen = np.asarray(vmax - vmin) <= 0.1*pad
+    # Expand by manual amount in that case (zero offset otherwise)
+    vmax = vmax + np.where(degen, pad*np.abs(vmax), 0.0)
+    vmin = vmin - np.where(degen, pad*np.abs(vmin), 0.0)
     # Add padding.
-    xminv = (1+pad)*xmin - pad*xmax
-    xmaxv = (1+pad)*xmax - pad*xmin
+    vminv = (1+pad)*vmin - pad*vmax
+    vmaxv = (1+pad)*vmax - pad*vmin
     # Output
-    return xminv, xmaxv
+    return vminv, vmaxv
+
+
+# Get data limits, reusing previous calculation
+def _get_data_lim(ax, lim_cache=None):
+    """Get unpadded *x* and *y* data limits, reusing cached values
 
+    :Call:
+        >>> xmin, xmax, ymin, ymax = _get_data_lim(ax, lim_cache=None)
+    :Inputs:
+        *ax*: :class:`matplotlib.axes.AxesSubplot`
+            Axis handle
+        *lim_cache*: {``None``} | :class:`dict`
+            Limits from previous call for same *ax*; filled if empty
+    :Outputs:
+        *xmin*: :class:`float`
+            Minimum *x* coordinate of plotted data
+        *xmax*: :class:`float`
+            Maximum *x* coordinate of plotted data
+        *ymin*: :class:`float`
+            Minimum *y* coordinate of plotted data
+        *ymax*: :class:`float`
+            Maximum *y* coordinate of plotted data
+    :Versions:
+        * 2026-10-16 ``@agent``: First version
+    """
+    # Check for previous limits
+    if lim_cache:
+        return lim_cache["lim"]
+    # Calculate limits
+    lim = _get_xdata_lim(ax) + _get_ydata_lim(ax)
+    # Save them
+    if lim_cache is not None:
+        lim_cache["lim"] = lim
+    # Output
+    return lim
@@ -140,6 +140,10 @@ def get_cov_interval(dx, cov, **kw):
         *osig*, *OutlierSigma*: {``1.5*ksig``} | :class:`float`
             Multiple of standard deviation to identify outliers; default is
             150% of the nominal coverage calculated using t-distribution.
+        *mu*: {``None``} | :class:`float`
+            Mean of *dx*, if already calculated
+        *std*: {``None``} | :class:`float`
+            Standard deviation of *dx*, if already calculated
     :Outputs:
         *a*: :class:`float`
             Lower bound of coverage interval
@@ -148,6 +152,7 @@ def get_cov_interval(dx, cov, **kw):
     :Versions:
         * 2019-02-04 ``@ddalle``: First version
         * 2019-02-13 ``@ddalle``: Moved to :mod:`stats`
+        * 2026-10-16 ``@agent``: Add *mu* and *std* options
     """
    # --- Setup ---
     # Enforce array
@@ -162,9 +167,13 @@ def get_cov_interval(dx, cov, **kw):
     # Outlier cutoff
     osig = kw.get('OutlierSigma', kw.get("osig", 1.5*ksig))
    # --- Initial Stats ---
-    # Calculate mean and sigma
-    vmu = np.mean(dx)
-    vstd = np.std(dx)
+    # Calculate mean and sigma unless provided
+    vmu = kw.get("mu")
+    vstd = kw.get("std")
+    if vmu is None:
+        vmu = np.mean(dx)
+    if vstd is None:
+        vstd = np.std(dx)
    # --- Outliers ---
     # Find outliers
     I = np.abs(dx-vmu)/vstd > osig
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import matplotlib.pyplot as plt
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tnakit.plot_mpl as pmpl
+
+
+# File names
+PNGFILE = "bullet-xz.png"
+
+
+# Test subplots of a row
+@testutils.run_testdir(__file__)
+def test_01_subplot_row():
+    # Simple data
+    x = np.linspace(0, 4, 21)
+    # Create figure with two axes in a row
+    fig = pmpl.figure()
+    ax1 = fig.add_subplot(121)
+    ax2 = fig.add_subplot(122)
+    # Plot something with labels in each
+    ax1.plot(x, x**2)
+    ax1.set_xlabel("x")
+    ax1.set_ylabel("y")
+    ax2.plot(x, -x)
+    ax2.set_ylabel("y2")
+    # Format as a row
+    pmpl.axes_adjust_row(fig, SubplotRubber=1)
+    # Get positions
+    xa1, ya1, wa1, ha1 = ax1.get_position().bounds
+    xa2, ya2, wa2, ha2 = ax2.get_position().bounds
+    plt.close(fig)
+    # Axes share vertical extents
+    assert abs(ya1 - ya2) <= 1e-8
+    assert abs(ha1 - ha2) <= 1e-8
+    # Left axes is ahead of right axes without overlap
+    assert 0.0 < xa1 < xa1 + wa1 < xa2 < xa2 + wa2 < 1.0
+    # Rubber (first) axes takes up extra width
+    assert wa1 > wa2
+
+
+# Test image from array
+@testutils.run_sandbox(__file__, PNGFILE)
+def test_02_imshow_array():
+    # Read the image file
+    h = pmpl.plot([0.0, 4.0], [0.0, 0.0])
+    img1 = pmpl.imshow(PNGFILE, ImageXMin=-0.15, ImageXMax=4.12)
+    # Use the array of the same image
+    png = img1.get_array()
+    img2 = pmpl.imshow(png, ImageXMin=-0.15, ImageXMax=4.12)
+    # Same extents either way
+    assert np.allclose(img1.get_extent(), img2.get_extent())
+    # 1D arrays are not images
+    try:
+        pmpl.imshow(np.zeros(4))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("imshow() accepted 1D array")
+    h.close()
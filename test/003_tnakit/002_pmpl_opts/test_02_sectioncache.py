@@ -0,0 +1,35 @@
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.tnakit.plot_mpl import MPLOpts
+
+
+# Test that saved sections are discarded when options change
+@testutils.run_testdir(__file__)
+def test_01_section_cache():
+    # Each way of changing *PlotColor* after processing "plot" options
+    mutations = (
+        lambda o: o.__setitem__("PlotColor", "b"),
+        lambda o: o.set_option("PlotColor", "b"),
+        lambda o: o.update(PlotColor="b"),
+        lambda o: o.__ior__({"PlotColor": "b"}),
+        lambda o: o.setdefault("PlotColor", "b"),
+        lambda o: o.__delitem__("PlotColor"),
+        lambda o: o.pop("PlotColor"),
+        lambda o: o.clear(),
+    )
+    # Loop through cases
+    for f in mutations:
+        # Options with saved "plot" section
+        opts = MPLOpts(PlotColor="r")
+        assert opts.plot_options()["color"] == "r"
+        # Change options
+        f(opts)
+        # Compare to options processed from scratch
+        assert opts.plot_options() == MPLOpts(**opts).plot_options()
+    # Check that changing result does not change saved section
+    opts = MPLOpts(PlotColor="r")
+    opts.plot_options()["color"] = "g"
+    assert opts.plot_options()["color"] == "r"
@@ -0,0 +1,46 @@
+
+# Standard library
+import sys
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.tnakit.plot_mpl import mpl
+
+
+# Test reuse of processed plot() options
+@testutils.run_testdir(__file__)
+def test_01_cached_options():
+    # Options processed from scratch
+    kw0 = mpl.MPLOpts(_section="plot", PlotColor="r").plot_options()
+    # Processed options (second call reuses the first)
+    kw1 = mpl._cached_options("plot", {"PlotColor": "r"})
+    kw2 = mpl._cached_options("plot", {"PlotColor": "r"})
+    assert kw1 == kw0
+    assert kw2 == kw0
+    # Changing output (including lists) does not change saved result
+    for v in kw1.values():
+        if isinstance(v, (list, dict)):
+            v.clear()
+    kw1["color"] = "g"
+    assert mpl._cached_options("plot", {"PlotColor": "r"}) == kw0
+
+
+# Test that bad keywords are reported on every call
+@testutils.run_testdir(__file__)
+def test_02_cached_options_warn():
+    # Capture warnings
+    stderr = sys.stderr
+    msgs = []
+    sys.stderr = type(
+        "Cap", (object,),
+        {"write": lambda self, m: msgs.append(m), "flush": lambda self: 0})()
+    try:
+        # Misspelled option, twice
+        mpl._cached_options("plot", {"PlotColr": "r"})
+        mpl._cached_options("plot", {"PlotColr": "r"})
+    finally:
+        sys.stderr = stderr
+    # One warning per call
+    assert len([m for m in msgs if "PlotColr" in m]) == 2
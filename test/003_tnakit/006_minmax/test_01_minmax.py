@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tnakit.plot_mpl as pmpl
+
+
+# Test conversion of min/max to error bar widths
+@testutils.run_testdir(__file__)
+def test_01_minmax_to_errorbar():
+    # Simple data
+    yv = np.arange(5.0)
+    # Convert, including one list bound
+    yerr = pmpl.minmax_to_errorbar(yv, yv - 1.0, [1.0, 2.0, 5.0, 4.0, 6.0])
+    # Check results
+    assert yerr.shape == (2, 5)
+    assert np.allclose(yerr[0], 1.0)
+    assert np.allclose(yerr[1], [1.0, 1.0, 3.0, 1.0, 2.0])
+
+
+# Test min/max plot with error bars
+@testutils.run_testdir(__file__)
+def test_02_minmax_errorbar():
+    # Simple data
+    xv = np.arange(5.0)
+    yv = xv**2
+    # Plot with ErrorBar min/max
+    h = pmpl.plot(
+        xv, yv, ymin=yv - 1.0, ymax=yv + 2.0, MinMaxPlotType="ErrorBar")
+    # Get vertical bar segments
+    segs = h.minmax[2][0].get_segments()
+    h.close()
+    # Check extents of each bar
+    for i, seg in enumerate(segs):
+        assert np.allclose(seg[:, 1], [yv[i] - 1.0, yv[i] + 2.0])
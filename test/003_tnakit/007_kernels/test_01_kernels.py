@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Third-party modules
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tnakit.plot_mpl as pmpl
+from cape.tnakit.plot_mpl import kernels
+
+
+# Test min/max and error bar kernels directly
+@testutils.run_testdir(__file__)
+def test_01_errorbar_kernels():
+    # Simple data
+    yv = np.arange(5.0)
+    ymin = yv - 1.0
+    ymax = yv + np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    # Convert min/max to widths
+    yerr = np.zeros((2, 5))
+    kernels.minmax_to_errorbar(yv, ymin, ymax, yerr)
+    assert np.allclose(yerr[0], 1.0)
+    assert np.allclose(yerr[1], [1.0, 2.0, 3.0, 4.0, 5.0])
+    # Convert back
+    vmin = np.zeros(5)
+    vmax = np.zeros(5)
+    kernels.errorbar_to_minmax(yv, yerr, vmin, vmax)
+    assert np.allclose(vmin, ymin)
+    assert np.allclose(vmax, ymax)
+
+
+# Test statistics kernels directly
+@testutils.run_testdir(__file__)
+def test_02_stats_kernels():
+    # Values with non-finite entries
+    v = np.array([1.0, np.nan, 3.0, np.inf, 5.0, -1.0])
+    # Finite values and stats
+    vout = np.zeros(v.size)
+    n, vmu, vstd = kernels.finite_mean_std(v, vout)
+    assert n == 4
+    assert np.allclose(vout[:n], [1.0, 3.0, 5.0, -1.0])
+    assert np.isclose(vmu, 2.0)
+    assert np.isclose(vstd, np.std(vout[:n]))
+    # Filter by distance from mean
+    n = kernels.filter_dev(vout[:4], 2.0, 1.5, v)
+    assert n == 2
+    assert np.allclose(v[:n], [1.0, 3.0])
+    # Min and max, skipping NaN
+    vmin, vmax = kernels.minmax(np.array([np.nan, 2.0, -3.0, 7.0]))
+    assert (vmin, vmax) == (-3.0, 7.0)
+    # Gaussian PDF
+    xv = np.linspace(-2.0, 2.0, 5)
+    yv = np.zeros(5)
+    kernels.gauss_pdf(xv, 0.0, 1.0, yv)
+    assert np.allclose(yv, np.exp(-0.5*xv**2) / np.sqrt(2*np.pi))
+
+
+# Test kernel selection with matching and broadcast inputs
+@testutils.run_testdir(__file__)
+def test_03_minmax_kernel_shapes():
+    # Save kernel flag
+    qnumba = kernels.numba
+    # Use kernels even if numba is not installed
+    kernels.numba = True
+    try:
+        # Matching shapes use the kernel
+        yv = np.arange(4.0)
+        yerr = pmpl.minmax_to_errorbar(yv, yv - 1.0, yv + 2.0)
+        assert np.allclose(yerr, [[1.0]*4, [2.0]*4])
+        # Broadcast nominal value must not use the kernel
+        yerr = pmpl.minmax_to_errorbar(
+            np.array([1.0]), np.zeros(4), np.arange(4.0) + 3.0)
+        assert np.allclose(yerr, [[1.0]*4, [2.0, 3.0, 4.0, 5.0]])
+        # Scalar width for error bars
+        ymin, ymax = pmpl.errorbar_to_minmax(yv, 0.5)
+        assert np.allclose(ymin, yv - 0.5)
+        assert np.allclose(ymax, yv + 0.5)
+        # Separate widths
+        ymin, ymax = pmpl.errorbar_to_minmax(yv, [yv, 2*yv])
+        assert np.allclose(ymin, 0.0)
+        assert np.allclose(ymax, 3*yv)
+    finally:
+        # Restore flag
+        kernels.numba = qnumba